@@ -0,0 +1,87 @@
+"""
+Concurrent tool-call benchmark.
+
+Registers N tools whose bodies block like a boto3 call (time.sleep with varied
+latencies), then fires them all at once through FastMCP's FunctionTool.run:
+
+* inline   - sync bodies executed on the event loop, the old behaviour
+* executor - the same bodies wrapped by ToolExecutor
+
+With the executor the batch should finish in roughly the time of the slowest
+call. Exits non-zero if it takes more than ``--tolerance`` x the slowest call.
+
+    python -m benchmarks.bench_concurrency --calls 24
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.core.executor import ToolExecutor
+
+
+def make_tool(index: int, latency: float) -> FunctionTool:
+    def describe(*, region: str = "us-east-1"):
+        time.sleep(latency)
+        return {"call": index, "region": region, "latency": latency}
+
+    return FunctionTool(
+        name=f"bench.describe_{index}",
+        description="Blocking describe call",
+        fn=describe,
+        parameters={"type": "object", "properties": {"region": {"type": "string"}}},
+        run_in_thread=False,
+    )
+
+
+async def run_batch(tools, regions):
+    start = time.perf_counter()
+    await asyncio.gather(*(tool.run({"region": region}) for tool, region in zip(tools, regions)))
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=24)
+    parser.add_argument("--min-latency", type=float, default=0.05)
+    parser.add_argument("--max-latency", type=float, default=0.4)
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    latencies = [rng.uniform(args.min_latency, args.max_latency) for _ in range(args.calls)]
+    regions = [rng.choice(["us-east-1", "eu-west-1", "ap-south-1"]) for _ in range(args.calls)]
+    slowest = max(latencies)
+
+    inline_tools = [make_tool(i, lat) for i, lat in enumerate(latencies)]
+
+    # Caps are sized so the whole batch fits; lower them to watch queueing
+    executor = ToolExecutor(
+        max_workers=args.calls,
+        default_service_limit=args.calls,
+        default_region_limit=args.calls,
+    )
+    wrapped_tools = [executor.wrap_tool(tool, "bench") for tool in inline_tools]
+
+    inline = asyncio.run(run_batch(inline_tools, regions))
+    concurrent = asyncio.run(run_batch(wrapped_tools, regions))
+    executor.shutdown()
+
+    print(f"calls:            {args.calls}")
+    print(f"slowest call:     {slowest:.3f}s")
+    print(f"sum of latencies: {sum(latencies):.3f}s")
+    print(f"inline:           {inline:.3f}s")
+    print(f"executor:         {concurrent:.3f}s ({concurrent / slowest:.2f}x slowest)")
+
+    if concurrent > slowest * args.tolerance:
+        print(f"FAIL: executor batch exceeded {args.tolerance}x the slowest call", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
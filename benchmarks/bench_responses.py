@@ -0,0 +1,102 @@
+"""
+Response serialization benchmark.
+
+Builds a describe_instances-shaped payload (datetimes, nested lists, tags) and
+times turning it into an MCP tool result two ways:
+
+* generic - the raw dict handed to FastMCP, which serializes it through
+  pydantic for both the text and the structured content
+* encoder - mcp_server.utils.responses.render, then FastMCP's passthrough
+
+    python -m benchmarks.bench_responses --instances 10000
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import sys
+import time
+
+from fastmcp.tools import FunctionTool
+
+from mcp_server.utils import responses
+
+
+def make_payload(count: int):
+    launched = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    instances = []
+    for i in range(count):
+        instances.append({
+            "InstanceId": f"i-{i:017x}",
+            "InstanceType": "m5.large",
+            "State": {"Code": 16, "Name": "running"},
+            "LaunchTime": launched + datetime.timedelta(minutes=i),
+            "PrivateIpAddress": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "Placement": {"AvailabilityZone": "us-east-1a", "Tenancy": "default"},
+            "BlockDeviceMappings": [{
+                "DeviceName": "/dev/xvda",
+                "Ebs": {
+                    "VolumeId": f"vol-{i:017x}",
+                    "AttachTime": launched,
+                    "DeleteOnTermination": True,
+                    "Status": "attached",
+                },
+            }],
+            "SecurityGroups": [{"GroupId": "sg-0123456789abcdef0", "GroupName": "default"}],
+            "Tags": [{"Key": "Name", "Value": f"web-{i}"}, {"Key": "env", "Value": "prod"}],
+        })
+    return {
+        "region": "us-east-1",
+        "instances": instances,
+        "next_token": None,
+        "ResponseMetadata": {"RequestId": "bench", "HTTPStatusCode": 200},
+    }
+
+
+def make_tool(payload, render=None) -> FunctionTool:
+    def describe():
+        return render(payload) if render else payload
+
+    return FunctionTool(
+        name="bench.describe_instances",
+        description="Return a fixed payload",
+        fn=describe,
+        parameters={"type": "object", "properties": {}},
+    )
+
+
+async def time_tool(tool: FunctionTool, repeat: int):
+    # One untimed call first so imports and schema setup are not measured
+    result = await tool.run({})
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await tool.run({})
+        timings.append(time.perf_counter() - start)
+    return timings, len(result.content[0].text)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    payload = make_payload(args.instances)
+    backend = "orjson" if responses.orjson is not None else "json"
+
+    generic, generic_size = asyncio.run(time_tool(make_tool(payload), args.repeat))
+    encoded, encoded_size = asyncio.run(time_tool(make_tool(payload, responses.render), args.repeat))
+
+    generic_ms = statistics.median(generic) * 1000
+    encoded_ms = statistics.median(encoded) * 1000
+    print(f"payload: {args.instances} instances, encoder backend: {backend}")
+    print(f"generic: {generic_ms:8.1f} ms  ({generic_size / 1024:.0f} KiB)")
+    print(f"encoder: {encoded_ms:8.1f} ms  ({encoded_size / 1024:.0f} KiB)")
+    print(f"speedup: {generic_ms / encoded_ms:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Server start-up benchmark.
+
+Imports ``server`` (which registers every tool) in a fresh interpreter under
+``python -X importtime`` and compares it with importing FastMCP alone. The
+modules only the server run loads are what this package adds to start-up.
+Fails when:
+
+* their import time exceeds ``--budget-ms`` (best of ``--runs``), or
+* a module that should load lazily (boto3, botocore, numpy) is imported at
+  start-up, which usually means the tool manifest is stale.
+
+    python -m benchmarks.bench_startup --budget-ms 100
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_IMPORT = "fastmcp.server.server"
+LAZY_MODULES = ("boto3", "botocore", "numpy")
+
+
+def import_profile(statement: str) -> Dict[str, int]:
+    """Return {module: self_us} for one cold import."""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+    modules: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def added_import_ms(runs: int) -> Tuple[float, Dict[str, int]]:
+    """
+    Import time of every module ``import server`` loads on top of FastMCP,
+    summed from self times (which include module-level code such as loading
+    the manifest). Best of ``runs``, since noise only ever adds time.
+    """
+    best = None
+    modules: Dict[str, int] = {}
+    for _ in range(runs):
+        baseline = import_profile(f"import {BASELINE_IMPORT}")
+        modules = import_profile("import server")
+        added = sum(us for name, us in modules.items() if name not in baseline) / 1000
+        best = added if best is None else min(best, added)
+    return best, modules
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    added_ms, modules = added_import_ms(args.runs)
+    print(f"start-up import time on top of FastMCP: {added_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        print(f"FAIL: imported at start-up: {', '.join(eager)} (is the tool manifest stale?)")
+        failed = True
+    if added_ms > args.budget_ms:
+        print("FAIL: start-up import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
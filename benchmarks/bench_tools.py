@@ -0,0 +1,356 @@
+"""
+Per-tool benchmark against a large synthetic account.
+
+Builds an in-process EC2 stand-in (benchmarks/fake_aws.py) seeded with a large
+account, installs it on the pooled clients, and runs every tool returned by
+``ToolRegistry.load_all_tools()`` through the same executor and response
+encoder the server uses. For each tool it records:
+
+* latency (median and worst of ``--repeat`` runs), split into ``aws_ms`` spent
+  inside the stand-in and ``own_ms`` spent in the server itself
+* peak Python memory allocated during one run (tracemalloc)
+* response size in bytes and the number of AWS calls made
+
+Results are written to ``--output``. With ``--baseline`` they are compared
+against a previous run and the script fails when a tool's own time, peak
+memory or response size grows past the baseline's thresholds.
+
+    python -m benchmarks.bench_tools --scale 0.1                  # quick run
+    python -m benchmarks.bench_tools --baseline benchmarks/baselines/tools.json
+    python -m benchmarks.bench_tools --update-baseline benchmarks/baselines/tools.json
+"""
+
+import argparse
+import asyncio
+import atexit
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# The stand-in answers before anything is signed, but botocore still wants
+# credentials to exist
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+from benchmarks.fake_aws import ACCOUNT_ID, FakeAWS, SyntheticAccount, write_pricing_index  # noqa: E402
+from mcp_server.aws.pool import pool  # noqa: E402
+from mcp_server.aws.pricing_index import pricing_index  # noqa: E402
+from mcp_server.core.cache import inventory_cache  # noqa: E402
+from mcp_server.core.registry import ToolRegistry  # noqa: E402
+
+REGION = "us-east-1"
+OTHER_REGION = "us-west-2"
+
+DEFAULT_THRESHOLDS = {
+    # A tool regresses when a value exceeds baseline * ratio + slack
+    "own_ms": {"ratio": 1.5, "slack": 5.0},
+    "peak_kib": {"ratio": 1.5, "slack": 256.0},
+    "response_bytes": {"ratio": 1.25, "slack": 512.0},
+}
+
+
+def tool_arguments(account: SyntheticAccount, operation_id: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Arguments for every tool, pointing at resources that exist in ``account``."""
+    instance = account.instances[0]
+    running = [i["InstanceId"] for i in account.instances if i["State"]["Name"] == "running"]
+    volume = account.volumes[0]
+    snapshot = account.snapshots[1]
+    image = next(i for i in account.images if i["OwnerId"] == ACCOUNT_ID)
+    group = account.security_groups[len(account.vpcs)]
+    vpc = account.vpcs[1]
+    subnet = account.subnets[0]
+    spot = account.spot_requests[0]
+    template = account.launch_templates[0]
+    zone = account.zones[0]
+    rules = [{"protocol": "tcp", "from_port": 443, "to_port": 443, "cidr": "10.0.0.0/8"}]
+    launch = {"ImageId": image["ImageId"], "InstanceType": "t3.micro", "SubnetId": subnet["SubnetId"], "region": REGION}
+
+    return {
+        # ec2 inventory
+        "ec2.list_ec2_instances": {"region": REGION, "max_results": 1000},
+        "ec2.get_instance_details": {"instance_id": instance["InstanceId"], "region": REGION},
+        "ec2.get_instance_running_details": {"instance_id": instance["InstanceId"], "region": REGION},
+        "ec2.list_running_instances": {"region": REGION, "max_results": 1000},
+        "ec2.list_instances_by_tag": {"tag_key": "team", "tag_value": "payments", "region": REGION, "max_results": 1000},
+        "ec2.list_spot_requests": {"region": REGION, "max_results": 1000},
+        "ec2.get_spot_request_details": {"spot_request_id": spot["SpotInstanceRequestId"], "region": REGION},
+        "ec2.cancel_spot_request": {"spot_request_id": spot["SpotInstanceRequestId"], "region": REGION},
+        # ec2 lifecycle, batched
+        "ec2.start_instance": {"instance_ids": running[:500], "region": REGION},
+        "ec2.stop_instance": {"instance_ids": running[:500], "region": REGION},
+        "ec2.reboot_instance": {"instance_ids": running[:500], "region": REGION},
+        "ec2.hard_reboot_instance": {"instance_ids": running[:500], "region": REGION},
+        "ec2.terminate_instance": {"instance_ids": running[:500], "region": REGION},
+        # ec2 creation
+        "ec2.create_instance": {**launch, "MinCount": 1, "MaxCount": 1},
+        "ec2.create_instance_minimal": launch,
+        "ec2.create_spot_instance": launch,
+        "ec2.generate_instance_ssh_instruction": {"instance_id": running[0], "region": REGION},
+        # key pairs and security groups
+        "ec2.create_keypair": {"key_name": "bench-key", "region": REGION},
+        "ec2.delete_keypair": {"key_name": "key-1", "region": REGION},
+        "ec2.list_keypairs": {"region": REGION},
+        "ec2.create_security_group": {"group_name": "bench", "description": "benchmark", "vpc_id": vpc["VpcId"], "inbound_rules": rules, "region": REGION},
+        "ec2.delete_security_group": {"group_id": group["GroupId"], "region": REGION},
+        "ec2.authorize_security_group_rules": {"group_id": group["GroupId"], "rules": rules, "region": REGION},
+        "ec2.revoke_security_group_rules": {"group_id": group["GroupId"], "rules": rules, "region": REGION},
+        "ec2.describe_security_group": {"group_id": group["GroupId"], "region": REGION},
+        "ec2.list_security_groups": {"region": REGION, "max_results": 1000},
+        "ec2.find_security_group_exposure": {"port": 22, "cidr": "0.0.0.0/0", "region": REGION},
+        "ec2.analyze_security_group_rules": {"region": REGION},
+        # launch templates
+        "ec2.create_launch_template": {"ImageId": image["ImageId"], "InstanceType": "t3.micro", "LaunchTemplateName": "bench-template", "region": REGION},
+        "ec2.create_launch_template_version": {"LaunchTemplateName": template["LaunchTemplateName"], "InstanceType": "t3.small", "region": REGION},
+        "ec2.describe_launch_template": {"LaunchTemplateName": template["LaunchTemplateName"], "region": REGION},
+        "ec2.delete_launch_template": {"LaunchTemplateName": template["LaunchTemplateName"], "region": REGION},
+        "ec2.list_launch_templates": {"region": REGION},
+        "ec2.launch_from_template": {"LaunchTemplateName": template["LaunchTemplateName"], "region": REGION},
+        # AMIs, metadata, pricing
+        "aws.create_ami": {"instance_id": running[0], "name": "bench-ami", "region": REGION},
+        "aws.describe_images": {"owners": ["self"], "region": REGION, "max_results": 1000},
+        "aws.deregister_ami": {"image_id": image["ImageId"], "region": REGION},
+        "ec2.resolve_latest_ami": {"name_pattern": "amzn2-ami-hvm-2.0.*-x86_64-gp2", "owner": "amazon", "region": REGION},
+        "aws.get_user_data": {"instance_id": instance["InstanceId"], "region": REGION},
+        "aws.describe_metadata_options": {"instance_id": instance["InstanceId"], "region": REGION},
+        "aws.modify_metadata_options": {"instance_id": instance["InstanceId"], "http_tokens": "required", "region": REGION},
+        "aws.get_ondemand_price": {"instance_type": "m5.large", "region": REGION},
+        "aws.get_spot_price_history": {"instance_type": "m5.large", "region": REGION},
+        "aws.estimate_instance_cost": {"instance_type": "m5.large", "region": REGION},
+        "ec2.estimate_fleet_cost": {"filters": {"region": REGION, "states": ["running", "stopped"]}, "group_by_tag": "team"},
+        "ec2.scan_spot_prices": {
+            "instance_types": ["m5.large", "m6i.large", "c5.large", "r5.large"],
+            "regions": [REGION, OTHER_REGION],
+        },
+        # ebs
+        "ebs.attach_volume": {"VolumeId": volume["VolumeId"], "InstanceId": instance["InstanceId"], "Device": "/dev/xvdf", "region": REGION},
+        "ebs.detach_volume": {"VolumeId": volume["VolumeId"], "InstanceId": instance["InstanceId"], "region": REGION},
+        "ebs.create_snapshot": {"VolumeId": volume["VolumeId"], "Description": "benchmark", "region": REGION},
+        "ebs.list_snapshots": {"OwnerIds": ["self"], "region": REGION, "max_results": 1000},
+        "ebs.describe_snapshot": {"SnapshotId": snapshot["SnapshotId"], "region": REGION},
+        "ebs.get_snapshot_progress": {"SnapshotIds": [s["SnapshotId"] for s in account.snapshots[:200]], "region": REGION},
+        "ebs.delete_snapshot": {"SnapshotId": snapshot["SnapshotId"], "region": REGION},
+        "ebs.copy_snapshot": {"SourceRegion": OTHER_REGION, "SourceSnapshotId": snapshot["SnapshotId"], "region": REGION},
+        "ebs.restore_volume_from_snapshot": {"SnapshotId": snapshot["SnapshotId"], "AvailabilityZone": zone, "region": REGION},
+        "ebs.manage_fast_snapshot_restore": {"SnapshotId": snapshot["SnapshotId"], "AvailabilityZones": [zone], "State": "enable", "region": REGION},
+        "ebs.create_volume": {"AvailabilityZone": zone, "Size": 100, "VolumeType": "gp3", "region": REGION},
+        "ebs.modify_volume": {"VolumeId": volume["VolumeId"], "Size": 200, "region": REGION},
+        "ebs.delete_volume": {"VolumeId": volume["VolumeId"], "region": REGION},
+        "ebs.describe_volumes": {"region": REGION, "max_results": 1000},
+        "ebs.estimate_volume_cost": {"Size": 500, "VolumeType": "gp3", "Iops": 6000, "SnapshotSize": 200, "CopyToRegion": OTHER_REGION, "region": REGION},
+        # vpc
+        "vpc.list_vpcs": {"region": REGION},
+        "vpc.get_default_vpc": {"region": REGION},
+        "vpc.describe_vpc": {"vpc_id": vpc["VpcId"], "region": REGION},
+        "vpc.list_subnets": {"region": REGION, "max_results": 1000},
+        "vpc.get_default_subnets": {"region": REGION},
+        "vpc.describe_subnet": {"subnet_id": subnet["SubnetId"], "region": REGION},
+        "vpc.topology_neighbors": {"resource_id": instance["InstanceId"], "region": REGION},
+        "vpc.topology_members": {"container_id": subnet["SubnetId"], "region": REGION},
+        "vpc.subnet_utilization": {"region": REGION},
+        # inventory
+        "inventory.query_tags": {"query": "team=payments AND env!=prod", "region": REGION},
+        "inventory.changes": {"region": REGION},
+        # ops and server
+        "ops.status": {"operation_id": operation_id or "op-missing"},
+        "ops.wait": {"operation_id": operation_id or "op-missing", "timeout_seconds": 0},
+        "ops.list": {},
+        "server.stats": {},
+    }
+
+
+def install(fake: FakeAWS):
+    """
+    Attach the stand-in to every pooled client the tools will ask for and
+    point the pricing index at a seeded temporary one.
+    """
+    for service, region in (("ec2", REGION), ("ec2", OTHER_REGION), ("pricing", "us-east-1")):
+        fake.install(pool.get_client(service, region))
+
+    directory = tempfile.mkdtemp(prefix="aws-mcp-bench-")
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    pricing_index.path = write_pricing_index(os.path.join(directory, "pricing.sqlite3"), [REGION, OTHER_REGION])
+
+
+def _response_size(result: Any) -> int:
+    return sum(len(getattr(block, "text", "") or "") for block in getattr(result, "content", []) or [])
+
+
+def _is_error(result: Any) -> Optional[str]:
+    structured = getattr(result, "structured_content", None)
+    if not isinstance(structured, dict):
+        return None
+    if structured.get("error"):
+        return str(structured["error"])[:200]
+    if structured.get("status") == "error":
+        # Batched tools report per-item errors under "results"
+        first = next((r for r in structured.get("results", []) if r.get("error")), {})
+        return str(first.get("error", "all items failed"))[:200]
+    return None
+
+
+async def _call(tool, arguments):
+    try:
+        return await tool.run(arguments), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"[:200]
+
+
+async def measure(tool, arguments: Dict[str, Any], fake: FakeAWS, repeat: int) -> Dict[str, Any]:
+    latencies, aws_times = [], []
+    result, error = None, None
+    calls_before = sum(fake.calls.values())
+    for _ in range(repeat):
+        inventory_cache.clear()
+        aws_before = fake.seconds
+        start = time.perf_counter()
+        result, error = await _call(tool, arguments)
+        latencies.append(time.perf_counter() - start)
+        aws_times.append(fake.seconds - aws_before)
+    aws_calls = (sum(fake.calls.values()) - calls_before) / repeat
+
+    inventory_cache.clear()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    await _call(tool, arguments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    own = [total - aws for total, aws in zip(latencies, aws_times)]
+    return {
+        "latency_ms": round(statistics.median(latencies) * 1000, 2),
+        "latency_max_ms": round(max(latencies) * 1000, 2),
+        "aws_ms": round(statistics.median(aws_times) * 1000, 2),
+        "own_ms": round(max(0.0, statistics.median(own)) * 1000, 2),
+        "peak_kib": round((peak - base) / 1024, 1),
+        "response_bytes": _response_size(result),
+        "aws_calls": round(aws_calls, 1),
+        "error": error or _is_error(result),
+    }
+
+
+async def run_all(tools, account: SyntheticAccount, fake: FakeAWS, repeat: int, only: Optional[str]) -> Dict[str, Any]:
+    by_name = {tool.name: tool for tool in tools}
+
+    # ops.status/ops.wait need a real operation to look at
+    operation_id = None
+    if "ebs.create_snapshot" in by_name:
+        created, _ = await _call(by_name["ebs.create_snapshot"], {"VolumeId": account.volumes[0]["VolumeId"], "region": REGION})
+        operation_id = (getattr(created, "structured_content", None) or {}).get("operation_id")
+
+    arguments = tool_arguments(account, operation_id)
+    results = {}
+    for name, tool in sorted(by_name.items()):
+        if only and only not in name:
+            continue
+        if name not in arguments:
+            results[name] = {"error": "no benchmark arguments for this tool"}
+            print(f"{name:42s} SKIPPED (no arguments)")
+            continue
+        stats = await measure(tool, arguments[name], fake, repeat)
+        results[name] = stats
+        flag = f"  ERROR {stats['error']}" if stats["error"] else ""
+        print(
+            f"{name:42s} {stats['latency_ms']:9.2f} ms (own {stats['own_ms']:8.2f}) "
+            f"{stats['peak_kib']:10.1f} KiB {stats['response_bytes']:10d} B {stats['aws_calls']:6.1f} calls{flag}"
+        )
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> list:
+    thresholds = baseline.get("thresholds", DEFAULT_THRESHOLDS)
+    failures = []
+    for name, base in baseline.get("tools", {}).items():
+        current = results.get(name)
+        if current is None or current.get("error") or base.get("error"):
+            continue
+        for metric, limit in thresholds.items():
+            allowed = base[metric] * limit["ratio"] + limit["slack"]
+            if current[metric] > allowed:
+                failures.append(f"{name}: {metric} {current[metric]} > {allowed:.1f} (baseline {base[metric]})")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=10_000)
+    parser.add_argument("--snapshots", type=int, default=50_000)
+    parser.add_argument("--security-groups", type=int, default=5_000)
+    parser.add_argument("--images", type=int, default=100_000)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every resource count")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="Only tools whose name contains this string")
+    parser.add_argument("--output", default="benchmarks/results/tools.json")
+    parser.add_argument("--baseline", help="Fail if results regress against this file")
+    parser.add_argument(
+        "--update-baseline",
+        metavar="PATH",
+        help="Write results as the new baseline; with --only, update just the measured tools' rows",
+    )
+    args = parser.parse_args(argv)
+
+    scale = {
+        "instances": int(args.instances * args.scale),
+        "snapshots": int(args.snapshots * args.scale),
+        "security_groups": int(args.security_groups * args.scale),
+        "images": int(args.images * args.scale),
+    }
+    start = time.perf_counter()
+    account = SyntheticAccount(region=REGION, **scale)
+    print(f"synthetic account {scale} built in {time.perf_counter() - start:.1f}s")
+
+    fake = FakeAWS(account)
+    install(fake)
+    tools = ToolRegistry.load_all_tools()
+    results = asyncio.run(run_all(tools, account, fake, args.repeat, args.only))
+
+    report = {
+        "meta": {
+            "scale": scale,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "thresholds": DEFAULT_THRESHOLDS,
+        "tools": results,
+    }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"results written to {output}")
+
+    if args.update_baseline:
+        path = Path(args.update_baseline)
+        if args.only and path.exists():
+            # Keep every other tool's row, and the meta it was recorded with
+            merged = json.loads(path.read_text())
+            merged["tools"].update(results)
+            report = merged
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"baseline updated: {path} ({len(results)} tools)")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline.get("meta", {}).get("scale") != scale:
+            print("WARNING: baseline was recorded at a different scale", file=sys.stderr)
+        failures = compare(results, baseline)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
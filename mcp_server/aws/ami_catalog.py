@@ -0,0 +1,282 @@
+"""
+Locally indexed AMI catalog.
+
+Picking an ImageId means searching the public catalog: an unqualified
+``describe_images`` walks hundreds of thousands of images and regularly times
+out. The catalog instead loads every available image of one owner in one
+region once, keeps a compact record per image and indexes it by name (sorted,
+for prefix ranges) and by architecture, virtualization type and root device
+type. Lookups are then local and take milliseconds.
+
+A catalog older than AWS_MCP_AMI_CATALOG_TTL is refreshed incrementally: only
+images created on or after the newest creation date already held are fetched
+(``creation-date`` filter, one wildcard value per day). Deregistered public
+images are only noticed by a full reload, done once a day. Images this server
+creates or deregisters update the ``self`` catalog through inventory cache
+invalidations.
+"""
+
+import bisect
+import fnmatch
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_FILTER_VALUES, MAX_PAGE_SIZE, paginate
+from mcp_server.core.cache import IndexState, RegionalIndex
+from mcp_server.core.config import Settings
+
+# Well-known publishers, resolved to the account IDs that own their images
+OWNER_ALIASES = {
+    "canonical": "099720109477",
+    "debian": "136693071363",
+    "redhat": "309956199498",
+    "suse": "013907871322",
+}
+
+# Fields kept per image; everything else in a describe item is dropped
+RECORD_FIELDS = (
+    "ImageId", "Name", "Description", "CreationDate", "OwnerId", "ImageOwnerAlias",
+    "Architecture", "VirtualizationType", "RootDeviceType", "PlatformDetails",
+    "BootMode", "DeprecationTime",
+)
+
+INDEXED_ATTRIBUTES = ("Architecture", "VirtualizationType", "RootDeviceType")
+
+# A full reload catches deregistered images; between reloads only new ones are fetched
+FULL_REFRESH_SECONDS = 24 * 3600
+
+_AVAILABLE = {"Name": "state", "Values": ["available"]}
+
+# Name-prefix ranges up to this size are scanned in full (exact match counts);
+# broader patterns walk the catalog newest first and stop early
+PREFIX_SCAN_LIMIT = 5000
+
+
+def resolve_owner(owner: str) -> str:
+    return OWNER_ALIASES.get(owner.lower(), owner)
+
+
+def _literal_prefix(pattern: str) -> str:
+    for i, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:i]
+    return pattern
+
+
+class _OwnerCatalog(IndexState):
+    """One owner's images in one region; ``pending`` holds deregistered IDs."""
+
+    def __init__(self):
+        super().__init__()
+        self.images: Dict[str, Dict[str, Any]] = {}
+        self.by_attribute: Dict[Tuple[str, str], Set[str]] = {}
+        # (Name, ImageId) sorted for prefix ranges; (CreationDate, ImageId) for newest-first walks
+        self.names: List[Tuple[str, str]] = []
+        self.dates: List[Tuple[str, str]] = []
+        self.newest = ""
+        self.refreshed_at = 0.0
+
+    @staticmethod
+    def _record(image: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: image[field] for field in RECORD_FIELDS if field in image}
+
+    def _index(self, record: Dict[str, Any]):
+        self.images[record["ImageId"]] = record
+        for attribute in INDEXED_ATTRIBUTES:
+            self.by_attribute.setdefault((attribute, record.get(attribute)), set()).add(record["ImageId"])
+        self.newest = max(self.newest, record.get("CreationDate", ""))
+
+    def add(self, image: Dict[str, Any]):
+        record = self._record(image)
+        self.remove(record["ImageId"])
+        self._index(record)
+        bisect.insort(self.names, (record.get("Name") or "", record["ImageId"]))
+        bisect.insort(self.dates, (record.get("CreationDate", ""), record["ImageId"]))
+
+    def remove(self, image_id: str):
+        record = self.images.pop(image_id, None)
+        if record is None:
+            return
+        for attribute in INDEXED_ATTRIBUTES:
+            self.by_attribute.get((attribute, record.get(attribute)), set()).discard(image_id)
+        for entries, entry in (
+            (self.names, (record.get("Name") or "", image_id)),
+            (self.dates, (record.get("CreationDate", ""), image_id)),
+        ):
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+
+    def replace(self, images: List[Dict[str, Any]]):
+        """Swap in a full load, sorting once instead of per insert."""
+        self.images.clear()
+        self.by_attribute.clear()
+        self.newest = ""
+        for image in images:
+            self._index(self._record(image))
+        self.names = sorted((record.get("Name") or "", image_id) for image_id, record in self.images.items())
+        self.dates = sorted((record.get("CreationDate", ""), image_id) for image_id, record in self.images.items())
+
+    def find(
+        self, name_pattern: str, attributes: Dict[str, Optional[str]], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Up to ``limit`` images matching the name glob and attributes, newest
+        first, and the total number of matches when it was counted.
+        """
+        prefix = _literal_prefix(name_pattern)
+        matches_name = re.compile(fnmatch.translate(name_pattern)).match
+        allowed = [self.by_attribute.get((a, v), set()) for a, v in attributes.items() if v]
+
+        def wanted(name: str, image_id: str) -> bool:
+            for ids in allowed:
+                if image_id not in ids:
+                    return False
+            return matches_name(name) is not None
+
+        lo = bisect.bisect_left(self.names, (prefix, ""))
+        hi = bisect.bisect_left(self.names, (prefix + "\uffff", "")) if prefix else len(self.names)
+
+        if hi - lo <= PREFIX_SCAN_LIMIT:
+            # Selective prefix: check the whole range and count every match
+            found = [self.images[i] for name, i in self.names[lo:hi] if wanted(name, i)]
+            found.sort(key=lambda image: image.get("CreationDate", ""), reverse=True)
+            return found[:limit], len(found)
+
+        # Broad prefix: walk newest first and stop once enough are found
+        found = []
+        for _, image_id in reversed(self.dates):
+            record = self.images[image_id]
+            name = record.get("Name") or ""
+            if name.startswith(prefix) and wanted(name, image_id):
+                found.append(record)
+                if len(found) == limit:
+                    break
+        return found, None
+
+
+class AmiCatalog(RegionalIndex):
+    resource_types = frozenset({"images"})
+    stats_label = "catalogs"
+
+    def __init__(self, ttl: float = Settings.AMI_CATALOG_TTL):
+        super().__init__(ttl)
+
+    def _new_entry(self, region: str, owner: str) -> _OwnerCatalog:
+        return _OwnerCatalog()
+
+    def find(
+        self,
+        region: str,
+        owner: str,
+        name_pattern: str,
+        limit: int = 1,
+        refresh: bool = False,
+        **attributes: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], Dict[str, Any]]:
+        """
+        (up to ``limit`` matching images newest first, total matches or None
+        when not counted, catalog info) for one owner in one region.
+        """
+        owner = resolve_owner(owner)
+        catalog = self._entry(region, owner)
+
+        # The load lock single-flights loads: concurrent lookups wait for one
+        # refresh instead of each sending their own
+        with catalog.load_lock:
+            stale, removals = catalog.take()
+            try:
+                refreshed = self._refresh(catalog, region, owner, force=refresh, stale=stale)
+            except Exception:
+                catalog.restore(stale, removals)
+                raise
+            # Deregistered images are dropped after the load, which may still have listed them
+            for image_id in removals:
+                catalog.remove(image_id)
+            matches, total = catalog.find(name_pattern, attributes, limit)
+            info = {
+                "owner_id": owner,
+                "images": len(catalog.images),
+                "age_seconds": round(time.monotonic() - catalog.refreshed_at, 1),
+                "refreshed": refreshed,
+            }
+        return matches, total, info
+
+    def _refresh(self, catalog: _OwnerCatalog, region: str, owner: str, force: bool, stale: bool) -> Optional[str]:
+        now = time.monotonic()
+        if force or catalog.expired(FULL_REFRESH_SECONDS):
+            self._load_full(catalog, region, owner)
+            return "full"
+        if stale or now - catalog.refreshed_at > self.ttl:
+            if not self._load_since(catalog, region, owner):
+                self._load_full(catalog, region, owner)
+                return "full"
+            return "incremental"
+        return None
+
+    def _load_full(self, catalog: _OwnerCatalog, region: str, owner: str):
+        cursor = paginate(
+            get_ec2_client(region),
+            "describe_images",
+            "Images",
+            max_results=0,
+            page_size=MAX_PAGE_SIZE,
+            Owners=[owner],
+            Filters=[_AVAILABLE],
+        )
+        catalog.replace(list(cursor))
+        catalog.loaded_at = catalog.refreshed_at = time.monotonic()
+        catalog.full_loads += 1
+
+    def _load_since(self, catalog: _OwnerCatalog, region: str, owner: str) -> bool:
+        """Fetch images created since the newest one held; False when a full load is needed."""
+        if not catalog.newest:
+            return False
+        first = datetime.fromisoformat(catalog.newest[:10]).date()
+        today = datetime.now(timezone.utc).date()
+        days = [(first + timedelta(days=n)).isoformat() for n in range((today - first).days + 1)]
+        if len(days) > MAX_FILTER_VALUES:
+            return False
+
+        cursor = paginate(
+            get_ec2_client(region),
+            "describe_images",
+            "Images",
+            max_results=0,
+            page_size=MAX_PAGE_SIZE,
+            Owners=[owner],
+            Filters=[_AVAILABLE, {"Name": "creation-date", "Values": [f"{day}*" for day in days]}],
+        )
+        for image in cursor:
+            catalog.add(image)
+        catalog.refreshed_at = time.monotonic()
+        catalog.incremental_loads += 1
+        return True
+
+    def _invalidate(self, scope: Tuple[str, ...], catalog: _OwnerCatalog, resource_type: str, ids: Optional[List[str]]):
+        # Only the account's own images change through this server. Deregistered
+        # IDs are dropped by the next lookup; created images only become available
+        # later and are picked up by the next incremental refresh
+        if scope == ("self",):
+            catalog.invalidate(ids)
+
+    def _entry_stats(self, region: str, scope: Tuple[str, ...], catalog: _OwnerCatalog, now: float) -> Dict[str, Any]:
+        return {
+            "region": region,
+            "owner_id": scope[0],
+            "images": len(catalog.images),
+            "age_seconds": round(now - catalog.refreshed_at, 1) if catalog.refreshed_at else None,
+            "full_loads": catalog.full_loads,
+            "incremental_loads": catalog.incremental_loads,
+        }
+
+
+# Process-wide catalog shared by every tool
+ami_catalog = AmiCatalog()
+
+
+def ami_catalog_stats() -> Dict[str, Any]:
+    return ami_catalog.stats()
@@ -0,0 +1,162 @@
+"""
+Request coalescing for single-ID describe calls.
+
+Several tools look up one resource by ID (``describe_instances(InstanceIds=
+[one_id])``). An agent firing fifty of them in parallel used to send fifty
+requests. ``describe_one`` instead queues the ID for a short window; the first
+caller of a window then sends one describe call for every ID queued in the same
+(credentials, region, resource kind), up to 1000 IDs per call, and hands each
+caller its own item. A lookup for an ID that is already queued or in flight
+waits for that request instead of sending another.
+
+EC2 rejects the whole call when any ID is unknown or malformed. A batch failing
+that way is split in half until the bad IDs are isolated, so each caller still
+gets exactly the error a lone call would have raised.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pool import pool
+from mcp_server.core.config import Settings
+
+MAX_BATCH_SIZE = 1000
+
+
+def _instances(resp: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    for reservation in resp.get("Reservations", []):
+        for instance in reservation.get("Instances", []):
+            yield instance["InstanceId"], instance
+
+
+def _snapshots(resp: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    for snapshot in resp.get("Snapshots", []):
+        yield snapshot["SnapshotId"], snapshot
+
+
+# kind -> (EC2 operation, ID parameter, item extractor, per-ID error code prefix)
+KINDS: Dict[str, Tuple[str, str, Callable, str]] = {
+    "instance": ("describe_instances", "InstanceIds", _instances, "InvalidInstanceID"),
+    "snapshot": ("describe_snapshots", "SnapshotIds", _snapshots, "InvalidSnapshot"),
+}
+
+
+def coalesced(fn):
+    """
+    Mark a tool whose describe calls go through ``describe_one``. The executor
+    holds neither a service nor a region slot for it: however many run at
+    once, they share one AWS request per window.
+    """
+    fn.coalesced = True
+    return fn
+
+
+class DescribeBatcher:
+    def __init__(self, window: float = Settings.BATCH_WINDOW, max_batch: int = MAX_BATCH_SIZE):
+        self.window = window
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        # Batch currently collecting IDs, per (credentials, region, kind)
+        self._open: Dict[Tuple[str, str, str], Dict[str, Future]] = {}
+        # Every queued or in-flight lookup, for single-flighting
+        self._inflight: Dict[Tuple[Tuple[str, str, str], str], Future] = {}
+        self._lookups = 0
+        self._shared = 0
+        self._batches = 0
+        self._requests = 0
+
+    def describe_one(self, kind: str, region: str, resource_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the describe item for ``resource_id``, or None when AWS returns
+        nothing for it. Raises the ClientError a single-ID call would raise.
+        """
+        group = (pool.credential_key(), region, kind)
+        leader = False
+
+        with self._lock:
+            self._lookups += 1
+            future = self._inflight.get((group, resource_id))
+            if future is not None:
+                self._shared += 1
+            else:
+                future = Future()
+                self._inflight[(group, resource_id)] = future
+                batch = self._open.get(group)
+                if batch is None:
+                    batch = self._open[group] = {}
+                    leader = True
+                batch[resource_id] = future
+                if len(batch) >= self.max_batch:
+                    # Full: later lookups start a new batch
+                    del self._open[group]
+
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                if self._open.get(group) is batch:
+                    del self._open[group]
+            self._dispatch(group, batch)
+
+        return future.result()
+
+    def _dispatch(self, group: Tuple[str, str, str], batch: Dict[str, Future]):
+        _, region, kind = group
+        ids = list(batch)
+        try:
+            outcomes = self._describe(get_ec2_client(region), kind, ids)
+        except Exception as e:
+            outcomes = {resource_id: e for resource_id in ids}
+        finally:
+            with self._lock:
+                self._batches += 1
+                for resource_id in ids:
+                    self._inflight.pop((group, resource_id), None)
+
+        for resource_id, future in batch.items():
+            outcome = outcomes.get(resource_id)
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def _describe(self, ec2, kind: str, ids: List[str]) -> Dict[str, Any]:
+        """{id: item | exception} for ``ids``; IDs AWS omits are left out."""
+        operation, id_param, extract, error_prefix = KINDS[kind]
+        with self._lock:
+            self._requests += 1
+        try:
+            resp = getattr(ec2, operation)(**{id_param: ids})
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code", "")
+            if len(ids) == 1 or not code.startswith(error_prefix):
+                return {resource_id: e for resource_id in ids}
+            middle = len(ids) // 2
+            return {**self._describe(ec2, kind, ids[:middle]), **self._describe(ec2, kind, ids[middle:])}
+        return dict(extract(resp))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "window_seconds": self.window,
+                "lookups": self._lookups,
+                "shared": self._shared,
+                "batches": self._batches,
+                "requests": self._requests,
+            }
+
+
+# Process-wide batcher shared by every tool
+batcher = DescribeBatcher()
+
+
+def describe_one(kind: str, region: str, resource_id: str) -> Optional[Dict[str, Any]]:
+    return batcher.describe_one(kind, region, resource_id)
+
+
+def batcher_stats() -> Dict[str, Any]:
+    return batcher.stats()
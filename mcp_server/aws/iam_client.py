@@ -0,0 +1,8 @@
+from typing import Optional
+
+from mcp_server.aws.pool import get_client
+
+
+def get_iam_client(region: Optional[str] = None, profile: Optional[str] = None):
+    """Return the pooled IAM client for the given region."""
+    return get_client("iam", region, profile)
@@ -0,0 +1,126 @@
+"""
+Cursor-based pagination on top of botocore paginators.
+
+Tools hand out one bounded page per call together with an opaque
+``next_token``. Pages are pulled from AWS lazily while iterating, so only the
+page currently being consumed is held in memory and callers can stop early.
+"""
+
+from typing import Any, Dict, Iterator, Optional
+
+from botocore.paginate import TokenDecoder, TokenEncoder
+
+from mcp_server.core.config import Settings
+
+# Most EC2 describe APIs accept MaxResults between 5 and 1000
+MIN_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 1000
+
+# EC2 accepts at most 200 values per filter
+MAX_FILTER_VALUES = 200
+
+
+def page_size_for(max_results: Optional[int], cap: int = MAX_PAGE_SIZE) -> int:
+    """Pick a service page size that avoids over-fetching for small requests."""
+    if max_results == 0:
+        # Walking everything: fewest round trips
+        return cap
+    return max(MIN_PAGE_SIZE, min(max_results or Settings.DEFAULT_MAX_RESULTS, cap))
+
+
+class PageCursor:
+    """
+    Iterates the items of ``result_key`` across pages of a paginated operation,
+    stopping after ``max_results`` items. ``next_token`` is only meaningful
+    once iteration has finished.
+
+    With ``count_key`` the limit counts the nested ``count_key`` lists instead
+    (describe_instances returns Reservations, each holding several Instances).
+    Iteration then stops before the first outer item that would take the
+    count past ``max_results``; a single outer item larger than the limit is
+    still returned whole so every page makes progress.
+    """
+
+    def __init__(
+        self,
+        client,
+        operation: str,
+        result_key: str,
+        *,
+        max_results: Optional[int] = None,
+        next_token: Optional[str] = None,
+        page_size: Optional[int] = None,
+        count_key: Optional[str] = None,
+        **params: Any,
+    ):
+        config: Dict[str, Any] = {}
+
+        # max_results=0 means "walk everything" for callers that aggregate
+        self._limit = None if max_results == 0 else max_results or Settings.DEFAULT_MAX_RESULTS
+        if self._limit is not None and not count_key:
+            # With count_key the limit is applied while iterating instead
+            config["MaxItems"] = self._limit
+        if page_size:
+            config["PageSize"] = page_size
+        if next_token:
+            config["StartingToken"] = next_token
+
+        # botocore rejects explicit None values, so drop unset parameters
+        params = {k: v for k, v in params.items() if v is not None}
+
+        paginator = client.get_paginator(operation)
+        self._pages = paginator.paginate(PaginationConfig=config, **params)
+        self._result_key = result_key
+        self._count_key = count_key
+        self._starting_token = next_token
+        self._resume_token: Optional[str] = None
+        self._stopped = False
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        yield from self._pages
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._count_key and self._limit is not None:
+            yield from self._counted()
+            return
+        for page in self._pages:
+            yield from page.get(self._result_key, [])
+
+    def _counted(self) -> Iterator[Any]:
+        # The service token the current page was requested with, and how many
+        # of its outer items botocore already skipped for a resumed token
+        token, skipped = None, 0
+        if self._starting_token:
+            start = TokenDecoder().decode(self._starting_token)
+            skipped = start.pop("boto_truncate_amount", 0)
+            token = start.get("NextToken")
+
+        count = 0
+        for page in self._pages:
+            for index, item in enumerate(page.get(self._result_key, [])):
+                size = len(item.get(self._count_key, []))
+                if count and count + size > self._limit:
+                    # Resume at this item, in botocore's own token format
+                    self._resume_token = TokenEncoder().encode(
+                        {"NextToken": token, "boto_truncate_amount": skipped + index}
+                    )
+                    self._stopped = True
+                    return
+                count += size
+                yield item
+            token, skipped = page.get("NextToken"), 0
+            if count >= self._limit:
+                # On a page boundary the service token resumes directly
+                self._resume_token = TokenEncoder().encode({"NextToken": token}) if token else None
+                self._stopped = True
+                return
+
+    @property
+    def next_token(self) -> Optional[str]:
+        if self._stopped:
+            return self._resume_token
+        return self._pages.resume_token
+
+
+def paginate(client, operation: str, result_key: str, **kwargs: Any) -> PageCursor:
+    return PageCursor(client, operation, result_key, **kwargs)
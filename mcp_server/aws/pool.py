@@ -0,0 +1,125 @@
+"""
+Shared boto3 client pool.
+
+Creating a boto3 client loads the service model and endpoint data, resolves
+credentials and sets up a fresh urllib3 connection pool. Tools used to pay that
+cost on every invocation. Clients are thread-safe once built, so the pool keeps
+one client per (service, region, credentials) and hands it out to every tool.
+Every client is attached to the shared rate limiter (aws/throttle.py) and
+to the request metrics (core/metrics.py).
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+from mcp_server.aws.throttle import rate_limiter
+from mcp_server.core.config import Settings
+from mcp_server.core.metrics import metrics
+
+
+def _credential_key(profile: Optional[str] = None) -> str:
+    """
+    Identify the credentials a client will resolve to, without storing secrets.
+    Profile name plus a digest of any static env credentials is enough to
+    notice rotation and keep separate accounts apart.
+    """
+    profile = profile or os.getenv("AWS_PROFILE") or "default"
+    secret_material = "|".join(
+        os.getenv(name, "")
+        for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN")
+    )
+    digest = hashlib.sha256(secret_material.encode()).hexdigest()[:12]
+    return f"{profile}:{digest}"
+
+
+class ClientPool:
+    def __init__(self, max_pool_connections: int = Settings.MAX_POOL_CONNECTIONS):
+        self._lock = threading.Lock()
+        # Standard retry mode backs throttled calls off exponentially with jitter
+        self._config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"mode": "standard", "max_attempts": Settings.MAX_ATTEMPTS},
+        )
+        self._sessions: Dict[str, boto3.Session] = {}
+        self._clients: Dict[Tuple[str, str, str], Any] = {}
+        self._key_hits: Dict[Tuple[str, str, str], int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_client(
+        self,
+        service: str,
+        region: Optional[str] = None,
+        profile: Optional[str] = None,
+    ):
+        region = region or Settings.DEFAULT_REGION
+        key = (service, region, _credential_key(profile))
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._hits += 1
+                self._key_hits[key] += 1
+                return client
+
+            # boto3.Session is not thread-safe, so sessions are only touched
+            # while holding the lock. The resulting clients are safe to share.
+            session = self._sessions.get(key[2])
+            if session is None:
+                session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+                self._sessions[key[2]] = session
+
+            client = session.client(service, region_name=region, config=self._config)
+            rate_limiter.attach(client, region, key[2])
+            metrics.attach(client, region)
+            self._clients[key] = client
+            self._key_hits[key] = 0
+            self._misses += 1
+            return client
+
+    def credential_key(self, profile: Optional[str] = None) -> str:
+        return _credential_key(profile)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / total, 4) if total else None,
+                "sessions": len(self._sessions),
+                "clients": [
+                    {
+                        "service": service,
+                        "region": region,
+                        "credentials": creds,
+                        "hits": self._key_hits[(service, region, creds)],
+                    }
+                    for (service, region, creds) in self._clients
+                ],
+            }
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+            self._key_hits.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Process-wide pool shared by every tool
+pool = ClientPool()
+
+
+def get_client(service: str, region: Optional[str] = None, profile: Optional[str] = None):
+    return pool.get_client(service, region, profile)
+
+
+def pool_stats() -> Dict[str, Any]:
+    return pool.stats()
@@ -0,0 +1,525 @@
+"""
+Offline pricing index built from the AWS bulk price list.
+
+The EC2 offer file (``.../offers/v1.0/aws/AmazonEC2/current/index.csv``, several
+GB) is streamed row by row into a small SQLite database keyed by the fields the
+pricing tools look up. Besides on-demand compute it covers EBS storage, IOPS
+and throughput per volume type, snapshot storage and inter-region transfer,
+all of which are published in the same offer file. Lookups are then local
+indexed reads; the Pricing API is only used when the index is missing or has
+no matching row.
+
+    python -m mcp_server.aws.pricing_index ingest index.csv[.gz]
+    python -m mcp_server.aws.pricing_index info
+
+The offer file's version and publication date are stored with the index and
+returned alongside every price served from it.
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from mcp_server.aws.pricing_client import AWS_PRICING_REGION_MAP
+from mcp_server.core.config import Settings
+from mcp_server.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE ec2_ondemand (
+    region TEXT NOT NULL,
+    instance_type TEXT NOT NULL,
+    operating_system TEXT NOT NULL,
+    tenancy TEXT NOT NULL,
+    license_model TEXT NOT NULL,
+    price_per_hour REAL NOT NULL,
+    PRIMARY KEY (region, instance_type, operating_system, tenancy, license_model)
+) WITHOUT ROWID;
+CREATE TABLE ebs_storage (
+    region TEXT NOT NULL,
+    volume_type TEXT NOT NULL,
+    price_per_gb_month REAL NOT NULL,
+    PRIMARY KEY (region, volume_type)
+) WITHOUT ROWID;
+CREATE TABLE ebs_iops (
+    region TEXT NOT NULL,
+    volume_type TEXT NOT NULL,
+    starting_range REAL NOT NULL,
+    price_per_iops_month REAL NOT NULL,
+    PRIMARY KEY (region, volume_type, starting_range)
+) WITHOUT ROWID;
+CREATE TABLE ebs_throughput (
+    region TEXT NOT NULL,
+    volume_type TEXT NOT NULL,
+    price_per_gibps_month REAL NOT NULL,
+    PRIMARY KEY (region, volume_type)
+) WITHOUT ROWID;
+CREATE TABLE ebs_snapshot (
+    region TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    price_per_gb_month REAL NOT NULL,
+    PRIMARY KEY (region, tier)
+) WITHOUT ROWID;
+CREATE TABLE data_transfer (
+    from_region TEXT NOT NULL,
+    to_region TEXT NOT NULL,
+    price_per_gb REAL NOT NULL,
+    PRIMARY KEY (from_region, to_region)
+) WITHOUT ROWID;
+"""
+
+# Preamble rows of the CSV offer file, stored in meta
+_PREAMBLE_KEYS = {
+    "FormatVersion": "format_version",
+    "Publication Date": "publication_date",
+    "Version": "offer_version",
+    "OfferCode": "offer_code",
+}
+
+_LOCATION_TO_REGION = {location: region for region, location in AWS_PRICING_REGION_MAP.items()}
+
+_BATCH_SIZE = 5000
+
+
+# ---------------------------------------------------------------------------
+# Ingestion
+# ---------------------------------------------------------------------------
+
+class _Row:
+    """Column access by header name for one CSV row."""
+
+    __slots__ = ("_columns", "_values")
+
+    def __init__(self, columns: Dict[str, int], values: List[str]):
+        self._columns = columns
+        self._values = values
+
+    def get(self, name: str, default: str = "") -> str:
+        index = self._columns.get(name)
+        if index is None or index >= len(self._values):
+            return default
+        return self._values[index]
+
+    def region(self, prefix: str = "") -> Optional[str]:
+        return (
+            self.get(f"{prefix}Region Code")
+            or _LOCATION_TO_REGION.get(self.get(f"{prefix}Location"))
+        )
+
+    def usd_price(self) -> Optional[float]:
+        if self.get("TermType") != "OnDemand" or self.get("Currency", "USD") != "USD":
+            return None
+        try:
+            return float(self.get("PricePerUnit"))
+        except ValueError:
+            return None
+
+
+def _ec2_ondemand(row: _Row) -> Optional[Tuple]:
+    if row.get("Product Family") != "Compute Instance" or row.get("Unit") != "Hrs":
+        return None
+    # Same narrowing the Pricing API lookup applies
+    if row.get("Pre Installed S/W", "NA") != "NA" or row.get("CapacityStatus", "Used") != "Used":
+        return None
+
+    price = row.usd_price()
+    region = row.region()
+    if price is None or not region:
+        return None
+
+    return (
+        region,
+        row.get("Instance Type"),
+        row.get("Operating System"),
+        row.get("Tenancy"),
+        row.get("License Model"),
+        price,
+    )
+
+
+def _ebs_storage(row: _Row) -> Optional[Tuple]:
+    if row.get("Product Family") != "Storage" or row.get("Unit") != "GB-Mo":
+        return None
+    volume_type, price, region = row.get("Volume API Name"), row.usd_price(), row.region()
+    if not volume_type or price is None or not region:
+        return None
+    return (region, volume_type, price)
+
+
+def _ebs_iops(row: _Row) -> Optional[Tuple]:
+    # io2 IOPS are tiered; StartingRange is the first IOPS the price applies to
+    if row.get("Product Family") != "System Operation" or row.get("Unit") != "IOPS-Mo":
+        return None
+    volume_type, price, region = row.get("Volume API Name"), row.usd_price(), row.region()
+    if not volume_type or price is None or not region:
+        return None
+    try:
+        starting = float(row.get("StartingRange") or 0)
+    except ValueError:
+        starting = 0.0
+    return (region, volume_type, starting, price)
+
+
+def _ebs_throughput(row: _Row) -> Optional[Tuple]:
+    if row.get("Product Family") != "Provisioned Throughput" or row.get("Unit") != "GiBps-mo":
+        return None
+    volume_type, price, region = row.get("Volume API Name"), row.usd_price(), row.region()
+    if not volume_type or price is None or not region:
+        return None
+    return (region, volume_type, price)
+
+
+def _ebs_snapshot(row: _Row) -> Optional[Tuple]:
+    if row.get("Product Family") != "Storage Snapshot" or row.get("Unit") != "GB-Mo":
+        return None
+    usage_type = row.get("usageType")
+    if usage_type.endswith("EBS:SnapshotUsage"):
+        tier = "standard"
+    elif usage_type.endswith("EBS:SnapshotArchiveStorage"):
+        tier = "archive"
+    else:
+        return None
+    price, region = row.usd_price(), row.region()
+    if price is None or not region:
+        return None
+    return (region, tier, price)
+
+
+def _data_transfer(row: _Row) -> Optional[Tuple]:
+    if row.get("Product Family") != "Data Transfer" or row.get("Transfer Type") != "InterRegion Outbound":
+        return None
+    price, source, target = row.usd_price(), row.region("From "), row.region("To ")
+    if price is None or not source or not target:
+        return None
+    return (source, target, price)
+
+
+# table -> (row extractor, column count)
+_TABLES = {
+    "ec2_ondemand": (_ec2_ondemand, 6),
+    "ebs_storage": (_ebs_storage, 3),
+    "ebs_iops": (_ebs_iops, 4),
+    "ebs_throughput": (_ebs_throughput, 3),
+    "ebs_snapshot": (_ebs_snapshot, 3),
+    "data_transfer": (_data_transfer, 3),
+}
+
+
+def _open_offer(path: str) -> io.TextIOBase:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    return open(path, "r", newline="", encoding="utf-8")
+
+
+def _read_offer(handle) -> Tuple[Dict[str, str], Iterator[_Row]]:
+    """Split the offer file into its preamble and a lazy iterator of rows."""
+    reader = csv.reader(handle)
+    meta: Dict[str, str] = {}
+
+    for values in reader:
+        if values and values[0] == "SKU":
+            columns = {name: i for i, name in enumerate(values)}
+            break
+        if len(values) >= 2 and values[0] in _PREAMBLE_KEYS:
+            meta[_PREAMBLE_KEYS[values[0]]] = values[1]
+    else:
+        raise ValueError("Not a price list CSV: no header row starting with SKU")
+
+    return meta, (_Row(columns, values) for values in reader)
+
+
+def ingest(offer_path: str, db_path: str = Settings.PRICING_INDEX_PATH) -> Dict[str, Any]:
+    """
+    Stream an offer file into a fresh index. The database is built next to
+    the target and swapped in atomically, so readers never see a partial index.
+    """
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    tmp_path = f"{db_path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    started = time.monotonic()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(_SCHEMA)
+
+        batches: Dict[str, List[Tuple]] = {table: [] for table in _TABLES}
+        counts = {table: 0 for table in _TABLES}
+        duplicates = {table: 0 for table in _TABLES}
+        scanned = 0
+
+        def flush(table: str):
+            rows = batches[table]
+            if rows:
+                placeholders = ",".join("?" * _TABLES[table][1])
+                # The first row for a key wins; later ones are counted, not applied
+                inserted = conn.executemany(f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})", rows).rowcount
+                counts[table] += inserted
+                duplicates[table] += len(rows) - inserted
+                rows.clear()
+
+        with _open_offer(offer_path) as handle:
+            meta, rows = _read_offer(handle)
+            for row in rows:
+                scanned += 1
+                # Product families don't overlap, so a row lands in one table at most
+                for table, (extract, _) in _TABLES.items():
+                    record = extract(row)
+                    if record is not None:
+                        batches[table].append(record)
+                        if len(batches[table]) >= _BATCH_SIZE:
+                            flush(table)
+                        break
+
+        for table in _TABLES:
+            flush(table)
+        if any(duplicates.values()):
+            logger.warning(
+                "Ignored price rows repeating an indexed key: "
+                + ", ".join(f"{table}={n}" for table, n in duplicates.items() if n)
+            )
+
+        meta.update({
+            "schema_version": str(SCHEMA_VERSION),
+            "source": os.path.abspath(offer_path),
+            "ingested_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "rows_scanned": str(scanned),
+            **{f"rows_{table}": str(count) for table, count in counts.items()},
+            **{f"duplicates_{table}": str(count) for table, count in duplicates.items() if count},
+        })
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+        conn.commit()
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+    conn.close()
+
+    os.replace(tmp_path, db_path)
+    return {**meta, "elapsed_seconds": round(time.monotonic() - started, 1)}
+
+
+# ---------------------------------------------------------------------------
+# Lookups
+# ---------------------------------------------------------------------------
+
+class PricingIndex:
+    """
+    Read side of the index. Each thread gets its own read-only connection,
+    reopened when the file is replaced by a new ingest. An index built with a
+    different schema version is ignored.
+    """
+
+    def __init__(self, path: str = Settings.PRICING_INDEX_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.mtime == mtime:
+            return conn
+        if conn is not None:
+            conn.close()
+
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if meta.get("schema_version") != str(SCHEMA_VERSION):
+            # Built by another version of this module; re-ingest to use it
+            conn.close()
+            self._local.conn = None
+            return None
+
+        self._local.conn = conn
+        self._local.mtime = mtime
+        self._local.meta = meta
+        return conn
+
+    def available(self) -> bool:
+        return self._connection() is not None
+
+    def info(self) -> Dict[str, str]:
+        if self._connection() is None:
+            return {}
+        return dict(self._local.meta)
+
+    def version(self) -> Optional[str]:
+        return self.info().get("offer_version")
+
+    def ondemand_price(
+        self,
+        region: str,
+        instance_type: str,
+        operating_system: str = "Linux",
+        tenancy: str = "Shared",
+        license_model: Optional[str] = None,
+    ) -> Optional[float]:
+        """Hourly USD price, or None when the index has no matching row."""
+        conn = self._connection()
+        if conn is None:
+            return None
+
+        sql = (
+            "SELECT price_per_hour FROM ec2_ondemand"
+            " WHERE region = ? AND instance_type = ? AND operating_system = ? AND tenancy = ?"
+        )
+        params: List[Any] = [region, instance_type, operating_system, tenancy]
+        if license_model:
+            sql += " AND license_model = ?"
+            params.append(license_model)
+        else:
+            # Prefer the plain (no license / license included) price over BYOL
+            sql += (
+                " ORDER BY CASE license_model WHEN 'No License required' THEN 0"
+                " WHEN 'License Included' THEN 1 ELSE 2 END"
+            )
+
+        row = conn.execute(sql + " LIMIT 1", params).fetchone()
+        return row[0] if row else None
+
+    def ebs_prices(self, region: str, volume_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Monthly USD rates for one volume type: per GB of storage, IOPS tiers as
+        [(starting_iops, price_per_iops)], and per GiB/s of throughput. None when
+        the index has no storage price for the type.
+        """
+        conn = self._connection()
+        if conn is None:
+            return None
+
+        row = conn.execute(
+            "SELECT price_per_gb_month FROM ebs_storage WHERE region = ? AND volume_type = ?",
+            (region, volume_type),
+        ).fetchone()
+        if row is None:
+            return None
+
+        iops = conn.execute(
+            "SELECT starting_range, price_per_iops_month FROM ebs_iops"
+            " WHERE region = ? AND volume_type = ? ORDER BY starting_range",
+            (region, volume_type),
+        ).fetchall()
+        throughput = conn.execute(
+            "SELECT price_per_gibps_month FROM ebs_throughput WHERE region = ? AND volume_type = ?",
+            (region, volume_type),
+        ).fetchone()
+
+        return {
+            "storage_per_gb_month": row[0],
+            "iops_tiers": [(start, price) for start, price in iops],
+            "throughput_per_gibps_month": throughput[0] if throughput else None,
+        }
+
+    def snapshot_price(self, region: str, tier: str = "standard") -> Optional[float]:
+        """Monthly USD per GB of snapshot storage."""
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT price_per_gb_month FROM ebs_snapshot WHERE region = ? AND tier = ?",
+            (region, tier),
+        ).fetchone()
+        return row[0] if row else None
+
+    def transfer_price(self, from_region: str, to_region: str) -> Optional[float]:
+        """USD per GB transferred from one region to another."""
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT price_per_gb FROM data_transfer WHERE from_region = ? AND to_region = ?",
+            (from_region, to_region),
+        ).fetchone()
+        return row[0] if row else None
+
+
+# gp3 includes this much performance in the storage price
+GP3_BASELINE_IOPS = 3000
+GP3_BASELINE_THROUGHPUT_MIBPS = 125
+
+
+def tiered_cost(quantity: float, tiers: List) -> float:
+    """Price ``quantity`` against [(starting_at, unit_price), ...] tiers."""
+    cost = 0.0
+    for i, (start, price) in enumerate(tiers):
+        end = tiers[i + 1][0] if i + 1 < len(tiers) else float("inf")
+        if quantity <= start:
+            break
+        cost += (min(quantity, end) - start) * price
+    return cost
+
+
+def ebs_monthly_cost(
+    rates: Dict[str, Any],
+    volume_type: str,
+    size: float,
+    iops: Optional[int] = None,
+    throughput: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Monthly USD per component (storage, iops, throughput) of one volume at the
+    ``ebs_prices`` rates. Components the volume type is not billed for are left out.
+    """
+    monthly = {"storage": size * rates["storage_per_gb_month"]}
+    if iops and rates["iops_tiers"]:
+        billable = max(0, iops - GP3_BASELINE_IOPS) if volume_type == "gp3" else iops
+        monthly["iops"] = tiered_cost(billable, rates["iops_tiers"])
+    if throughput and rates["throughput_per_gibps_month"]:
+        billable = max(0, throughput - GP3_BASELINE_THROUGHPUT_MIBPS)
+        monthly["throughput"] = billable / 1024 * rates["throughput_per_gibps_month"]
+    return monthly
+
+
+pricing_index = PricingIndex()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or inspect the local pricing index")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest_cmd = sub.add_parser("ingest", help="Stream a bulk price list CSV into the index")
+    ingest_cmd.add_argument("offer_file")
+    ingest_cmd.add_argument("--db", default=Settings.PRICING_INDEX_PATH)
+
+    info_cmd = sub.add_parser("info", help="Show the indexed offer version and row counts")
+    info_cmd.add_argument("--db", default=Settings.PRICING_INDEX_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest":
+        result = ingest(args.offer_file, args.db)
+        for key, value in sorted(result.items()):
+            print(f"{key}: {value}")
+        return 0
+
+    info = PricingIndex(args.db).info()
+    if not info:
+        print(f"No pricing index at {args.db}")
+        return 1
+    for key, value in sorted(info.items()):
+        print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
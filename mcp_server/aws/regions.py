@@ -0,0 +1,211 @@
+"""
+Multi-region fan-out for read tools.
+
+A tool decorated with ``multi_region`` gains ``regions`` and ``region_timeout``
+arguments. When ``regions`` is set (an explicit list, or ["*"] for every
+enabled region) the tool body runs once per region on a shared thread pool and
+the results are merged into one response, each item tagged with its region.
+Regions that fail or time out are reported instead of failing the whole call.
+A timed-out region still waiting for a worker is cancelled; one whose AWS call
+is already running cannot be stopped, so it is counted in ``background_calls``
+until it returns.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pool import pool
+from mcp_server.core.config import Settings
+
+ALL_REGIONS = "*"
+
+_fanout_pool = ThreadPoolExecutor(
+    max_workers=Settings.FANOUT_MAX_WORKERS, thread_name_prefix="aws-mcp-region"
+)
+
+# Timed-out region calls that are still running: a thread cannot be stopped,
+# so each one holds a fan-out worker until its AWS call returns
+_abandoned_lock = threading.Lock()
+_abandoned: set = set()
+
+_regions_lock = threading.Lock()
+_enabled_regions: Dict[str, tuple] = {}  # credentials -> (fetched_at, regions)
+ENABLED_REGIONS_TTL = 3600
+
+
+def enabled_regions() -> List[str]:
+    """Regions enabled for the current credentials, cached for an hour."""
+    creds = pool.credential_key()
+
+    with _regions_lock:
+        cached = _enabled_regions.get(creds)
+        if cached and time.monotonic() - cached[0] < ENABLED_REGIONS_TTL:
+            return list(cached[1])
+
+    resp = get_ec2_client(Settings.DEFAULT_REGION).describe_regions()
+    regions = sorted(r["RegionName"] for r in resp.get("Regions", []))
+
+    with _regions_lock:
+        _enabled_regions[creds] = (time.monotonic(), regions)
+    return list(regions)
+
+
+def resolve_regions(regions: List[str]) -> List[str]:
+    if ALL_REGIONS in regions:
+        return enabled_regions()
+    # De-duplicate while keeping the caller's order
+    return list(dict.fromkeys(regions))
+
+
+def fan_out(
+    fn: Callable[..., Dict[str, Any]],
+    regions: List[str],
+    result_key: str,
+    *,
+    timeout: Optional[float] = None,
+    summary_keys: Tuple[str, ...] = (),
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Call ``fn(region=r, **kwargs)`` for every region concurrently and merge the
+    lists found under ``result_key``. Pagination tokens are per region, so any
+    incoming next_token is dropped and each region's token is reported in
+    ``region_summary``, along with the region's own ``summary_keys`` (totals,
+    truncation flags) that the merged list cannot carry. A tool's own
+    ``count`` replaces the page length there.
+    """
+    timeout = timeout or Settings.REGION_TIMEOUT
+    kwargs.pop("region", None)
+    kwargs.pop("next_token", None)
+
+    try:
+        targets = resolve_regions(regions)
+    except Exception as e:
+        return {"regions": regions, "error": f"Could not resolve regions: {e}"}
+
+    started = time.perf_counter()
+    futures = {
+        _fanout_pool.submit(fn, region=region, **kwargs): region
+        for region in targets
+    }
+    done, not_done = wait(futures, timeout=timeout)
+
+    merged: List[Any] = []
+    summary: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+
+    for future, region in futures.items():
+        if future in not_done:
+            if future.cancel():
+                # Still queued behind other regions: it will never run
+                errors[region] = f"Timed out after {timeout}s waiting for a worker"
+            else:
+                # The worker keeps running until its AWS call returns; its result is dropped
+                errors[region] = f"Timed out after {timeout}s; the call is still running in the background"
+                _abandon(future)
+            continue
+
+        try:
+            result = future.result()
+        except Exception as e:
+            errors[region] = str(e)
+            continue
+
+        if isinstance(result, dict) and "error" in result:
+            errors[region] = result["error"]
+            continue
+
+        items = result.get(result_key, []) if isinstance(result, dict) else result
+        # Items may be shared with the inventory cache, so tag copies
+        merged.extend({**item, "region": region} if isinstance(item, dict) else item for item in items)
+
+        summary[region] = {"count": len(items)}
+        if isinstance(result, dict) and result.get("next_token"):
+            summary[region]["next_token"] = result["next_token"]
+        if isinstance(result, dict) and "cache" in result:
+            summary[region]["cache"] = result["cache"]
+        if isinstance(result, dict) and "aggregates" in result:
+            summary[region]["aggregates"] = result["aggregates"]
+        if isinstance(result, dict):
+            summary[region].update({key: result[key] for key in summary_keys if key in result})
+
+    return {
+        "regions": targets,
+        result_key: merged,
+        "region_summary": summary,
+        "errors": errors,
+        "partial": bool(errors),
+        "background_calls": background_calls(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def _abandon(future):
+    with _abandoned_lock:
+        _abandoned.add(future)
+    future.add_done_callback(_release)
+
+
+def _release(future):
+    with _abandoned_lock:
+        _abandoned.discard(future)
+
+
+def background_calls() -> int:
+    """Timed-out region calls still occupying a fan-out worker."""
+    with _abandoned_lock:
+        return len(_abandoned)
+
+
+def map_regions(fn: Callable[[str, Any], Any], work: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run ``fn(region, work[region])`` for every region concurrently and return
+    {region: result}. A region that raises gets its exception as the result.
+    There is no timeout: this is for mutations, which must not be abandoned.
+    """
+    if len(work) == 1:
+        region, item = next(iter(work.items()))
+        try:
+            return {region: fn(region, item)}
+        except Exception as e:
+            return {region: e}
+
+    futures = {region: _fanout_pool.submit(fn, region, item) for region, item in work.items()}
+    results: Dict[str, Any] = {}
+    for region, future in futures.items():
+        try:
+            results[region] = future.result()
+        except Exception as e:
+            results[region] = e
+    return results
+
+
+def multi_region(result_key: str, summary_keys: Tuple[str, ...] = ()):
+    """
+    Decorator adding ``regions``/``region_timeout`` to a single-region tool.
+    The extra parameters are appended to the advertised signature so FastMCP
+    validates them like any other argument. ``summary_keys`` name the tool's
+    per-region totals to keep in ``region_summary``.
+    """
+
+    def decorator(fn: Callable[..., Dict[str, Any]]):
+        @functools.wraps(fn)
+        def wrapper(*args, regions: Optional[List[str]] = None, region_timeout: Optional[float] = None, **kwargs):
+            if not regions:
+                return fn(*args, **kwargs)
+            return fan_out(fn, regions, result_key, timeout=region_timeout, summary_keys=summary_keys, **kwargs)
+
+        sig = inspect.signature(fn)
+        extra = [
+            inspect.Parameter("regions", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[List[str]]),
+            inspect.Parameter("region_timeout", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[float]),
+        ]
+        wrapper.__signature__ = sig.replace(parameters=[*sig.parameters.values(), *extra])
+        return wrapper
+
+    return decorator
@@ -0,0 +1,8 @@
+from typing import Optional
+
+from mcp_server.aws.pool import get_client
+
+
+def get_s3_client(region: Optional[str] = None, profile: Optional[str] = None):
+    """Return the pooled S3 client for the given region."""
+    return get_client("s3", region, profile)
@@ -0,0 +1,470 @@
+"""
+Compiled security group rules.
+
+"Which groups expose 22 to 0.0.0.0/0" or "who can reach 5432 from
+10.2.0.0/16" used to mean scanning every rule of every group. The compiler
+loads a region's security groups once (paginated ``describe_security_groups``),
+flattens every permission into atomic rules (one protocol, one port range, one
+source) and indexes them by:
+
+* source CIDR, in one binary prefix trie per direction and IP version: the
+  rules whose CIDR covers a query range sit on the path from the root to the
+  query's node, the rules inside it in the subtree below;
+* port range, in one interval tree per direction and protocol over the fixed
+  0-65535 port space: every range is stored at the highest node whose
+  midpoint it contains, so inserts, deletes and stabbing queries take at most
+  16 steps;
+* referenced security group and prefix list.
+
+An exposure query intersects the port and source candidates, which takes well
+under a millisecond. Rules allowing every protocol match any port query. ICMP
+rules keep FromPort/ToPort as ICMP type and code (-1 for any); they are
+indexed by type, so an ICMP exposure query's port is the type.
+
+Security groups only allow, so a rule whose protocol, ports and source are all
+covered by another rule of the same group and direction is shadowed (it never
+decides anything) and an identical rule is a duplicate. Findings are computed
+per group and kept until the group changes.
+
+Creating, deleting, authorizing and revoking through this server invalidates
+the group: named groups are re-described and re-indexed on the next query,
+anything broader reloads the region. Changes made elsewhere are picked up
+once the index is older than AWS_MCP_SG_INDEX_TTL.
+"""
+
+import ipaddress
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_FILTER_VALUES, MAX_PAGE_SIZE, paginate
+from mcp_server.core.cache import IndexState, RegionalIndex
+from mcp_server.core.config import Settings
+
+INGRESS, EGRESS = "ingress", "egress"
+DIRECTIONS = {INGRESS: "IpPermissions", EGRESS: "IpPermissionsEgress"}
+
+ALL_PROTOCOLS = "-1"
+PROTOCOL_NAMES = {"6": "tcp", "17": "udp", "1": "icmp", "58": "icmpv6", "all": ALL_PROTOCOLS}
+
+MIN_PORT, MAX_PORT = 0, 65535
+
+ICMP_PROTOCOLS = ("icmp", "icmpv6")
+# ICMP type or code that matches every value
+ANY_ICMP = -1
+
+COVERS, OVERLAPS = "covers", "overlaps"
+
+
+def normalize_protocol(protocol: Any) -> str:
+    protocol = str(protocol).lower()
+    return PROTOCOL_NAMES.get(protocol, protocol)
+
+
+def _port_range(protocol: str, permission: Dict[str, Any]) -> Tuple[int, int]:
+    # Only TCP and UDP rules carry real port ranges; ICMP uses the fields for
+    # type and code, and other protocols have no ports at all
+    if protocol in ICMP_PROTOCOLS:
+        icmp_type, code = permission.get("FromPort"), permission.get("ToPort")
+        return (
+            ANY_ICMP if icmp_type is None or icmp_type < 0 else icmp_type,
+            ANY_ICMP if code is None or code < 0 else code,
+        )
+    if protocol not in ("tcp", "udp"):
+        return MIN_PORT, MAX_PORT
+    from_port, to_port = permission.get("FromPort"), permission.get("ToPort")
+    if from_port is None or from_port < 0:
+        return MIN_PORT, MAX_PORT
+    return from_port, MAX_PORT if to_port is None or to_port < 0 else to_port
+
+
+def _indexed_range(rule: Dict[str, Any]) -> Tuple[int, int]:
+    """The rule's range in its protocol's port tree: ICMP rules by type."""
+    if rule["protocol"] in ICMP_PROTOCOLS:
+        icmp_type = rule["from_port"]
+        return (MIN_PORT, MAX_PORT) if icmp_type == ANY_ICMP else (icmp_type, icmp_type)
+    return rule["from_port"], rule["to_port"]
+
+
+# -- structures -------------------------------------------------------------------
+
+
+class _TrieNode:
+    __slots__ = ("children", "rules")
+
+    def __init__(self):
+        self.children: List[Optional["_TrieNode"]] = [None, None]
+        self.rules: Set[int] = set()
+
+
+class PrefixTrie:
+    """Binary trie of CIDR prefixes for one IP version; nodes hold rule IDs."""
+
+    def __init__(self, bits: int):
+        self.bits = bits
+        self.root = _TrieNode()
+
+    def _path(self, network) -> Iterable[int]:
+        address = int(network.network_address)
+        for depth in range(network.prefixlen):
+            yield (address >> (self.bits - 1 - depth)) & 1
+
+    def add(self, network, rule_id: int):
+        node = self.root
+        for bit in self._path(network):
+            if node.children[bit] is None:
+                node.children[bit] = _TrieNode()
+            node = node.children[bit]
+        node.rules.add(rule_id)
+
+    def remove(self, network, rule_id: int):
+        node = self.root
+        for bit in self._path(network):
+            node = node.children[bit]
+            if node is None:
+                return
+        node.rules.discard(rule_id)
+
+    def covering(self, network) -> Set[int]:
+        """Rules whose prefix contains all of ``network``."""
+        found = set(self.root.rules)
+        node = self.root
+        for bit in self._path(network):
+            node = node.children[bit]
+            if node is None:
+                break
+            found |= node.rules
+        return found
+
+    def overlapping(self, network) -> Set[int]:
+        """Rules whose prefix shares any address with ``network``."""
+        found = set(self.root.rules)
+        node = self.root
+        for bit in self._path(network):
+            node = node.children[bit]
+            if node is None:
+                return found
+            found |= node.rules
+        # Everything below the query's node lies inside it
+        stack = [child for child in node.children if child]
+        while stack:
+            current = stack.pop()
+            found |= current.rules
+            stack.extend(child for child in current.children if child)
+        return found
+
+
+class PortTree:
+    """
+    Centered interval tree over the fixed port space. Node (lo, hi) has
+    midpoint (lo + hi) // 2 and keeps {(from, to): rule IDs} for the ranges
+    containing that midpoint that no higher node contains.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[Tuple[int, int], Dict[Tuple[int, int], Set[int]]] = {}
+
+    @staticmethod
+    def _home(low: int, high: int) -> Tuple[int, int]:
+        lo, hi = MIN_PORT, MAX_PORT
+        while True:
+            mid = (lo + hi) // 2
+            if high < mid:
+                hi = mid - 1
+            elif low > mid:
+                lo = mid + 1
+            else:
+                return lo, hi
+
+    def add(self, low: int, high: int, rule_id: int):
+        self.nodes.setdefault(self._home(low, high), {}).setdefault((low, high), set()).add(rule_id)
+
+    def remove(self, low: int, high: int, rule_id: int):
+        ranges = self.nodes.get(self._home(low, high))
+        if ranges and (low, high) in ranges:
+            ranges[(low, high)].discard(rule_id)
+
+    def overlapping(self, low: int, high: int) -> Set[int]:
+        """Rules whose port range shares any port with [low, high]."""
+        found: Set[int] = set()
+        stack = [(MIN_PORT, MAX_PORT)]
+        while stack:
+            lo, hi = stack.pop()
+            for (start, end), rules in self.nodes.get((lo, hi), {}).items():
+                if start <= high and end >= low:
+                    found |= rules
+            mid = (lo + hi) // 2
+            if low < mid and lo <= mid - 1:
+                stack.append((lo, mid - 1))
+            if high > mid and mid + 1 <= hi:
+                stack.append((mid + 1, hi))
+        return found
+
+
+# -- compiled region ----------------------------------------------------------------
+
+
+def _compile(group: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Atomic rules of one security group, one per protocol, port range and source."""
+    rules = []
+    for direction, field in DIRECTIONS.items():
+        for permission in group.get(field, []):
+            protocol = normalize_protocol(permission.get("IpProtocol", ALL_PROTOCOLS))
+            from_port, to_port = _port_range(protocol, permission)
+            base = {
+                "group_id": group["GroupId"],
+                "direction": direction,
+                "protocol": protocol,
+                "from_port": from_port,
+                "to_port": to_port,
+            }
+            for entry in permission.get("IpRanges", []):
+                rules.append({**base, "cidr": entry["CidrIp"], "description": entry.get("Description")})
+            for entry in permission.get("Ipv6Ranges", []):
+                rules.append({**base, "cidr": entry["CidrIpv6"], "description": entry.get("Description")})
+            for entry in permission.get("UserIdGroupPairs", []):
+                rules.append({**base, "source_group": entry.get("GroupId"), "description": entry.get("Description")})
+            for entry in permission.get("PrefixListIds", []):
+                rules.append({**base, "prefix_list": entry.get("PrefixListId"), "description": entry.get("Description")})
+    return rules
+
+
+def _source(rule: Dict[str, Any]) -> Tuple[str, Any]:
+    for kind in ("cidr", "source_group", "prefix_list"):
+        if kind in rule:
+            return kind, rule[kind]
+    return "", None
+
+
+def _covers(outer: Dict[str, Any], inner: Dict[str, Any], networks: Dict[int, Any]) -> bool:
+    if outer["protocol"] not in (ALL_PROTOCOLS, inner["protocol"]):
+        return False
+    if outer["protocol"] in ICMP_PROTOCOLS:
+        # Type, then code: -1 on the outer rule matches anything
+        for field in ("from_port", "to_port"):
+            if outer[field] != ANY_ICMP and outer[field] != inner[field]:
+                return False
+    elif outer["protocol"] != ALL_PROTOCOLS and (
+        outer["from_port"] > inner["from_port"] or outer["to_port"] < inner["to_port"]
+    ):
+        return False
+    outer_kind, outer_value = _source(outer)
+    inner_kind, inner_value = _source(inner)
+    if outer_kind != inner_kind:
+        return False
+    if outer_kind != "cidr":
+        return outer_value == inner_value
+    a, b = networks[outer["id"]], networks[inner["id"]]
+    return a.version == b.version and b.subnet_of(a)
+
+
+def _same(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    fields = ("protocol", "from_port", "to_port")
+    return all(a[f] == b[f] for f in fields) and _source(a) == _source(b)
+
+
+class _RegionRules(IndexState):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.rules: Dict[int, Dict[str, Any]] = {}
+        self.networks: Dict[int, Any] = {}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.by_group: Dict[str, List[int]] = {}
+        self.tries = {(d, v): PrefixTrie(32 if v == 4 else 128) for d in DIRECTIONS for v in (4, 6)}
+        self.ports: Dict[Tuple[str, str], PortTree] = {}
+        self.any_protocol: Dict[str, Set[int]] = {d: set() for d in DIRECTIONS}
+        self.by_source_group: Dict[Tuple[str, str], Set[int]] = {}
+        self.by_prefix_list: Dict[Tuple[str, str], Set[int]] = {}
+        # group ID -> (duplicates, shadowed), computed on demand
+        self.findings: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+        self.next_id = 0
+
+    def _add_rule(self, rule: Dict[str, Any]):
+        self.next_id += 1
+        rule_id = rule["id"] = self.next_id
+        self.rules[rule_id] = rule
+        direction = rule["direction"]
+        if rule["protocol"] == ALL_PROTOCOLS:
+            self.any_protocol[direction].add(rule_id)
+        else:
+            tree = self.ports.setdefault((direction, rule["protocol"]), PortTree())
+            tree.add(*_indexed_range(rule), rule_id)
+        if "cidr" in rule:
+            network = self.networks[rule_id] = ipaddress.ip_network(rule["cidr"], strict=False)
+            self.tries[(direction, network.version)].add(network, rule_id)
+        elif "source_group" in rule:
+            self.by_source_group.setdefault((direction, rule["source_group"]), set()).add(rule_id)
+        elif "prefix_list" in rule:
+            self.by_prefix_list.setdefault((direction, rule["prefix_list"]), set()).add(rule_id)
+
+    def _remove_rule(self, rule_id: int):
+        rule = self.rules.pop(rule_id)
+        direction = rule["direction"]
+        if rule["protocol"] == ALL_PROTOCOLS:
+            self.any_protocol[direction].discard(rule_id)
+        else:
+            self.ports[(direction, rule["protocol"])].remove(*_indexed_range(rule), rule_id)
+        network = self.networks.pop(rule_id, None)
+        if network is not None:
+            self.tries[(direction, network.version)].remove(network, rule_id)
+        elif "source_group" in rule:
+            self.by_source_group.get((direction, rule["source_group"]), set()).discard(rule_id)
+        elif "prefix_list" in rule:
+            self.by_prefix_list.get((direction, rule["prefix_list"]), set()).discard(rule_id)
+
+    def put_group(self, group: Dict[str, Any]):
+        self.drop_group(group["GroupId"])
+        self.groups[group["GroupId"]] = {
+            "group_id": group["GroupId"],
+            "group_name": group.get("GroupName"),
+            "vpc_id": group.get("VpcId"),
+        }
+        ids = []
+        for rule in _compile(group):
+            self._add_rule(rule)
+            ids.append(rule["id"])
+        self.by_group[group["GroupId"]] = ids
+
+    def drop_group(self, group_id: str):
+        for rule_id in self.by_group.pop(group_id, []):
+            self._remove_rule(rule_id)
+        self.groups.pop(group_id, None)
+        self.findings.pop(group_id, None)
+
+    def exposure(
+        self,
+        direction: str,
+        protocol: str,
+        from_port: int,
+        to_port: int,
+        cidr: Optional[str],
+        source_group: Optional[str],
+        match: str,
+    ) -> Set[int]:
+        """Rule IDs allowing some of [from_port, to_port] over ``protocol`` from the source."""
+        candidates = set(self.any_protocol[direction])
+        if protocol != ALL_PROTOCOLS:
+            tree = self.ports.get((direction, protocol))
+            if tree is not None:
+                candidates |= tree.overlapping(from_port, to_port)
+        else:
+            for (tree_direction, _), tree in self.ports.items():
+                if tree_direction == direction:
+                    candidates |= tree.overlapping(from_port, to_port)
+
+        if cidr:
+            network = ipaddress.ip_network(cidr, strict=False)
+            trie = self.tries[(direction, network.version)]
+            sources = trie.covering(network) if match == COVERS else trie.overlapping(network)
+            candidates &= sources
+        elif source_group:
+            candidates &= self.by_source_group.get((direction, source_group), set())
+        return candidates
+
+    def analyze(self, group_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(duplicate rules, shadowed rules) of one group; callers hold ``lock``."""
+        cached = self.findings.get(group_id)
+        if cached is not None:
+            return cached
+
+        rules = [self.rules[i] for i in self.by_group.get(group_id, [])]
+        duplicates: List[Dict[str, Any]] = []
+        shadowed: List[Dict[str, Any]] = []
+        for i, rule in enumerate(rules):
+            for j, other in enumerate(rules):
+                if i == j or other["direction"] != rule["direction"]:
+                    continue
+                if _same(rule, other):
+                    # Report the later copy of identical rules once
+                    if j < i:
+                        duplicates.append({"rule": rule, "duplicate_of": other})
+                        break
+                elif _covers(other, rule, self.networks):
+                    shadowed.append({"rule": rule, "shadowed_by": other})
+                    break
+        self.findings[group_id] = (duplicates, shadowed)
+        return duplicates, shadowed
+
+
+def public_rule(rule: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in rule.items() if k != "id" and v is not None}
+
+
+class SecurityGroupRules(RegionalIndex):
+    resource_types = frozenset({"security_groups"})
+
+    def __init__(self, ttl: float = Settings.SG_INDEX_TTL):
+        super().__init__(ttl)
+
+    def _new_entry(self, region: str) -> _RegionRules:
+        return _RegionRules()
+
+    def compiled(self, region: str, refresh: bool = False) -> Tuple[_RegionRules, Optional[str]]:
+        """(the region's compiled rules, "full" / "incremental" / None for how they were refreshed)"""
+        index = self._entry(region)
+
+        with index.load_lock:
+            stale, pending = index.take()
+            try:
+                if refresh or stale or index.expired(self.ttl):
+                    groups = self._describe(region)
+                    with index.lock:
+                        for group_id in set(index.groups) - {g["GroupId"] for g in groups}:
+                            index.drop_group(group_id)
+                        for group in groups:
+                            index.put_group(group)
+                        index.loaded_at = time.monotonic()
+                        index.full_loads += 1
+                    return index, "full"
+
+                if pending:
+                    ids = sorted(pending)
+                    groups = []
+                    for start in range(0, len(ids), MAX_FILTER_VALUES):
+                        groups.extend(self._describe(region, ids[start:start + MAX_FILTER_VALUES]))
+                    with index.lock:
+                        found = {g["GroupId"] for g in groups}
+                        for group_id in ids:
+                            if group_id not in found:
+                                index.drop_group(group_id)
+                        for group in groups:
+                            index.put_group(group)
+                        index.incremental_loads += 1
+                    return index, "incremental"
+            except Exception:
+                index.restore(stale, pending)
+                raise
+        return index, None
+
+    @staticmethod
+    def _describe(region: str, group_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        cursor = paginate(
+            get_ec2_client(region),
+            "describe_security_groups",
+            "SecurityGroups",
+            max_results=0,
+            page_size=MAX_PAGE_SIZE,
+            Filters=[{"Name": "group-id", "Values": group_ids}] if group_ids else None,
+        )
+        return list(cursor)
+
+    def _entry_stats(self, region: str, scope: Tuple[str, ...], index: _RegionRules, now: float) -> Dict[str, Any]:
+        with index.lock:
+            return {
+                "region": region,
+                "groups": len(index.groups),
+                "rules": len(index.rules),
+                "age_seconds": index.age(now),
+                "full_loads": index.full_loads,
+                "incremental_loads": index.incremental_loads,
+            }
+
+
+# Process-wide compiled rules shared by every tool
+sg_rules = SecurityGroupRules()
+
+
+def sg_rules_stats() -> Dict[str, Any]:
+    return sg_rules.stats()
@@ -0,0 +1,383 @@
+"""
+In-memory inverted tag index.
+
+Tag questions ("everything tagged team=payments that is not env=prod") used to
+mean a fresh describe per resource type and filtering on the client. The index
+loads every instance, volume, snapshot, security group, VPC and subnet of a
+region once, with paginated describes, and maps each tag key and value to the
+IDs carrying it. Boolean queries are then set operations over those postings.
+
+Queries combine predicates with AND, OR, NOT and parentheses; adjacent
+predicates are ANDed:
+
+    team=payments AND env!=prod
+    (env=staging OR env=dev) AND NOT owner
+    team=pay* cost-center
+
+``key=value`` matches a tag exactly, ``key=prefix*`` matches values by prefix,
+a bare ``key`` matches resources carrying the key and ``key*`` any key with
+that prefix. ``key!=value`` is ``NOT key=value``, so untagged resources match
+it. Double quotes keep spaces and a literal trailing ``*``.
+
+Mutating tools keep the index current through inventory cache invalidations:
+resources named by ID are re-described on the next query, broader changes
+reload that resource type. Tags edited outside this server show up once a
+type's load is older than AWS_MCP_TAG_INDEX_TTL.
+"""
+
+import heapq
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_FILTER_VALUES, MAX_PAGE_SIZE, paginate
+from mcp_server.core.cache import IndexState, RegionalIndex
+from mcp_server.core.config import Settings
+
+# Instances in these states are about to disappear from describe results
+GONE_STATES = {"shutting-down", "terminated"}
+
+
+def _instances(pages: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for reservation in pages:
+        for instance in reservation.get("Instances", []):
+            if instance.get("State", {}).get("Name") not in GONE_STATES:
+                yield instance
+
+
+# Indexed resource types, named like inventory cache invalidations:
+# (describe operation, result key, ID field, ID filter, extra params, item iterator)
+RESOURCE_TYPES: Dict[str, Tuple[str, str, str, str, Dict[str, Any], Callable]] = {
+    "instances": ("describe_instances", "Reservations", "InstanceId", "instance-id", {}, _instances),
+    "volumes": ("describe_volumes", "Volumes", "VolumeId", "volume-id", {}, iter),
+    "snapshots": ("describe_snapshots", "Snapshots", "SnapshotId", "snapshot-id", {"OwnerIds": ["self"]}, iter),
+    "security_groups": ("describe_security_groups", "SecurityGroups", "GroupId", "group-id", {}, iter),
+    "vpcs": ("describe_vpcs", "Vpcs", "VpcId", "vpc-id", {}, iter),
+    "subnets": ("describe_subnets", "Subnets", "SubnetId", "subnet-id", {}, iter),
+}
+
+
+# -- query language ---------------------------------------------------------------
+
+_TOKEN = re.compile(
+    r'\s*(?:(?P<open>\()|(?P<close>\))'
+    r'|(?P<key>"[^"]*"|[^\s()"=!]+)(?:\s*(?P<op>!=|=)\s*(?P<value>"[^"]*"|[^\s()"]*))?)'
+)
+_KEYWORDS = {"AND", "OR", "NOT"}
+
+
+def _tokens(query: str) -> List[Tuple[str, Any]]:
+    tokens: List[Tuple[str, Any]] = []
+    pos, end = 0, len(query.rstrip())
+    while pos < end:
+        match = _TOKEN.match(query, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Cannot parse tag query at: {query[pos:].strip()!r}")
+        pos = match.end()
+        if match["open"]:
+            tokens.append(("(", None))
+        elif match["close"]:
+            tokens.append((")", None))
+        elif match["op"] is None and match["key"].upper() in _KEYWORDS:
+            tokens.append((match["key"].upper(), None))
+        else:
+            tokens.append(("predicate", _predicate(match["key"], match["op"], match["value"])))
+    return tokens
+
+
+def _unquote(text: str) -> Tuple[str, bool]:
+    """(text, whether it ends in an unquoted wildcard)"""
+    if text.startswith('"'):
+        return text[1:-1], False
+    if text.endswith("*"):
+        return text[:-1], True
+    return text, False
+
+
+def _predicate(key: str, op: Optional[str], value: Optional[str]) -> Tuple:
+    key, key_prefix = _unquote(key)
+    if op is None:
+        return ("has_prefix", key) if key_prefix else ("has", key)
+    if key_prefix:
+        raise ValueError(f"Key wildcards only work without a value: {key}*")
+    value, value_prefix = _unquote(value or "")
+    node = ("prefix", key, value) if value_prefix else ("eq", key, value)
+    return ("not", node) if op == "!=" else node
+
+
+class _Parser:
+    """
+    expr   := term (OR term)*
+    term   := factor ([AND] factor)*
+    factor := NOT factor | ( expr ) | predicate
+    """
+
+    def __init__(self, query: str):
+        self.tokens = _tokens(query)
+        self.pos = 0
+
+    def parse(self) -> Tuple:
+        if not self.tokens:
+            raise ValueError("Empty tag query")
+        node = self._expr()
+        if self.pos < len(self.tokens):
+            raise ValueError(f"Unexpected {self.tokens[self.pos][0]} in tag query")
+        return node
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _expr(self) -> Tuple:
+        node = self._term()
+        while self._peek() == "OR":
+            self.pos += 1
+            node = ("or", node, self._term())
+        return node
+
+    def _term(self) -> Tuple:
+        node = self._factor()
+        while self._peek() in ("AND", "NOT", "(", "predicate"):
+            if self._peek() == "AND":
+                self.pos += 1
+            node = ("and", node, self._factor())
+        return node
+
+    def _factor(self) -> Tuple:
+        kind = self._peek()
+        if kind is None:
+            raise ValueError("Tag query ends early")
+        self.pos += 1
+        if kind == "NOT":
+            return ("not", self._factor())
+        if kind == "(":
+            node = self._expr()
+            if self._peek() != ")":
+                raise ValueError("Missing ) in tag query")
+            self.pos += 1
+            return node
+        if kind == "predicate":
+            return self.tokens[self.pos - 1][1]
+        raise ValueError(f"Unexpected {kind} in tag query")
+
+
+def parse_query(query: str) -> Tuple:
+    """Parse a tag query into a tree of ("and"|"or"|"not"|"eq"|"prefix"|"has"|"has_prefix", ...) nodes."""
+    return _Parser(query).parse()
+
+
+# -- index ------------------------------------------------------------------------
+
+
+class _RegionIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Loads are tracked and single-flighted per resource type
+        self.types = {resource_type: IndexState() for resource_type in RESOURCE_TYPES}
+        self.tags: Dict[str, Dict[str, str]] = {}
+        self.type_of: Dict[str, str] = {}
+        self.ids_by_type: Dict[str, Set[str]] = {resource_type: set() for resource_type in RESOURCE_TYPES}
+        # key -> value -> ids, and key -> ids carrying the key
+        self.postings: Dict[str, Dict[str, Set[str]]] = {}
+        self.key_ids: Dict[str, Set[str]] = {}
+
+    def _put(self, resource_type: str, resource_id: str, tags: Dict[str, str]):
+        old = self.tags.get(resource_id)
+        if old == tags:
+            return
+        if old is not None:
+            self._drop(resource_id)
+        self.tags[resource_id] = tags
+        self.type_of[resource_id] = resource_type
+        self.ids_by_type[resource_type].add(resource_id)
+        for key, value in tags.items():
+            self.postings.setdefault(key, {}).setdefault(value, set()).add(resource_id)
+            self.key_ids.setdefault(key, set()).add(resource_id)
+
+    def _drop(self, resource_id: str):
+        tags = self.tags.pop(resource_id, None)
+        if tags is None:
+            return
+        self.ids_by_type[self.type_of.pop(resource_id)].discard(resource_id)
+        for key, value in tags.items():
+            values = self.postings[key]
+            values[value].discard(resource_id)
+            if not values[value]:
+                del values[value]
+            self.key_ids[key].discard(resource_id)
+            if not self.key_ids[key]:
+                del self.postings[key]
+                del self.key_ids[key]
+
+    def replace(self, resource_type: str, items: Dict[str, Dict[str, str]]):
+        with self.lock:
+            for resource_id in self.ids_by_type[resource_type] - items.keys():
+                self._drop(resource_id)
+            for resource_id, tags in items.items():
+                self._put(resource_type, resource_id, tags)
+
+    def update(self, resource_type: str, ids: Iterable[str], items: Dict[str, Dict[str, str]]):
+        """Apply a describe of ``ids``: IDs missing from ``items`` are gone."""
+        with self.lock:
+            for resource_id in ids:
+                if resource_id in items:
+                    self._put(resource_type, resource_id, items[resource_id])
+                else:
+                    self._drop(resource_id)
+
+    def evaluate(self, node: Tuple, universe: Set[str]) -> Set[str]:
+        """IDs in ``universe`` matching ``node``; callers hold ``lock``."""
+        op = node[0]
+        if op == "and":
+            left = self.evaluate(node[1], universe)
+            return self.evaluate(node[2], left) if left else left
+        if op == "or":
+            return self.evaluate(node[1], universe) | self.evaluate(node[2], universe)
+        if op == "not":
+            return universe - self.evaluate(node[1], universe)
+        if op == "eq":
+            return universe & self.postings.get(node[1], {}).get(node[2], set())
+        if op == "has":
+            return universe & self.key_ids.get(node[1], set())
+        if op == "prefix":
+            matched: Set[str] = set()
+            for value, ids in self.postings.get(node[1], {}).items():
+                if value.startswith(node[2]):
+                    matched |= ids
+            return universe & matched
+        if op == "has_prefix":
+            matched = set()
+            for key, ids in self.key_ids.items():
+                if key.startswith(node[1]):
+                    matched |= ids
+            return universe & matched
+        raise ValueError(f"Unknown tag query node: {op}")
+
+
+def _tag_dict(item: Dict[str, Any]) -> Dict[str, str]:
+    return {tag["Key"]: tag.get("Value", "") for tag in item.get("Tags") or []}
+
+
+class TagIndex(RegionalIndex):
+    resource_types = frozenset(RESOURCE_TYPES)
+
+    def __init__(self, ttl: float = Settings.TAG_INDEX_TTL):
+        super().__init__(ttl)
+
+    def _new_entry(self, region: str) -> _RegionIndex:
+        return _RegionIndex()
+
+    def query(
+        self,
+        region: str,
+        query: str,
+        resource_types: Optional[List[str]] = None,
+        refresh: bool = False,
+        limit: int = Settings.DEFAULT_MAX_RESULTS,
+        after: Optional[Tuple[str, str]] = None,
+    ) -> Tuple[List[Tuple[str, str, Dict[str, str]]], Dict[str, int], Dict[str, Any]]:
+        """
+        (up to ``limit`` matches as (resource type, id, tags) ordered by type
+        and ID, starting after the ``after`` (type, id) pair; match counts per
+        type; index info) for one region.
+        """
+        node = parse_query(query)
+        wanted = sorted(resource_types or RESOURCE_TYPES)
+        unknown = [t for t in wanted if t not in RESOURCE_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(unknown)}")
+
+        index = self._entry(region)
+        refreshed = {}
+        for resource_type in wanted:
+            how = self._refresh(index, region, resource_type, force=refresh)
+            if how:
+                refreshed[resource_type] = how
+
+        page: List[Tuple[str, str, Dict[str, str]]] = []
+        counts: Dict[str, int] = {}
+        with index.lock:
+            for resource_type in wanted:
+                # Evaluating per type keeps NOT's universe to that type
+                matched = index.evaluate(node, index.ids_by_type[resource_type])
+                counts[resource_type] = len(matched)
+                if len(page) == limit or (after and resource_type < after[0]):
+                    continue
+                if after and resource_type == after[0]:
+                    matched = [i for i in matched if i > after[1]]
+                # Only the page is sorted, not every match
+                for resource_id in heapq.nsmallest(limit - len(page), matched):
+                    page.append((resource_type, resource_id, index.tags[resource_id]))
+            info = {
+                "indexed": {t: len(index.ids_by_type[t]) for t in wanted},
+                "refreshed": refreshed,
+            }
+        return page, counts, info
+
+    def _refresh(self, index: _RegionIndex, region: str, resource_type: str, force: bool) -> Optional[str]:
+        state = index.types[resource_type]
+        with state.load_lock:
+            # Changes invalidated while loading stay pending for the next query
+            stale, pending = state.take()
+            try:
+                if force or stale or state.expired(self.ttl):
+                    index.replace(resource_type, self._describe(region, resource_type))
+                    state.loaded_at = time.monotonic()
+                    state.full_loads += 1
+                    return "full"
+                if pending:
+                    ids = sorted(pending)
+                    items: Dict[str, Dict[str, str]] = {}
+                    for start in range(0, len(ids), MAX_FILTER_VALUES):
+                        items.update(self._describe(region, resource_type, ids[start:start + MAX_FILTER_VALUES]))
+                    index.update(resource_type, ids, items)
+                    state.incremental_loads += 1
+                    return "incremental"
+            except Exception:
+                state.restore(stale, pending)
+                raise
+        return None
+
+    @staticmethod
+    def _describe(region: str, resource_type: str, ids: Optional[List[str]] = None) -> Dict[str, Dict[str, str]]:
+        operation, result_key, id_field, id_filter, params, items = RESOURCE_TYPES[resource_type]
+        filters = [{"Name": id_filter, "Values": ids}] if ids else None
+        cursor = paginate(
+            get_ec2_client(region),
+            operation,
+            result_key,
+            max_results=0,
+            page_size=MAX_PAGE_SIZE,
+            Filters=filters,
+            **params,
+        )
+        return {item[id_field]: _tag_dict(item) for item in items(cursor)}
+
+    def _invalidate(self, scope: Tuple[str, ...], index: _RegionIndex, resource_type: str, ids: Optional[List[str]]):
+        index.types[resource_type].invalidate(ids)
+
+    def _entry_stats(self, region: str, scope: Tuple[str, ...], index: _RegionIndex, now: float) -> Dict[str, Any]:
+        with index.lock:
+            return {
+                "region": region,
+                "tag_keys": len(index.postings),
+                "types": {
+                    resource_type: {
+                        "resources": len(index.ids_by_type[resource_type]),
+                        "age_seconds": state.age(now),
+                        "full_loads": state.full_loads,
+                        "incremental_loads": state.incremental_loads,
+                    }
+                    for resource_type, state in index.types.items()
+                    if state.loaded_at
+                },
+            }
+
+
+# Process-wide index shared by every tool
+tag_index = TagIndex()
+
+
+def tag_index_stats() -> Dict[str, Any]:
+    return tag_index.stats()
@@ -0,0 +1,294 @@
+"""
+Client-side rate limiting for pooled boto3 clients.
+
+EC2 throttles every account per region and API action with a token bucket,
+and answers anything over the limit with ``RequestLimitExceeded``. A burst of
+parallel tool calls used to hit that wall and hand the error back to the agent.
+Each pooled client now takes a token from a matching local bucket before every
+HTTP attempt, so bursts queue briefly on our side instead of failing on AWS's.
+
+Buckets are keyed by (credentials, region, action) and start from EC2's
+published defaults. A throttling response halves the bucket's refill rate and
+every success wins a little of it back, so the limiter settles just under
+whatever AWS actually allows. Throttled attempts are retried by botocore's
+standard retry mode, which backs off exponentially with full jitter.
+
+After repeated throttles the refill rate can sit at 5% of the default, where a
+queue of callers would sleep for minutes. A request that would wait longer
+than AWS_MCP_MAX_THROTTLE_WAIT seconds fails at once with
+``RequestLimitExceeded`` instead, without taking a token.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from mcp_server.core.config import Settings
+from mcp_server.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# EC2 request token buckets: (bucket size, refill per second)
+EC2_MUTATING = (200, 5.0)
+EC2_NON_MUTATING = (100, 20.0)
+EC2_UNFILTERED_NON_MUTATING = (50, 10.0)
+
+_NON_MUTATING_PREFIXES = ("Describe", "Get", "List", "Search")
+# Actions AWS meters separately, in a smaller bucket, when a call is neither
+# filtered, paginated nor scoped to IDs
+_UNFILTERED_ACTIONS = frozenset({
+    "DescribeInstances",
+    "DescribeNetworkInterfaces",
+    "DescribeSecurityGroups",
+    "DescribeSnapshots",
+    "DescribeSpotInstanceRequests",
+    "DescribeVolumes",
+})
+_SCOPING_PARAMS = ("Filters", "MaxResults", "NextToken")
+
+# Error codes AWS uses for throttling (same set botocore retries as throttles)
+THROTTLE_CODES = frozenset({
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+})
+
+# A throttle cuts the refill rate by this factor, never below MIN_RATE_FRACTION
+# of the default; each success adds back RECOVERY_FRACTION of the default
+THROTTLE_BACKOFF = 0.5
+MIN_RATE_FRACTION = 0.05
+RECOVERY_FRACTION = 0.02
+
+_CONTEXT_KEY = "aws_mcp_rate_limit"
+
+
+def ec2_bucket(action: str, params: Dict[str, Any]) -> Tuple[int, float]:
+    """EC2's default bucket for ``action`` called with ``params``."""
+    if not action.startswith(_NON_MUTATING_PREFIXES):
+        return EC2_MUTATING
+    if action not in _UNFILTERED_ACTIONS:
+        return EC2_NON_MUTATING
+    # InstanceIds, GroupIds, VolumeIds... scope the call like a filter does
+    if any(params.get(name) for name in _SCOPING_PARAMS) or any(v for k, v in params.items() if k.endswith("Ids")):
+        return EC2_NON_MUTATING
+    return EC2_UNFILTERED_NON_MUTATING
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations: a caller always gets a token,
+    possibly one that only becomes valid in the future, and sleeps until then.
+    Callers queue in arrival order without holding the lock while they wait.
+    """
+
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = capacity
+        self.max_rate = rate
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take one token; returns how many seconds to wait before using it, or
+        None without taking one when that would be longer than ``max_wait``.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def throttled(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate * THROTTLE_BACKOFF)
+            # AWS says the bucket is empty, whatever we thought
+            self._tokens = min(self._tokens, 0.0)
+
+    def succeeded(self):
+        if self.rate < self.max_rate:
+            with self._lock:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_FRACTION)
+
+
+class _Limit:
+    """A bucket (None for services without known limits) plus its counters."""
+
+    def __init__(self, name: str, bucket: Optional[TokenBucket]):
+        self.name = name
+        self.bucket = bucket
+        self.requests = 0
+        self.throttled = 0
+        self.queued = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # botocore deep-copies the request context when presigning
+        # (copy_snapshot); the copy must keep drawing from the same bucket
+        return self
+
+    def record_request(self, wait: float):
+        with self._lock:
+            self.requests += 1
+            if wait > 0:
+                self.queued += 1
+                self.wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+    def record_throttle(self):
+        with self._lock:
+            self.throttled += 1
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+        if self.bucket is not None:
+            stats["capacity"] = self.bucket.capacity
+            stats["refill_per_second"] = round(self.bucket.rate, 3)
+            stats["default_refill_per_second"] = self.bucket.max_rate
+        return stats
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        enabled: bool = Settings.RATE_LIMIT_ENABLED,
+        overrides: Optional[Dict[str, Tuple[int, float]]] = None,
+        max_wait: float = Settings.MAX_THROTTLE_WAIT,
+    ):
+        self.enabled = enabled
+        self.max_wait = max_wait
+        self._overrides = dict(Settings.RATE_LIMITS if overrides is None else overrides)
+        self._lock = threading.Lock()
+        self._limits: Dict[Tuple, _Limit] = {}
+
+    def _defaults(self, service: str, action: str, params: Dict[str, Any]) -> Optional[Tuple[int, float]]:
+        for key in (f"{service}:{action}", f"{service}:*"):
+            if key in self._overrides:
+                return self._overrides[key]
+        if service == "ec2":
+            return ec2_bucket(action, params)
+        return None
+
+    def limit_for(self, service: str, credentials: str, region: str, action: str, params: Dict[str, Any]) -> _Limit:
+        defaults = self._defaults(service, action, params) if self.enabled else None
+        # Unfiltered calls to the EC2 actions metered that way draw from a separate, smaller bucket
+        key = (credentials, region, service, action, defaults)
+        limit = self._limits.get(key)
+        if limit is None:
+            with self._lock:
+                limit = self._limits.get(key)
+                if limit is None:
+                    limit = _Limit(f"{service}:{action} in {region}", TokenBucket(*defaults) if defaults else None)
+                    self._limits[key] = limit
+        return limit
+
+    # -- botocore event handlers ------------------------------------------------
+
+    def attach(self, client, region: str, credentials: str):
+        """Hook the limiter into every request ``client`` sends."""
+        service = client.meta.service_model.service_name
+        service_id = client.meta.service_model.service_id.hyphenize()
+
+        def select(params, model, context, **kwargs):
+            context[_CONTEXT_KEY] = self.limit_for(service, credentials, region, model.name, params)
+
+        events = client.meta.events
+        events.register(f"before-parameter-build.{service_id}", select)
+        # request-created fires once per attempt, after botocore's retry sleep
+        events.register(f"request-created.{service_id}", self._acquire)
+        events.register(f"response-received.{service_id}", self._observe)
+
+    def _acquire(self, request, operation_name=None, **kwargs):
+        limit = getattr(request, "context", {}).get(_CONTEXT_KEY)
+        if limit is None:
+            return
+        wait = limit.bucket.reserve(self.max_wait) if limit.bucket is not None else 0.0
+        if wait is None:
+            limit.record_rejected()
+            # Raised before sending, so botocore does not retry it
+            raise ClientError(
+                {"Error": {
+                    "Code": "RequestLimitExceeded",
+                    "Message": f"Client-side rate limit for {limit.name}: the next token is more than {self.max_wait:g}s away",
+                }},
+                operation_name or "",
+            )
+        limit.record_request(wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _observe(self, parsed_response, context, **kwargs):
+        limit = context.get(_CONTEXT_KEY)
+        if limit is None or parsed_response is None:
+            return
+
+        code = parsed_response.get("Error", {}).get("Code")
+        if code in THROTTLE_CODES:
+            limit.record_throttle()
+            if limit.bucket is not None:
+                limit.bucket.throttled()
+                logger.warning(f"{limit.name} throttled ({code}); refill rate now {limit.bucket.rate:.2f}/s")
+        elif limit.bucket is not None and not code:
+            limit.bucket.succeeded()
+
+    # -- metrics ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            limits = list(self._limits.items())
+        return {
+            "enabled": self.enabled,
+            "requests": sum(limit.requests for _, limit in limits),
+            "throttled": sum(limit.throttled for _, limit in limits),
+            "queued": sum(limit.queued for _, limit in limits),
+            "rejected": sum(limit.rejected for _, limit in limits),
+            "wait_seconds": round(sum(limit.wait_seconds for _, limit in limits), 3),
+            "actions": [
+                {"service": service, "region": region, "credentials": creds, "action": action, **limit.stats()}
+                for (creds, region, service, action, _), limit in limits
+            ],
+        }
+
+
+# Process-wide limiter attached to every pooled client
+rate_limiter = RateLimiter()
+
+
+def throttle_stats() -> Dict[str, Any]:
+    return rate_limiter.stats()
@@ -0,0 +1,315 @@
+"""
+In-process inventory cache.
+
+Read tools that agents call repeatedly (instance listings, instance details,
+subnets, volumes, snapshots) keep their responses per (account, region,
+resource type) for a short TTL. Mutating tools invalidate the resource types
+they touch, so a stop/terminate/create is visible on the next read. Callers
+can always bypass the cache with ``consistent=True``.
+
+Other in-memory indexes subscribe to the same invalidations through
+``inventory_cache.subscribe``; ``RegionalIndex`` and ``IndexState`` hold what
+they share (per-region entries, single-flight loads, staleness and stats).
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from mcp_server.aws.pool import pool
+from mcp_server.core.config import Settings
+
+# Listener signature: (region, resource_type, ids or None)
+InvalidationListener = Callable[[str, str, Optional[List[str]]], None]
+
+
+class InventoryCache:
+    def __init__(self, ttl: float = Settings.INVENTORY_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str, str], Dict[str, Tuple[float, Any]]] = {}
+        # Bumped by every invalidation of a scope
+        self._generations: Dict[Tuple[str, str, str], int] = {}
+        self._listeners: List[InvalidationListener] = []
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _scope(region: str, resource_type: str) -> Tuple[str, str, str]:
+        # The credential key stands in for the account: one set of
+        # credentials always resolves to the same account.
+        return (pool.credential_key(), region, resource_type)
+
+    def get(self, region: str, resource_type: str, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, age_seconds) for a fresh entry, or None."""
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(self._scope(region, resource_type), {}).get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if age < self.ttl:
+                    self._hits += 1
+                    return entry[1], age
+            self._misses += 1
+            return None
+
+    def generation(self, region: str, resource_type: str) -> int:
+        """Invalidation count of a scope; take it before reading from AWS and pass it to ``put``."""
+        with self._lock:
+            return self._generations.get(self._scope(region, resource_type), 0)
+
+    def put(self, region: str, resource_type: str, key: str, value: Any, generation: Optional[int] = None):
+        """
+        Store ``value``, unless the scope was invalidated since ``generation``
+        was taken: the value may predate the change and must not be served.
+        """
+        if self.ttl <= 0:
+            return
+        scope = self._scope(region, resource_type)
+        with self._lock:
+            if generation is not None and self._generations.get(scope, 0) != generation:
+                return
+            self._entries.setdefault(scope, {})[key] = (time.monotonic(), value)
+
+    def invalidate(self, region: str, resource_type: str, ids: Optional[Iterable[str]] = None):
+        """
+        Drop every cached response for a resource type in a region. ``ids``
+        narrows the change for listeners that can update incrementally.
+        """
+        ids = list(ids) if ids else None
+        scope = self._scope(region, resource_type)
+        with self._lock:
+            self._entries.pop(scope, None)
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            self._invalidations += 1
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            listener(region, resource_type, ids)
+
+    def subscribe(self, listener: InvalidationListener):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "scopes": [
+                    {"region": region, "resource_type": rtype, "entries": len(entries)}
+                    for (_, region, rtype), entries in self._entries.items()
+                ],
+            }
+
+
+inventory_cache = InventoryCache()
+
+
+class IndexState:
+    """
+    Load bookkeeping for one scope of an in-memory index: when it was last
+    fully loaded, whether an invalidation made it stale, which IDs wait to be
+    re-described, and a lock that single-flights loads. Invalidations only take
+    a small lock of their own, so they never wait for a load in progress.
+    """
+
+    def __init__(self):
+        self.load_lock = threading.Lock()
+        self.loaded_at = 0.0
+        self.stale = False
+        self.pending: Set[str] = set()
+        self.full_loads = 0
+        self.incremental_loads = 0
+        self._pending_lock = threading.Lock()
+
+    def invalidate(self, ids: Optional[Iterable[str]] = None):
+        """Queue ``ids`` for the next load, or mark the whole scope stale."""
+        with self._pending_lock:
+            if ids:
+                self.pending.update(ids)
+            else:
+                self.stale = True
+
+    def take(self) -> Tuple[bool, Set[str]]:
+        """
+        (stale, pending IDs), clearing both. Taken before a load, so changes
+        invalidated while it runs are kept for the next one.
+        """
+        with self._pending_lock:
+            stale, pending = self.stale, self.pending
+            self.stale, self.pending = False, set()
+            return stale, pending
+
+    def restore(self, stale: bool, pending: Iterable[str]):
+        """Put back what a failed load had taken."""
+        with self._pending_lock:
+            self.stale = self.stale or stale
+            self.pending.update(pending)
+
+    def expired(self, ttl: float) -> bool:
+        return not self.loaded_at or time.monotonic() - self.loaded_at > ttl
+
+    def age(self, now: float) -> Optional[float]:
+        return round(now - self.loaded_at, 1) if self.loaded_at else None
+
+
+class RegionalIndex:
+    """
+    Base for the in-memory indexes built next to the inventory cache. Keeps
+    one entry per (account, region, *scope), created on first use, and hands
+    invalidations of ``resource_types`` to the affected region's entries.
+    Subclasses implement ``_new_entry`` and ``_entry_stats`` and override
+    ``_invalidate`` when an entry is not a single IndexState.
+    """
+
+    # Inventory cache resource types the index holds
+    resource_types: frozenset = frozenset()
+    # stats() keys for the TTL and the per-entry list
+    ttl_label = "ttl_seconds"
+    stats_label = "regions"
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, ...], Any] = {}
+        inventory_cache.subscribe(self._invalidated)
+
+    def _new_entry(self, region: str, *scope: str) -> Any:
+        raise NotImplementedError
+
+    def _entry_stats(self, region: str, scope: Tuple[str, ...], entry: Any, now: float) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _invalidate(self, scope: Tuple[str, ...], entry: Any, resource_type: str, ids: Optional[List[str]]):
+        entry.invalidate(ids)
+
+    def _entry(self, region: str, *scope: str, create: bool = True) -> Any:
+        key = (pool.credential_key(), region, *scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and create:
+                entry = self._entries[key] = self._new_entry(region, *scope)
+            return entry
+
+    def _invalidated(self, region: str, resource_type: str, ids: Optional[List[str]]):
+        if resource_type not in self.resource_types:
+            return
+        prefix = (pool.credential_key(), region)
+        with self._lock:
+            entries = [(key[2:], entry) for key, entry in self._entries.items() if key[:2] == prefix]
+        for scope, entry in entries:
+            self._invalidate(scope, entry, resource_type, ids)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = list(self._entries.items())
+        now = time.monotonic()
+        rows = [self._entry_stats(key[1], key[2:], entry, now) for key, entry in entries]
+        return {self.ttl_label: self.ttl, self.stats_label: [row for row in rows if row is not None]}
+
+
+def _bound_arguments(sig: inspect.Signature, args, kwargs) -> Dict[str, Any]:
+    # Tool defaults for region differ between modules, so resolve the region
+    # the function will actually use rather than trusting kwargs.
+    bound = sig.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def cached(resource_type: str):
+    """
+    Serve a read tool from the inventory cache. Adds a ``consistent`` argument
+    that bypasses the cache, and a ``cache`` block (hit, age_seconds) to every
+    response. Error responses are never cached, nor are responses read while
+    their resource type was invalidated.
+    """
+
+    def decorator(fn: Callable[..., Dict[str, Any]]):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, consistent: bool = False, **kwargs):
+            arguments = _bound_arguments(sig, args, kwargs)
+            region = arguments.pop("region", None) or Settings.DEFAULT_REGION
+            key = json.dumps(arguments, sort_keys=True, default=str)
+
+            if not consistent:
+                cached_entry = inventory_cache.get(region, resource_type, key)
+                if cached_entry is not None:
+                    value, age = cached_entry
+                    return {**value, "cache": {"hit": True, "age_seconds": round(age, 3)}}
+
+            # A mutation landing while fn runs must not leave its stale result cached
+            generation = inventory_cache.generation(region, resource_type)
+            result = fn(*args, **kwargs)
+            if isinstance(result, dict) and "error" not in result:
+                inventory_cache.put(region, resource_type, key, result, generation)
+                return {**result, "cache": {"hit": False, "age_seconds": 0.0}}
+            return result
+
+        extra = inspect.Parameter("consistent", inspect.Parameter.KEYWORD_ONLY, default=False, annotation=bool)
+        wrapper.__signature__ = sig.replace(parameters=[*sig.parameters.values(), extra])
+        return wrapper
+
+    return decorator
+
+
+def invalidates(
+    *resource_types: str,
+    ids_from: Union[str, Tuple[str, ...], None] = None,
+    regions_from: Optional[str] = None,
+):
+    """
+    Invalidate cached resource types in the tool's region once a mutating tool
+    has run. The call is attempted either way, so invalidation happens even
+    when the tool reports an error: a partial mutation must not stay hidden.
+    ``ids_from`` names the argument(s) holding the affected resource id(s).
+    ``regions_from`` names a {region: [ids]} argument for tools that act on
+    several regions at once; each of those regions is invalidated too.
+    """
+    id_args = (ids_from,) if isinstance(ids_from, str) else tuple(ids_from or ())
+
+    def decorator(fn: Callable[..., Any]):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            arguments = _bound_arguments(sig, args, kwargs)
+            region = arguments.get("region") or Settings.DEFAULT_REGION
+
+            ids: List[str] = []
+            for name in id_args:
+                value = arguments.get(name)
+                if value:
+                    ids.extend([value] if isinstance(value, str) else value)
+
+            # The tool's own region is always invalidated; over-invalidating
+            # only costs a cache miss
+            by_region = arguments.get(regions_from) if regions_from else None
+            targets: Dict[str, List[str]] = {region: ids}
+            for other, other_ids in (by_region or {}).items():
+                targets.setdefault(other, []).extend(other_ids)
+
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                for target, target_ids in targets.items():
+                    for resource_type in resource_types:
+                        inventory_cache.invalidate(target, resource_type, target_ids or None)
+
+        return wrapper
+
+    return decorator
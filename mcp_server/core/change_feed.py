@@ -0,0 +1,320 @@
+"""
+Inventory change feed.
+
+Agents that watch an account used to re-list every instance and volume and
+diff the results themselves, paying for the whole fleet on every check. The
+feed keeps one compact snapshot per region instead: a background thread
+re-describes the region every AWS_MCP_CHANGE_FEED_INTERVAL seconds, diffs the
+result against the snapshot and appends one numbered event per added, removed
+or modified resource (state, type, IP, attachment and tag changes).
+
+Callers hold a sync token, the number of the last event they saw, and receive
+only the events after it, so steady-state traffic follows churn rather than
+fleet size. Tokens carry the feed's epoch; a token from an earlier process, or
+one older than the retained events, comes back with ``reset`` and the caller
+re-lists once. Regions stop being synced after an hour without a reader, and
+mutating tools bring the next sync forward through inventory invalidations.
+"""
+
+import bisect
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_PAGE_SIZE, paginate
+from mcp_server.core.cache import RegionalIndex
+from mcp_server.core.config import Settings
+from mcp_server.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Events kept per region; older tokens get a reset
+RETAINED_EVENTS = 10000
+
+# A region nobody has read for this long is no longer synced
+IDLE_SECONDS = 3600.0
+
+# Delay between a mutating tool's invalidation and the sync it triggers, so a
+# burst of mutations is picked up by one describe
+INVALIDATION_DELAY = 2.0
+
+ADDED, REMOVED, MODIFIED = "added", "removed", "modified"
+
+
+def _tags(item: Dict[str, Any]) -> Dict[str, str]:
+    return {tag["Key"]: tag.get("Value", "") for tag in item.get("Tags") or []}
+
+
+def _instance_record(instance: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "state": instance.get("State", {}).get("Name"),
+        "instance_type": instance.get("InstanceType"),
+        "private_ip": instance.get("PrivateIpAddress"),
+        "public_ip": instance.get("PublicIpAddress"),
+        "subnet_id": instance.get("SubnetId"),
+        "tags": _tags(instance),
+    }
+
+
+def _volume_record(volume: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "state": volume.get("State"),
+        "size": volume.get("Size"),
+        "volume_type": volume.get("VolumeType"),
+        "iops": volume.get("Iops"),
+        "attached_to": sorted(a["InstanceId"] for a in volume.get("Attachments", []) if a.get("InstanceId")),
+        "tags": _tags(volume),
+    }
+
+
+def _instances(pages: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+    for reservation in pages:
+        yield from reservation.get("Instances", [])
+
+
+# resource type -> (describe operation, result key, ID field, item iterator, record builder)
+TRACKED: Dict[str, Tuple[str, str, str, Callable, Callable]] = {
+    "instances": ("describe_instances", "Reservations", "InstanceId", _instances, _instance_record),
+    "volumes": ("describe_volumes", "Volumes", "VolumeId", iter, _volume_record),
+}
+
+
+def _diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {
+        field: {"old": old.get(field), "new": value}
+        for field, value in new.items()
+        if old.get(field) != value
+    }
+
+
+class _RegionFeed:
+    def __init__(self, region: str):
+        self.region = region
+        self.epoch = uuid.uuid4().hex[:8]
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        # (resource type, id) -> record
+        self.snapshot: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.seqs: List[int] = []
+        self.seq = 0
+        self.counts: Dict[str, int] = {}
+        self.synced_at: Optional[datetime] = None
+        self.syncs = 0
+        self.last_error: Optional[str] = None
+        self.last_read = time.monotonic()
+        self.next_sync = 0.0
+        # Single-flights syncs between the loop and a reader's first call
+        self.sync_lock = threading.Lock()
+
+    def token(self, seq: Optional[int] = None) -> str:
+        return f"{self.epoch}.{self.seq if seq is None else seq}"
+
+    def apply(self, current: Dict[Tuple[str, str], Dict[str, Any]]):
+        """Diff a full describe against the snapshot and append the events."""
+        now = datetime.now(timezone.utc)
+        with self.changed:
+            # The first sync is the baseline: there is nothing to diff against
+            baseline = self.synced_at is None
+            events: List[Dict[str, Any]] = []
+            for key, record in current.items():
+                old = self.snapshot.get(key)
+                if old is None:
+                    events.append({"change": ADDED, "key": key, "resource": record})
+                elif old != record:
+                    events.append({"change": MODIFIED, "key": key, "fields": _diff(old, record)})
+            for key in self.snapshot.keys() - current.keys():
+                events.append({"change": REMOVED, "key": key, "resource": self.snapshot[key]})
+
+            self.snapshot = current
+            self.counts = {resource_type: 0 for resource_type in TRACKED}
+            for resource_type, _ in current:
+                self.counts[resource_type] += 1
+            self.synced_at = now
+            self.syncs += 1
+            self.last_error = None
+            if baseline or not events:
+                return
+
+            for event in events:
+                self.seq += 1
+                resource_type, resource_id = event.pop("key")
+                self.events.append({
+                    "seq": self.seq,
+                    "at": now,
+                    "resource_type": resource_type,
+                    "id": resource_id,
+                    **event,
+                })
+                self.seqs.append(self.seq)
+            excess = len(self.events) - RETAINED_EVENTS
+            if excess > 0:
+                del self.events[:excess]
+                del self.seqs[:excess]
+            self.changed.notify_all()
+
+    def read(
+        self, since: int, resource_types: Optional[List[str]], limit: int
+    ) -> Tuple[List[Dict[str, Any]], str, bool]:
+        """(events after ``since``, new token, whether more are waiting); callers hold ``lock``."""
+        start = bisect.bisect_right(self.seqs, since)
+        found: List[Dict[str, Any]] = []
+        for event in self.events[start:]:
+            if resource_types and event["resource_type"] not in resource_types:
+                continue
+            if len(found) == limit:
+                # Resume just before the first event not returned
+                return found, self.token(event["seq"] - 1), True
+            found.append(event)
+        return found, self.token(), False
+
+
+class ChangeFeed(RegionalIndex):
+    resource_types = frozenset(TRACKED)
+    ttl_label = "interval_seconds"
+
+    def __init__(self, interval: float = Settings.CHANGE_FEED_INTERVAL):
+        super().__init__(interval)
+        self.interval = interval
+        # Wakes the sync loop; shares the lock guarding the feeds
+        self._wake = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+
+    # -- public API ---------------------------------------------------------
+
+    def changes(
+        self,
+        region: str,
+        since: Optional[str] = None,
+        resource_types: Optional[List[str]] = None,
+        limit: int = Settings.DEFAULT_MAX_RESULTS,
+        wait: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Events for one region after the ``since`` token. Without a token the
+        current token is returned (after a baseline sync on first use). With
+        ``wait`` the call blocks up to that many seconds for a first event.
+        """
+        unknown = [t for t in resource_types or [] if t not in TRACKED]
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(unknown)}")
+
+        feed = self._feed(region)
+        if feed.synced_at is None:
+            self._sync(feed, initial=True)
+
+        deadline = time.monotonic() + wait
+        with feed.changed:
+            feed.last_read = time.monotonic()
+            seq, reset = None, False
+            if since:
+                epoch, _, number = since.partition(".")
+                oldest = feed.seqs[0] - 1 if feed.seqs else feed.seq
+                if epoch != feed.epoch or not number.isdigit() or not oldest <= int(number) <= feed.seq:
+                    reset = True
+                else:
+                    seq = int(number)
+
+            if seq is None:
+                events, token, more = [], feed.token(), False
+            else:
+                events, token, more = feed.read(seq, resource_types, limit)
+                while not events and not more and time.monotonic() < deadline:
+                    feed.changed.wait(deadline - time.monotonic())
+                    events, token, more = feed.read(seq, resource_types, limit)
+
+            return {
+                "token": token,
+                "reset": reset,
+                "changes": events,
+                "more": more,
+                "synced_at": feed.synced_at,
+                "sync_error": feed.last_error,
+                "tracked": dict(feed.counts),
+            }
+
+    # -- sync loop ----------------------------------------------------------
+
+    def _new_entry(self, region: str) -> _RegionFeed:
+        feed = _RegionFeed(region)
+        feed.next_sync = time.monotonic() + self.interval
+        return feed
+
+    def _feed(self, region: str) -> _RegionFeed:
+        feed = self._entry(region)
+        with self._wake:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="aws-mcp-change-feed", daemon=True)
+                self._thread.start()
+            self._wake.notify_all()
+        return feed
+
+    def _run(self):
+        while True:
+            with self._wake:
+                now = time.monotonic()
+                for key in [k for k, f in self._entries.items() if now - f.last_read > IDLE_SECONDS]:
+                    del self._entries[key]
+                if not self._entries:
+                    # Nobody is reading; the next reader restarts the thread
+                    self._thread = None
+                    return
+
+                due = [f for f in self._entries.values() if f.next_sync <= now]
+                if not due:
+                    wake = min(f.next_sync for f in self._entries.values())
+                    self._wake.wait(max(0.0, wake - now))
+                    continue
+                for feed in due:
+                    feed.next_sync = now + self.interval
+
+            for feed in due:
+                self._sync(feed)
+
+    def _sync(self, feed: _RegionFeed, initial: bool = False):
+        with feed.sync_lock:
+            if initial and feed.synced_at is not None:
+                # Another reader finished the baseline while this one waited
+                return
+            current: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            try:
+                ec2 = get_ec2_client(feed.region)
+                for resource_type, (operation, result_key, id_field, items, record) in TRACKED.items():
+                    cursor = paginate(ec2, operation, result_key, max_results=0, page_size=MAX_PAGE_SIZE)
+                    for item in items(cursor):
+                        current[(resource_type, item[id_field])] = record(item)
+            except Exception as e:
+                # Keep the old snapshot: a partial describe would report removals
+                logger.warning(f"Syncing inventory changes in {feed.region} failed: {e}")
+                with feed.lock:
+                    feed.last_error = str(e)
+                return
+            feed.apply(current)
+
+    def _invalidate(self, scope: Tuple[str, ...], feed: _RegionFeed, resource_type: str, ids: Optional[List[str]]):
+        with self._wake:
+            feed.next_sync = min(feed.next_sync, time.monotonic() + INVALIDATION_DELAY)
+            self._wake.notify_all()
+
+    def _entry_stats(self, region: str, scope: Tuple[str, ...], feed: _RegionFeed, now: float) -> Dict[str, Any]:
+        with feed.lock:
+            return {
+                "region": region,
+                "resources": len(feed.snapshot),
+                "events": len(feed.events),
+                "seq": feed.seq,
+                "syncs": feed.syncs,
+                "idle_seconds": round(now - feed.last_read, 1),
+                "last_error": feed.last_error,
+            }
+
+
+# Process-wide feed shared by every tool
+change_feed = ChangeFeed()
+
+
+def change_feed_stats() -> Dict[str, Any]:
+    return change_feed.stats()
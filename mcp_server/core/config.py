@@ -3,5 +3,93 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _parse_limits(raw: str) -> dict:
+    """Parse "ec2=16,ebs=8" style overrides into {"ec2": 16, "ebs": 8}."""
+    limits = {}
+    for item in raw.split(","):
+        if "=" in item:
+            key, value = item.split("=", 1)
+            limits[key.strip()] = int(value)
+    return limits
+
+
+def _parse_rate_limits(raw: str) -> dict:
+    """Parse "ec2:RunInstances=5/2,ec2:*=100/20" into {"ec2:RunInstances": (5, 2.0), ...}."""
+    limits = {}
+    for item in raw.split(","):
+        if "=" in item:
+            key, value = item.split("=", 1)
+            capacity, rate = value.split("/", 1)
+            limits[key.strip()] = (int(capacity), float(rate))
+    return limits
+
+
 class Settings:
     DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+
+    # Connections kept open per pooled boto3 client
+    MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MCP_MAX_POOL_CONNECTIONS", "50"))
+
+    # Page size handed out by list/describe tools when max_results is omitted
+    DEFAULT_MAX_RESULTS = int(os.getenv("AWS_MCP_MAX_RESULTS", "100"))
+
+    # Worker threads running blocking tool bodies, and how many calls may be
+    # in flight at once per tool service (ec2/ebs/vpc) and per AWS region
+    TOOL_MAX_WORKERS = int(os.getenv("AWS_MCP_TOOL_WORKERS", "32"))
+    DEFAULT_SERVICE_CONCURRENCY = int(os.getenv("AWS_MCP_DEFAULT_SERVICE_CONCURRENCY", "16"))
+    DEFAULT_REGION_CONCURRENCY = int(os.getenv("AWS_MCP_DEFAULT_REGION_CONCURRENCY", "8"))
+    SERVICE_CONCURRENCY = _parse_limits(os.getenv("AWS_MCP_SERVICE_CONCURRENCY", ""))
+    REGION_CONCURRENCY = _parse_limits(os.getenv("AWS_MCP_REGION_CONCURRENCY", ""))
+
+    # Long-poll tools (ops.wait, inventory.changes): at most this many hold a
+    # worker thread at once, further waiters queue without one. A single wait
+    # lasts at most MAX_WAIT_SECONDS; callers loop for longer waits
+    MAX_WAITERS = int(os.getenv("AWS_MCP_MAX_WAITERS", "8"))
+    MAX_WAIT_SECONDS = 300
+
+    # Multi-region fan-out: worker threads shared by all fan-out calls and the
+    # default time allowed for each region before it is reported as timed out
+    FANOUT_MAX_WORKERS = int(os.getenv("AWS_MCP_FANOUT_WORKERS", "32"))
+    REGION_TIMEOUT = float(os.getenv("AWS_MCP_REGION_TIMEOUT", "20"))
+
+    # Client-side token buckets per (credentials, region, API action). EC2 uses
+    # its published defaults; overrides are "service:Action=capacity/refill"
+    # ("service:*" covers a whole service). Throttled calls are retried with
+    # jittered exponential backoff up to AWS_MAX_ATTEMPTS attempts.
+    RATE_LIMIT_ENABLED = os.getenv("AWS_MCP_RATE_LIMIT", "1").lower() not in ("0", "false", "no")
+    RATE_LIMITS = _parse_rate_limits(os.getenv("AWS_MCP_RATE_LIMITS", ""))
+    # Longest a request may queue for a token; beyond that it fails fast
+    MAX_THROTTLE_WAIT = float(os.getenv("AWS_MCP_MAX_THROTTLE_WAIT", "30"))
+    MAX_ATTEMPTS = int(os.getenv("AWS_MAX_ATTEMPTS", "8"))
+
+    # How long single-ID describe lookups wait to be coalesced into one call
+    BATCH_WINDOW = float(os.getenv("AWS_MCP_BATCH_WINDOW_MS", "5")) / 1000
+
+    # Serve Prometheus metrics on http://HOST:PORT/metrics (0 disables)
+    METRICS_PORT = int(os.getenv("AWS_MCP_METRICS_PORT", "0"))
+    METRICS_HOST = os.getenv("AWS_MCP_METRICS_HOST", "127.0.0.1")
+
+    # Seconds a cached inventory response stays fresh (0 disables the cache)
+    INVENTORY_CACHE_TTL = float(os.getenv("AWS_MCP_CACHE_TTL", "60"))
+
+    # Seconds before an AMI catalog fetches images created since its last refresh
+    AMI_CATALOG_TTL = float(os.getenv("AWS_MCP_AMI_CATALOG_TTL", "900"))
+
+    # Seconds before the tag index reloads a resource type to catch outside tag edits
+    TAG_INDEX_TTL = float(os.getenv("AWS_MCP_TAG_INDEX_TTL", "300"))
+
+    # Seconds before compiled security group rules are reloaded to catch outside edits
+    SG_INDEX_TTL = float(os.getenv("AWS_MCP_SG_INDEX_TTL", "300"))
+
+    # Seconds before a region's VPC topology graph is rebuilt
+    TOPOLOGY_TTL = float(os.getenv("AWS_MCP_TOPOLOGY_TTL", "300"))
+
+    # Seconds between inventory change feed syncs of a region being watched
+    CHANGE_FEED_INTERVAL = float(os.getenv("AWS_MCP_CHANGE_FEED_INTERVAL", "60"))
+
+    # Local pricing index built from the AWS bulk price list
+    # (python -m mcp_server.aws.pricing_index ingest <offer file>)
+    PRICING_INDEX_PATH = os.path.expanduser(
+        os.getenv("AWS_MCP_PRICING_INDEX", "~/.cache/aws-mcp/pricing.sqlite3")
+    )
@@ -0,0 +1,151 @@
+"""
+Bounded execution for blocking tool bodies.
+
+Every tool is a plain sync function doing boto3 network I/O. Run inline on the
+event loop, one slow call stalls every other call on the connection. The
+executor turns each tool into a coroutine that waits for a per-service and a
+per-region slot on the event loop, then runs the body on a shared thread pool.
+Waiting for a slot never ties up a worker thread.
+
+Long polls (``long_poll``) block for minutes by design. They take neither a
+service nor a region slot, which short calls would queue behind; instead at
+most ``AWS_MCP_MAX_WAITERS`` of them hold a worker at once.
+"""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from mcp_server.core.config import Settings
+from mcp_server.core.metrics import metrics
+from mcp_server.utils.responses import dumps
+
+
+def long_poll(fn):
+    """Mark a tool that blocks until something changes or a timeout passes."""
+    fn.long_poll = True
+    return fn
+
+
+class ToolExecutor:
+    def __init__(
+        self,
+        max_workers: int = Settings.TOOL_MAX_WORKERS,
+        service_limits: Optional[Dict[str, int]] = None,
+        region_limits: Optional[Dict[str, int]] = None,
+        default_service_limit: int = Settings.DEFAULT_SERVICE_CONCURRENCY,
+        default_region_limit: int = Settings.DEFAULT_REGION_CONCURRENCY,
+        max_waiters: int = Settings.MAX_WAITERS,
+    ):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aws-mcp-tool")
+        self._service_limits = dict(Settings.SERVICE_CONCURRENCY if service_limits is None else service_limits)
+        self._region_limits = dict(Settings.REGION_CONCURRENCY if region_limits is None else region_limits)
+        self._default_service_limit = default_service_limit
+        self._default_region_limit = default_region_limit
+        self._max_waiters = max_waiters
+
+        # asyncio semaphores belong to one event loop, so keep a set per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self, kind: str, key: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+
+        sem = per_loop.get((kind, key))
+        if sem is None:
+            if kind == "service":
+                limit = self._service_limits.get(key, self._default_service_limit)
+            elif kind == "region":
+                limit = self._region_limits.get(key, self._default_region_limit)
+            else:
+                limit = self._max_waiters
+            sem = asyncio.Semaphore(limit)
+            per_loop[(kind, key)] = sem
+        return sem
+
+    async def submit(self, fn: Callable[..., Any], slots: Tuple[Tuple[str, str], ...], /, *args, **kwargs):
+        """Run ``fn`` on the worker pool once every (kind, key) slot in ``slots`` is free."""
+        async with contextlib.AsyncExitStack() as stack:
+            for kind, key in slots:
+                await stack.enter_async_context(self._semaphore(kind, key))
+            return await self._run(fn, *args, **kwargs)
+
+    async def _run(self, fn, /, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+
+    def wrap(
+        self,
+        fn: Callable[..., Any],
+        service: str,
+        render: Optional[Callable[[Any], Any]] = None,
+        name: Optional[str] = None,
+    ) -> Callable[..., Any]:
+        """
+        Wrap a sync tool function as a coroutine. functools.wraps keeps the
+        original signature, which FastMCP uses to validate arguments.
+        ``render`` post-processes the result on the worker thread, so encoding
+        large responses does not block the event loop either. Every call is
+        recorded in ``metrics`` under ``name`` (defaults to the function name).
+        """
+        name = name or fn.__name__
+
+        def body(*args, **kwargs):
+            result = fn(*args, **kwargs)
+            error = "error_response" if isinstance(result, dict) and "error" in result else None
+            if render is not None:
+                result = render(result)
+            return result, error, _response_size(result)
+
+        if getattr(fn, "long_poll", False):
+            slots: Tuple[Tuple[str, str], ...] = (("waiters", "*"),)
+            regional = False
+        elif getattr(fn, "coalesced", False):
+            # Coalesced lookups share one AWS request per batch; queuing them
+            # behind a service or region slot would split the batch
+            slots, regional = (), False
+        else:
+            slots = (("service", service),)
+            # Tools without a region argument never take a region slot
+            regional = "region" in inspect.signature(fn).parameters
+
+        @functools.wraps(fn)
+        async def run(*args, **kwargs):
+            region_slot = (("region", kwargs.get("region") or Settings.DEFAULT_REGION),) if regional else ()
+            start = time.perf_counter()
+            try:
+                result, error, size = await self.submit(body, slots + region_slot, *args, **kwargs)
+            except Exception as e:
+                metrics.observe_tool(name, time.perf_counter() - start, type(e).__name__, _request_size(kwargs))
+                raise
+            metrics.observe_tool(name, time.perf_counter() - start, error, _request_size(kwargs), size)
+            return result
+
+        return run
+
+    def wrap_tool(self, tool, service: str, render: Optional[Callable[[Any], Any]] = None):
+        return tool.model_copy(update={"fn": self.wrap(tool.fn, service, render, tool.name)})
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+def _request_size(kwargs: Dict[str, Any]) -> int:
+    return len(dumps(kwargs)) if kwargs else 0
+
+
+def _response_size(result: Any) -> int:
+    # Rendered results carry their encoded JSON as text content
+    content = getattr(result, "content", None)
+    if content:
+        return sum(len(getattr(block, "text", "") or "") for block in content)
+    return 0
+
+
+# Shared executor used by ToolRegistry
+executor = ToolExecutor()
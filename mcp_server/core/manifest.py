@@ -0,0 +1,104 @@
+"""
+Precomputed tool manifest.
+
+Importing every tool module pulls in boto3 and builds dozens of Pydantic JSON
+schemas, which dominates server start-up. The manifest records each tool's
+name, description, parameter schema and defining module, so the server can
+advertise tools immediately and import a module on first use
+(see ``ToolRegistry.load_lazy_tools``).
+
+The manifest carries a fingerprint of the tool and model sources; a manifest
+that no longer matches them is ignored. Rebuild after changing a tool:
+
+    python -m mcp_server.core.manifest build
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = Path(os.getenv("AWS_MCP_MANIFEST", PACKAGE_DIR / "tool_manifest.json"))
+MANIFEST_VERSION = 1
+
+# Sources that change what the manifest describes
+_FINGERPRINT_DIRS = ("tools", "models")
+
+
+def source_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for dirname in _FINGERPRINT_DIRS:
+        for path in sorted((PACKAGE_DIR / dirname).rglob("*.py")):
+            digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Import every service module and describe its tools."""
+    from mcp_server.core.registry import SERVICE_MODULES, _service_name
+
+    entries = []
+    for module_name in SERVICE_MODULES:
+        mod = importlib.import_module(module_name)
+        for tool in getattr(mod, "tools", None) or []:
+            entries.append({
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.parameters,
+                "module": tool.fn.__module__,
+                "service": _service_name(module_name),
+            })
+
+    return {
+        "version": MANIFEST_VERSION,
+        "fingerprint": source_fingerprint(),
+        "tools": entries,
+    }
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    return manifest
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """Return the manifest, or None when it is missing, unreadable or stale."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    if manifest.get("fingerprint") != source_fingerprint():
+        return None
+    return manifest
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or check the tool manifest")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--path", type=Path, default=MANIFEST_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        manifest = write_manifest(args.path)
+        print(f"Wrote {len(manifest['tools'])} tools to {args.path}")
+        return 0
+
+    if load_manifest(args.path) is None:
+        print(f"{args.path} is missing or stale; run: python -m mcp_server.core.manifest build")
+        return 1
+    print(f"{args.path} is up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
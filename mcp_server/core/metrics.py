@@ -0,0 +1,271 @@
+"""
+In-process latency and traffic metrics.
+
+Two families are recorded:
+
+* tools: every tool invocation, timed from the moment the server hands the
+  call to the executor (slot waits included) to the rendered response, with
+  argument and response sizes and error counts.
+* aws: every HTTP attempt a pooled botocore client makes, timed from send to
+  response (client-side rate-limit waits excluded), with request/response
+  sizes, error codes and retries.
+
+Each series keeps counters and a fixed-bucket latency histogram, so recording
+is a dict lookup, a bisect and a few additions under one lock. ``snapshot``
+feeds the ``server.stats`` tool; ``render_prometheus`` produces the text
+exposition format, served over HTTP when AWS_MCP_METRICS_PORT is set.
+
+This module must stay free of boto3 imports: the registry loads it at start-up.
+"""
+
+import bisect
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds; the last bucket is +Inf
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_thread = threading.local()
+
+
+class Series:
+    __slots__ = ("calls", "errors", "retries", "bytes_in", "bytes_out", "seconds", "buckets", "error_codes")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+        self.error_codes: Dict[str, int] = {}
+
+    def observe(self, seconds: float, error: Optional[str], bytes_in: int, bytes_out: int):
+        self.calls += 1
+        self.seconds += seconds
+        self.buckets[bisect.bisect_left(DURATION_BUCKETS, seconds)] += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        if error:
+            self.errors += 1
+            self.error_codes[error] = self.error_codes.get(error, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating inside the histogram bucket."""
+        if not self.calls:
+            return None
+        rank = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            if seen + count >= rank and count:
+                lower = DURATION_BUCKETS[i - 1] if i else 0.0
+                upper = DURATION_BUCKETS[i] if i < len(DURATION_BUCKETS) else DURATION_BUCKETS[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return DURATION_BUCKETS[-1]
+
+    def summary(self) -> Dict[str, Any]:
+        def ms(value):
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "mean_ms": ms(self.seconds / self.calls) if self.calls else None,
+            "p50_ms": ms(self.quantile(0.5)),
+            "p95_ms": ms(self.quantile(0.95)),
+            "p99_ms": ms(self.quantile(0.99)),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "error_codes": dict(self.error_codes),
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[str, Series] = {}
+        self._aws: Dict[Tuple[str, str, str], Series] = {}
+        self.started_at = time.time()
+
+    # -- recording ---------------------------------------------------------------
+
+    def observe_tool(self, name: str, seconds: float, error: Optional[str], bytes_in: int = 0, bytes_out: int = 0):
+        with self._lock:
+            series = self._tools.get(name)
+            if series is None:
+                series = self._tools[name] = Series()
+            series.observe(seconds, error, bytes_in, bytes_out)
+
+    def observe_aws(
+        self,
+        service: str,
+        operation: str,
+        region: str,
+        seconds: float,
+        error: Optional[str],
+        retry: bool,
+        bytes_sent: int,
+        bytes_received: int,
+    ):
+        key = (service, operation, region)
+        with self._lock:
+            series = self._aws.get(key)
+            if series is None:
+                series = self._aws[key] = Series()
+            series.observe(seconds, error, bytes_received, bytes_sent)
+            if retry:
+                series.retries += 1
+
+    # -- botocore event handlers ---------------------------------------------------
+
+    def attach(self, client, region: str):
+        """Time every HTTP attempt ``client`` makes."""
+        service = client.meta.service_model.service_name
+        service_id = client.meta.service_model.service_id.hyphenize()
+
+        def sent(request, **kwargs):
+            # Attempts run sequentially on the calling thread, so a
+            # thread-local is enough to pair each send with its response
+            body = request.body
+            _thread.sent = (time.perf_counter(), len(body) if isinstance(body, (bytes, str)) else 0)
+
+        def received(response_dict, parsed_response, context, exception, event_name, **kwargs):
+            start = getattr(_thread, "sent", None)
+            if start is None:
+                return
+            _thread.sent = None
+
+            error = None
+            bytes_received = 0
+            if response_dict is not None:
+                body = response_dict.get("body")
+                bytes_received = len(body) if isinstance(body, (bytes, str)) else 0
+                if response_dict.get("status_code", 200) >= 300:
+                    error = (parsed_response or {}).get("Error", {}).get("Code") or str(response_dict["status_code"])
+            elif exception is not None:
+                error = type(exception).__name__
+
+            attempt = (context.get("retries") or {}).get("attempt", 1)
+            self.observe_aws(
+                service,
+                event_name.rsplit(".", 1)[-1],
+                region,
+                time.perf_counter() - start[0],
+                error,
+                attempt > 1,
+                start[1],
+                bytes_received,
+            )
+
+        events = client.meta.events
+        events.register(f"before-send.{service_id}", sent)
+        events.register(f"response-received.{service_id}", received)
+
+    # -- reporting -------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "tools": {name: series.summary() for name, series in sorted(self._tools.items())},
+                "aws": [
+                    {"service": service, "operation": operation, "region": region, **series.summary()}
+                    for (service, operation, region), series in sorted(self._aws.items())
+                ],
+            }
+
+    def render_prometheus(self, extra: Optional[List[str]] = None) -> str:
+        lines: List[str] = []
+        with self._lock:
+            _render_family(lines, "aws_mcp_tool", "tool", self._tools, lambda name: {"tool": name})
+            _render_family(
+                lines, "aws_mcp_aws_request", "AWS HTTP", self._aws,
+                lambda key: {"service": key[0], "operation": key[1], "region": key[2]},
+            )
+        lines.extend(extra or [])
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._tools.clear()
+            self._aws.clear()
+            self.started_at = time.time()
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _render_family(lines: List[str], prefix: str, what: str, family: Dict[Any, Series], labels_for):
+    lines.append(f"# HELP {prefix}_duration_seconds {what} call latency")
+    lines.append(f"# TYPE {prefix}_duration_seconds histogram")
+    for key, series in family.items():
+        labels = labels_for(key)
+        cumulative = 0
+        for bound, count in zip((*DURATION_BUCKETS, "+Inf"), series.buckets):
+            cumulative += count
+            lines.append(f"{prefix}_duration_seconds_bucket{_labels({**labels, 'le': str(bound)})} {cumulative}")
+        lines.append(f"{prefix}_duration_seconds_sum{_labels(labels)} {series.seconds:.6f}")
+        lines.append(f"{prefix}_duration_seconds_count{_labels(labels)} {series.calls}")
+
+    for name, attr in (("errors", "errors"), ("retries", "retries"), ("bytes_in", "bytes_in"), ("bytes_out", "bytes_out")):
+        lines.append(f"# TYPE {prefix}_{name}_total counter")
+        for key, series in family.items():
+            lines.append(f"{prefix}_{name}_total{_labels(labels_for(key))} {getattr(series, attr)}")
+
+
+# Process-wide metrics shared by the executor and every pooled client
+metrics = Metrics()
+
+
+# =======================================================
+# PROMETHEUS ENDPOINT
+# =======================================================
+def _prometheus_text() -> str:
+    # Throttling and client-pool gauges live with their owners; they are only
+    # loaded once some tool has touched AWS
+    extra: List[str] = []
+    throttle = sys.modules.get("mcp_server.aws.throttle")
+    if throttle is not None:
+        stats = throttle.throttle_stats()
+        extra += [
+            "# TYPE aws_mcp_throttled_total counter",
+            f"aws_mcp_throttled_total {stats['throttled']}",
+            "# TYPE aws_mcp_rate_limit_wait_seconds_total counter",
+            f"aws_mcp_rate_limit_wait_seconds_total {stats['wait_seconds']}",
+        ]
+    return metrics.render_prometheus(extra)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = _prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_prometheus(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve /metrics in the Prometheus text format from a daemon thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="aws-mcp-metrics", daemon=True).start()
+    return server
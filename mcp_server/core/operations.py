@@ -0,0 +1,311 @@
+"""
+Long-running operation handles.
+
+Tools that start slow AWS work (snapshots, snapshot copies, AMIs, instance
+launches) register the resulting resource IDs here and return an
+``operation_id``. A single background poller then watches every outstanding
+resource: all pending snapshot, image and instance IDs of a region are checked
+with one describe call per resource kind, instead of each agent spinning on
+its own describe tool.
+
+Polling backs off per (region, kind) while nothing changes and speeds up again
+as soon as a resource moves. Throttling doubles the interval. Callers read
+state with ``status`` or block on ``wait``; both are served from memory.
+"""
+
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_FILTER_VALUES
+from mcp_server.core.cache import inventory_cache
+from mcp_server.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MIN_POLL_INTERVAL = 2.0
+MAX_POLL_INTERVAL = 30.0
+BACKOFF_FACTOR = 1.5
+
+# A resource can be missing from describe calls for a while after it is created
+NOT_FOUND_GRACE = 60.0
+
+# Finished operations are kept this long for status/wait calls
+RETENTION_SECONDS = 3600.0
+
+PENDING, SUCCEEDED, FAILED = "pending", "succeeded", "failed"
+
+
+def _snapshot_state(item: Dict[str, Any]) -> Tuple[str, str, Optional[float]]:
+    state = item.get("State", "pending")
+    progress = item.get("Progress", "").rstrip("%")
+    outcome = SUCCEEDED if state == "completed" else FAILED if state == "error" else PENDING
+    return outcome, state, float(progress) if progress else None
+
+
+def _image_state(item: Dict[str, Any]) -> Tuple[str, str, Optional[float]]:
+    state = item.get("State", "pending")
+    if state == "available":
+        return SUCCEEDED, state, 100.0
+    if state in ("failed", "invalid", "deregistered", "error"):
+        return FAILED, state, None
+    return PENDING, state, None
+
+
+def _instance_state(item: Dict[str, Any]) -> Tuple[str, str, Optional[float]]:
+    state = item.get("State", {}).get("Name", "pending")
+    if state == "running":
+        return SUCCEEDED, state, 100.0
+    if state == "pending":
+        return PENDING, state, None
+    # A launch that ends stopping, stopped, shutting-down or terminated did not come up
+    return FAILED, state, None
+
+
+def _describe_snapshots(ec2, ids: List[str]):
+    for page in ec2.get_paginator("describe_snapshots").paginate(
+        Filters=[{"Name": "snapshot-id", "Values": ids}]
+    ):
+        for snapshot in page.get("Snapshots", []):
+            yield snapshot["SnapshotId"], snapshot
+
+
+def _describe_images(ec2, ids: List[str]):
+    for page in ec2.get_paginator("describe_images").paginate(
+        Filters=[{"Name": "image-id", "Values": ids}]
+    ):
+        for image in page.get("Images", []):
+            yield image["ImageId"], image
+
+
+def _describe_instances(ec2, ids: List[str]):
+    for page in ec2.get_paginator("describe_instances").paginate(
+        Filters=[{"Name": "instance-id", "Values": ids}]
+    ):
+        for reservation in page.get("Reservations", []):
+            for instance in reservation.get("Instances", []):
+                yield instance["InstanceId"], instance
+
+
+# kind -> (describe, state mapper, inventory cache resource type)
+KINDS: Dict[str, Tuple[Callable, Callable, str]] = {
+    "snapshot": (_describe_snapshots, _snapshot_state, "snapshots"),
+    "image": (_describe_images, _image_state, "images"),
+    "instance": (_describe_instances, _instance_state, "instances"),
+}
+
+
+class Operation:
+    def __init__(self, kind: str, region: str, resource_ids: List[str], source: str):
+        self.id = f"op-{uuid.uuid4().hex[:16]}"
+        self.kind = kind
+        self.region = region
+        self.source = source
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.resources: Dict[str, Dict[str, Any]] = {
+            rid: {"outcome": PENDING, "state": "pending", "progress": None}
+            for rid in resource_ids
+        }
+
+    @property
+    def status(self) -> str:
+        outcomes = {r["outcome"] for r in self.resources.values()}
+        if PENDING in outcomes:
+            return PENDING
+        return FAILED if FAILED in outcomes else SUCCEEDED
+
+    def progress(self) -> float:
+        values = [
+            100.0 if r["outcome"] != PENDING else (r["progress"] or 0.0)
+            for r in self.resources.values()
+        ]
+        return round(sum(values) / len(values), 1) if values else 100.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operation_id": self.id,
+            "kind": self.kind,
+            "region": self.region,
+            "source": self.source,
+            "status": self.status,
+            "progress_percent": self.progress(),
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round((self.finished_at or time.time()) - self.created_at, 1),
+            "resources": {
+                rid: {k: v for k, v in r.items() if k != "outcome" and v is not None}
+                for rid, r in self.resources.items()
+            },
+        }
+
+
+class OperationRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._ops: Dict[str, Operation] = {}
+        self._intervals: Dict[Tuple[str, str], float] = {}
+        self._next_poll: Dict[Tuple[str, str], float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._polls = 0
+
+    # -- public API ---------------------------------------------------------
+
+    def start(self, kind: str, region: str, resource_ids: List[str], source: str) -> str:
+        """Track ``resource_ids`` until they settle; returns the operation id."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown operation kind: {kind}")
+
+        op = Operation(kind, region, list(dict.fromkeys(resource_ids)), source)
+        with self._changed:
+            self._ops[op.id] = op
+            group = (region, kind)
+            self._intervals[group] = MIN_POLL_INTERVAL
+            self._next_poll[group] = min(
+                self._next_poll.get(group, float("inf")), time.monotonic() + MIN_POLL_INTERVAL
+            )
+            self._ensure_poller()
+            self._changed.notify_all()
+        return op.id
+
+    def status(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            op = self._ops.get(operation_id)
+            return op.to_dict() if op else None
+
+    def wait(self, operation_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Block until the operation settles or ``timeout`` seconds pass."""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            op = self._ops.get(operation_id)
+            if op is None:
+                return None
+            while op.status == PENDING:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return op.to_dict()
+
+    def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [op.to_dict() for op in self._ops.values() if status is None or op.status == status]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = [op for op in self._ops.values() if op.status == PENDING]
+            return {
+                "operations": len(self._ops),
+                "pending": len(pending),
+                "polls": self._polls,
+                "poll_intervals": {f"{r}/{k}": round(v, 1) for (r, k), v in self._intervals.items()},
+            }
+
+    # -- poller -------------------------------------------------------------
+
+    def _ensure_poller(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="aws-mcp-ops-poller", daemon=True)
+            self._thread.start()
+
+    def _pending_groups(self) -> Dict[Tuple[str, str], List[str]]:
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for op in self._ops.values():
+            for rid, resource in op.resources.items():
+                if resource["outcome"] == PENDING:
+                    groups.setdefault((op.region, op.kind), []).append(rid)
+        return {group: list(dict.fromkeys(ids)) for group, ids in groups.items()}
+
+    def _run(self):
+        while True:
+            with self._changed:
+                self._expire()
+                groups = self._pending_groups()
+                if not groups:
+                    # Nothing to watch; a new operation restarts the thread
+                    self._thread = None
+                    return
+
+                now = time.monotonic()
+                due = [g for g in groups if self._next_poll.get(g, now) <= now]
+                if not due:
+                    wake = min(self._next_poll.get(g, now) for g in groups)
+                    self._changed.wait(max(0.0, wake - now))
+                    continue
+
+            for group in due:
+                self._poll(group, groups[group])
+
+    def _poll(self, group: Tuple[str, str], ids: List[str]):
+        region, kind = group
+        describe, mapper, resource_type = KINDS[kind]
+        ec2 = get_ec2_client(region)
+
+        seen: Dict[str, Dict[str, Any]] = {}
+        complete = throttled = False
+        try:
+            for start in range(0, len(ids), MAX_FILTER_VALUES):
+                seen.update(describe(ec2, ids[start:start + MAX_FILTER_VALUES]))
+            complete = True
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code", "")
+            throttled = "Throttl" in code or code == "RequestLimitExceeded"
+            logger.warning(f"Polling {kind}s in {region} failed: {e}")
+        except Exception as e:
+            logger.warning(f"Polling {kind}s in {region} failed: {e}")
+
+        settled: List[str] = []
+        with self._changed:
+            self._polls += 1
+            changed = False
+            now = time.time()
+            for op in self._ops.values():
+                if (op.region, op.kind) != group:
+                    continue
+                for rid, resource in op.resources.items():
+                    if resource["outcome"] != PENDING:
+                        continue
+                    item = seen.get(rid)
+                    if item is None:
+                        # Only a complete describe proves the resource is gone
+                        if complete and now - op.created_at > NOT_FOUND_GRACE:
+                            resource.update(outcome=FAILED, state="not-found")
+                            changed = True
+                        continue
+                    outcome, state, progress = mapper(item)
+                    if (outcome, state, progress) != (resource["outcome"], resource["state"], resource["progress"]):
+                        resource.update(outcome=outcome, state=state, progress=progress)
+                        changed = True
+                        if outcome != PENDING:
+                            settled.append(rid)
+                if op.status != PENDING and op.finished_at is None:
+                    op.finished_at = now
+
+            interval = self._intervals.get(group, MIN_POLL_INTERVAL)
+            if throttled:
+                interval = min(MAX_POLL_INTERVAL, interval * 2)
+            elif changed:
+                interval = MIN_POLL_INTERVAL
+            else:
+                interval = min(MAX_POLL_INTERVAL, interval * BACKOFF_FACTOR)
+            self._intervals[group] = interval
+            self._next_poll[group] = time.monotonic() + interval
+
+            if changed:
+                self._changed.notify_all()
+
+        if settled:
+            inventory_cache.invalidate(region, resource_type, settled)
+
+    def _expire(self):
+        cutoff = time.time() - RETENTION_SECONDS
+        for op_id in [i for i, op in self._ops.items() if op.finished_at and op.finished_at < cutoff]:
+            del self._ops[op_id]
+
+
+operations = OperationRegistry()
@@ -1,28 +1,83 @@
+import asyncio
 import importlib
 import sys
+import threading
+from typing import Any, Dict, Optional
+
+from fastmcp.tools import Tool, ToolResult
+from pydantic import PrivateAttr
+
 import mcp_server.tools
+from mcp_server.core.executor import executor
+from mcp_server.utils.responses import render
+
+# Only load from service-level modules that have implementations
+# This avoids duplicate registration from individual tool files
+SERVICE_MODULES = [
+    "mcp_server.tools.ec2",
+    "mcp_server.tools.ebs",
+    "mcp_server.tools.vpc",
+    "mcp_server.tools.inventory",
+    "mcp_server.tools.ops",
+    "mcp_server.tools.server",
+    # Add more service modules as they are implemented:
+    # "mcp_server.tools.ecs",
+    # "mcp_server.tools.ecr",
+    # "mcp_server.tools.lambda_tools",
+    # "mcp_server.tools.s3",
+    # "mcp_server.tools.cloudwatch",
+]
+
+
+def _service_name(module_name: str) -> str:
+    return module_name.rsplit(".", 1)[-1]
+
+
+class LazyTool(Tool):
+    """
+    A tool advertised from the manifest. The module defining it (and with it
+    boto3 and the Pydantic models) is imported on the first call.
+    """
+
+    module: str
+    service: str
+
+    _target: Optional[Tool] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def resolve(self) -> Tool:
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = ToolRegistry.resolve_tool(self.name, self.module, self.service)
+        return self._target
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        target = self._target
+        if target is None:
+            # Imports block; keep them off the event loop
+            target = await asyncio.get_running_loop().run_in_executor(None, self.resolve)
+        return await target.run(arguments)
 
 
 class ToolRegistry:
+    @staticmethod
+    def wrap(tool, service: str):
+        """
+        Wrap a tool so its blocking body runs on the shared bounded executor
+        and its result goes through the central response encoder.
+        """
+        return executor.wrap_tool(tool, service, render)
+
     @staticmethod
     def load_all_tools():
+        """
+        Import every service module and return its tools, wrapped for the
+        executor and the response encoder.
+        """
         all_tools = []
-        
-        # Only load from service-level modules that have implementations
-        # This avoids duplicate registration from individual tool files
-        service_modules = [
-            "mcp_server.tools.ec2",
-            "mcp_server.tools.ebs",
-            "mcp_server.tools.vpc"
-            # Add more service modules as they are implemented:
-            # "mcp_server.tools.ecs",
-            # "mcp_server.tools.ecr",
-            # "mcp_server.tools.lambda_tools",
-            # "mcp_server.tools.s3",
-            # "mcp_server.tools.cloudwatch",
-        ]
 
-        for module_name in service_modules:
+        for module_name in SERVICE_MODULES:
             print(f"[Registry] Loading service module: {module_name}", file=sys.stderr)
 
             try:
@@ -32,12 +87,49 @@ class ToolRegistry:
                 continue
 
             tools_list = getattr(mod, "tools", None)
-            
+
             if tools_list:
                 print(f"[Registry] Found {len(tools_list)} tools from {module_name}", file=sys.stderr)
-                all_tools.extend(tools_list)
+                service = _service_name(module_name)
+                all_tools.extend(ToolRegistry.wrap(tool, service) for tool in tools_list)
             else:
                 print(f"[Registry] No tools found in {module_name}", file=sys.stderr)
 
         print(f"[Registry] Total tools loaded: {len(all_tools)}", file=sys.stderr)
         return all_tools
+
+    @staticmethod
+    def load_lazy_tools():
+        """
+        Return tools described by the on-disk manifest without importing any
+        tool module. Falls back to load_all_tools when the manifest is missing
+        or older than the tool sources.
+        """
+        from mcp_server.core.manifest import load_manifest
+
+        manifest = load_manifest()
+        if manifest is None:
+            print("[Registry] Tool manifest missing or stale, loading tools eagerly", file=sys.stderr)
+            return ToolRegistry.load_all_tools()
+
+        tools = [
+            LazyTool(
+                name=entry["name"],
+                description=entry.get("description"),
+                parameters=entry["parameters"],
+                module=entry["module"],
+                service=entry["service"],
+            )
+            for entry in manifest["tools"]
+        ]
+        print(f"[Registry] Total tools advertised from manifest: {len(tools)}", file=sys.stderr)
+        return tools
+
+    @staticmethod
+    def resolve_tool(name: str, module_name: str, service: str):
+        """Import the module defining ``name`` and return the wrapped tool."""
+        mod = importlib.import_module(module_name)
+        for tool in getattr(mod, "tools", None) or []:
+            if tool.name == name:
+                return ToolRegistry.wrap(tool, service)
+        raise LookupError(f"Tool {name} not found in {module_name}; rebuild the tool manifest")
@@ -0,0 +1,45 @@
+"""Models shared across services."""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+
+class PaginationParams(BaseModel):
+    max_results: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of items to return in one call (defaults to 100).",
+    )
+    next_token: Optional[str] = Field(
+        default=None,
+        description="next_token from a previous response, to fetch the following page.",
+    )
+
+
+class MultiRegionParams(BaseModel):
+    regions: Optional[List[str]] = Field(
+        default=None,
+        description="Query several regions at once, e.g. ['us-east-1', 'eu-west-1'] or ['*'] for all enabled regions. Overrides region.",
+    )
+    region_timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds to wait for each region before reporting it as timed out (defaults to 20).",
+    )
+
+
+class ConsistencyParams(BaseModel):
+    consistent: bool = Field(
+        default=False,
+        description="If true, bypass the inventory cache and read straight from AWS.",
+    )
+
+
+class FieldsParams(BaseModel):
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Only return these fields. Accepts dotted paths (e.g. 'State.Name', "
+            "'NetworkInterfaces.PrivateIpAddress') and presets: 'summary' for every "
+            "resource, plus 'network'/'storage' for instances and 'attachments' for volumes."
+        ),
+    )
@@ -6,6 +6,7 @@ from .volume import (
     ModifyVolumeParams,
     DeleteVolumeParams,
     DescribeVolumeParams,
+    EstimateVolumeCostParams,
 )
 
 from .attachment import (
@@ -15,6 +16,7 @@ from .attachment import (
 
 from .snapshot_models import (
     SnapshotIdParam,
+    SnapshotProgressParams,
     ListSnapshotsParams,
     DeleteSnapshotParams,
     CopySnapshotParams,
@@ -30,6 +32,7 @@ __all__ = [
     "ModifyVolumeParams",
     "DeleteVolumeParams",
     "DescribeVolumeParams",
+    "EstimateVolumeCostParams",
     
     # Attachment models
     "AttachVolumeParams",
@@ -37,6 +40,7 @@ __all__ = [
     
     # Snapshot models
     "SnapshotIdParam",
+    "SnapshotProgressParams",
     "ListSnapshotsParams",
     "DeleteSnapshotParams",
     "CopySnapshotParams",
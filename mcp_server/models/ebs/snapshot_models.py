@@ -3,6 +3,8 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 
+from mcp_server.models.common import PaginationParams, MultiRegionParams, ConsistencyParams, FieldsParams
+
 
 class RegionOnlyParams(BaseModel):
     region: str = Field(default="ap-south-1")
@@ -13,10 +15,26 @@ class SnapshotIdParam(BaseModel):
     SnapshotId: str
 
 
-class ListSnapshotsParams(BaseModel):
+class ListSnapshotsParams(PaginationParams, MultiRegionParams, ConsistencyParams, FieldsParams):
     region: str = Field(default="ap-south-1")
-    OwnerIds: Optional[List[str]] = None   # ["self"]
+    OwnerIds: Optional[List[str]] = Field(
+        default=None,
+        description="Snapshot owners (account IDs, 'self', 'amazon'). Defaults to ['self'] unless Filters name an owner.",
+    )
     Filters: Optional[List[Dict[str, Any]]] = None
+    aggregate_by: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Summarize every matching snapshot instead of listing them: counts and total GiB "
+            "per 'volume', 'age', 'encrypted', 'state', 'storage_tier', 'owner' or 'tag:<Key>'"
+        ),
+    )
+
+
+class SnapshotProgressParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    SnapshotId: Optional[str] = None
+    SnapshotIds: Optional[List[str]] = None
 
 
 class DeleteSnapshotParams(BaseModel):
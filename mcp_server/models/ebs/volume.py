@@ -3,6 +3,8 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 
+from mcp_server.models.common import PaginationParams, MultiRegionParams, ConsistencyParams, FieldsParams
+
 
 class RegionOnlyParams(BaseModel):
     region: str = Field(default="ap-south-1")
@@ -36,7 +38,18 @@ class DeleteVolumeParams(BaseModel):
     VolumeId: str
 
 
-class DescribeVolumeParams(BaseModel):
+class DescribeVolumeParams(PaginationParams, MultiRegionParams, ConsistencyParams, FieldsParams):
     region: str = Field(default="ap-south-1")
     VolumeId: Optional[str] = None
     Filters: Optional[List[Dict[str, Any]]] = None
+
+
+class EstimateVolumeCostParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    VolumeType: str = Field(default="gp3", description="gp2 | gp3 | io1 | io2 | st1 | sc1 | standard")
+    Size: int = Field(..., ge=1, description="Size in GiB")
+    Iops: Optional[int] = Field(default=None, description="Provisioned IOPS (gp3, io1, io2)")
+    Throughput: Optional[int] = Field(default=None, description="Provisioned throughput in MiB/s (gp3)")
+    SnapshotSize: Optional[int] = Field(default=None, description="GiB of snapshot data to keep")
+    SnapshotTier: str = Field(default="standard", description="standard | archive")
+    CopyToRegion: Optional[str] = Field(default=None, description="Region the snapshot data is copied to")
@@ -1,9 +1,11 @@
 # Re-export all models for backward compatibility
 from .list import (
+    ListRunningEC2Params,
     ListEC2ParamsTagwise,
     EC2ListFilters,
     ListEC2Params,
     GetInstanceDetailsParams,
+    GetInstanceStatusParams,
     ListSpotRequestsParams,
     GetSpotRequestDetailsParams,
     CancelSpotRequestParams,
@@ -38,6 +40,8 @@ from .security_group import (
     ModifyRulesParams,
     DescribeSGParams,
     ListSGParams,
+    FindSGExposureParams,
+    AnalyzeSGRulesParams,
 )
 
 from .launch_templates import (
@@ -54,10 +58,12 @@ from .launch_templates import (
 
 __all__ = [
     # List models
+    "ListRunningEC2Params",
     "ListEC2ParamsTagwise",
     "EC2ListFilters",
     "ListEC2Params",
     "GetInstanceDetailsParams",
+    "GetInstanceStatusParams",
     "ListSpotRequestsParams",
     "GetSpotRequestDetailsParams",
     "CancelSpotRequestParams",
@@ -88,6 +94,8 @@ __all__ = [
     "ModifyRulesParams",
     "DescribeSGParams",
     "ListSGParams",
+    "FindSGExposureParams",
+    "AnalyzeSGRulesParams",
     
     # Launch template models
     "LaunchTemplateTag",
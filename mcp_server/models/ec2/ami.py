@@ -3,6 +3,8 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 
+from mcp_server.models.common import PaginationParams, MultiRegionParams, FieldsParams
+
 # -------------------------------------------------------
 # CREATE AMI
 # -------------------------------------------------------
@@ -21,7 +23,7 @@ class CreateAMIParams(BaseModel):
 # -------------------------------------------------------
 # DESCRIBE IMAGES
 # -------------------------------------------------------
-class DescribeImagesParams(BaseModel):
+class DescribeImagesParams(PaginationParams, MultiRegionParams, FieldsParams):
     region: str = Field(default="ap-south-1")
     owners: Optional[List[str]] = Field(
         default=None, 
@@ -39,3 +41,20 @@ class DescribeImagesParams(BaseModel):
 class DeregisterAMIParams(BaseModel):
     image_id: str = Field(..., description="AMI ID to deregister")
     region: str = Field(default="ap-south-1")
+
+# -------------------------------------------------------
+# RESOLVE LATEST AMI
+# -------------------------------------------------------
+class ResolveLatestAMIParams(BaseModel):
+    name_pattern: str = Field(..., description="Glob on the AMI name, e.g. 'al2023-ami-2023.*-x86_64'")
+    owner: str = Field(
+        default="amazon",
+        description="amazon | self | aws-marketplace | canonical | debian | redhat | suse | account ID",
+    )
+    architecture: Optional[str] = Field(default="x86_64", description="x86_64 | arm64 | i386 (null for any)")
+    virtualization_type: Optional[str] = Field(default="hvm", description="hvm | paravirtual (null for any)")
+    root_device_type: Optional[str] = Field(default="ebs", description="ebs | instance-store (null for any)")
+    alternatives: int = Field(default=4, ge=0, le=50, description="Next-newest matches to include")
+    refresh: bool = Field(default=False, description="Reload the owner's catalog from AWS before answering")
+    region: str = Field(default="ap-south-1")
+
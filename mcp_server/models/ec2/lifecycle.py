@@ -1,6 +1,7 @@
 """Models for EC2 instance lifecycle operations (start, stop, reboot, terminate)."""
 
 from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
 
 
 class StartInstanceParams(BaseModel):
@@ -9,5 +10,13 @@ class StartInstanceParams(BaseModel):
 
 
 class InstanceLifeCycleParams(BaseModel):
-    instance_id: str = Field(..., description="ID of the EC2 instance")
-    region: str = Field(..., description="AWS region of the instance")
+    instance_id: Optional[str] = Field(default=None, description="ID of the EC2 instance")
+    instance_ids: Optional[List[str]] = Field(
+        default=None,
+        description="IDs of EC2 instances in `region`, sent in batches of up to 1000"
+    )
+    instance_ids_by_region: Optional[Dict[str, List[str]]] = Field(
+        default=None,
+        description="Instance IDs keyed by region, for instances in several regions; regions run concurrently"
+    )
+    region: Optional[str] = Field(default=None, description="AWS region of the instance(s)")
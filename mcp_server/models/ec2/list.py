@@ -3,15 +3,22 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 
+from mcp_server.models.common import PaginationParams, MultiRegionParams, ConsistencyParams, FieldsParams
 
-class ListEC2ParamsTagwise(BaseModel):
-    region: str
+
+class ListRunningEC2Params(PaginationParams, MultiRegionParams, ConsistencyParams):
+    region: Optional[str] = None
+    spot_only: bool = False
+
+
+class ListEC2ParamsTagwise(PaginationParams, MultiRegionParams, ConsistencyParams):
+    region: Optional[str] = None
     tag_key: Optional[str] = None
     tag_value: Optional[str] = None
     spot_only: bool = False
 
 
-class EC2ListFilters(BaseModel):
+class EC2ListFilters(PaginationParams, MultiRegionParams, ConsistencyParams, FieldsParams):
     region: Optional[str] = Field(default=None)
     instance_ids: Optional[List[str]] = Field(default=None)
     states: Optional[List[str]] = Field(default=None)
@@ -49,12 +56,17 @@ class EC2ListFilters(BaseModel):
 ListEC2Params = EC2ListFilters
 
 
-class GetInstanceDetailsParams(BaseModel):
+class GetInstanceDetailsParams(ConsistencyParams, FieldsParams):
+    instance_id: str = Field(..., description="ID of the EC2 instance")
+    region: str = Field(..., description="AWS region of the instance")
+
+
+class GetInstanceStatusParams(ConsistencyParams):
     instance_id: str = Field(..., description="ID of the EC2 instance")
     region: str = Field(..., description="AWS region of the instance")
 
 
-class ListSpotRequestsParams(BaseModel):
+class ListSpotRequestsParams(PaginationParams, MultiRegionParams):
     region: Optional[str] = Field(
         None, description="AWS region to query. Defaults to the global DEFAULT_REGION."
     )
@@ -1,7 +1,9 @@
 # mcp_server/models/ec2/pricing_models.py
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+
+from mcp_server.models.ec2.list import EC2ListFilters
 
 
 class EC2OnDemandPriceParams(BaseModel):
@@ -11,6 +13,11 @@ class EC2OnDemandPriceParams(BaseModel):
         description="Linux | Windows | RHEL | SUSE | Ubuntu"
     )
     region: str = Field(default="ap-south-1")
+    tenancy: str = Field(default="Shared", description="Shared | Dedicated | Host")
+    license_model: Optional[str] = Field(
+        default=None,
+        description="No License required | License Included | Bring your own license"
+    )
 
 
 class SpotPriceHistoryParams(BaseModel):
@@ -23,6 +30,14 @@ class SpotPriceHistoryParams(BaseModel):
     start_time: Optional[str] = Field(default=None)
     end_time: Optional[str] = Field(default=None)
     availability_zone: Optional[str] = None
+    analyze: bool = Field(
+        default=False,
+        description="Return per-AZ statistics over the whole window (default: last 7 days) instead of raw points"
+    )
+    bid_price: Optional[float] = Field(
+        default=None,
+        description="With analyze, report the fraction of time each AZ's price was at or under this bid"
+    )
 
 
 class EC2CostEstimateParams(BaseModel):
@@ -30,3 +45,36 @@ class EC2CostEstimateParams(BaseModel):
     hours_per_month: int = Field(default=720)
     operating_system: str = "Linux"
     region: str = Field(default="ap-south-1")
+    tenancy: str = Field(default="Shared", description="Shared | Dedicated | Host")
+    license_model: Optional[str] = None
+
+
+class ScanSpotPricesParams(BaseModel):
+    instance_types: List[str] = Field(..., min_length=1, description="Instance types to compare, e.g. ['m5.large', 'm6i.large', 'c5.xlarge']")
+    regions: List[str] = Field(
+        default=["ap-south-1"],
+        description="Regions to scan, e.g. ['us-east-1', 'eu-west-1'] or ['*'] for all enabled regions",
+    )
+    product_description: str = Field(default="Linux/UNIX")
+    lookback_hours: float = Field(default=24, gt=0, le=24 * 90, description="How much recent history feeds the mean and max")
+    rank_by: str = Field(default="vcpu", description="vcpu | memory | price")
+    top: int = Field(default=20, ge=1, le=1000, description="Number of ranked options to return")
+    region_timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds to wait for each region before reporting it as timed out (defaults to 20).",
+    )
+
+
+class EstimateFleetCostParams(BaseModel):
+    filters: Optional[EC2ListFilters] = Field(
+        default=None,
+        description="Same filters as ec2.list_ec2_instances (region, regions, states, tags, types...); pagination and fields are ignored",
+    )
+    instances: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Instances from a previous list call, priced as given instead of listing again",
+    )
+    region: str = Field(default="ap-south-1", description="Region of instances that carry no 'region' key")
+    group_by_tag: Optional[str] = Field(default=None, description="Also total costs per value of this tag, e.g. 'team'")
+    include_volumes: bool = Field(default=True, description="Add the monthly cost of attached EBS volumes")
+    hours_per_month: int = Field(default=730)
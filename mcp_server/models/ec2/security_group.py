@@ -3,6 +3,8 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
+from mcp_server.models.common import PaginationParams, MultiRegionParams
+
 
 class IpPermission(BaseModel):
     protocol: str = Field(..., description="tcp | udp | icmp | -1")
@@ -36,5 +38,31 @@ class DescribeSGParams(BaseModel):
     group_name: Optional[str] = None
 
 
-class ListSGParams(BaseModel):
+class ListSGParams(PaginationParams, MultiRegionParams):
+    region: str = Field(default="ap-south-1")
+
+
+class FindSGExposureParams(MultiRegionParams):
+    region: str = Field(default="ap-south-1")
+    port: Optional[int] = Field(default=None, ge=0, le=65535, description="Port to check (the ICMP type for icmp/icmpv6); omit for any port")
+    to_port: Optional[int] = Field(default=None, ge=0, le=65535, description="End of a port range starting at port")
+    protocol: str = Field(default="tcp", description="tcp | udp | icmp | icmpv6 | -1 (any) | protocol number")
+    cidr: Optional[str] = Field(
+        default=None, description="Source (ingress) or destination (egress) range, e.g. 0.0.0.0/0 or 10.2.0.0/16"
+    )
+    source_group: Optional[str] = Field(default=None, description="Security group ID referenced by the rules instead of a CIDR")
+    match: str = Field(
+        default="covers",
+        description="covers: the rule allows the whole cidr (exposure to it) | overlaps: the rule allows any address in it",
+    )
+    direction: str = Field(default="ingress", description="ingress | egress")
+    vpc_id: Optional[str] = Field(default=None, description="Only groups in this VPC")
+    max_results: Optional[int] = Field(default=None, ge=1, description="Maximum number of groups to return (defaults to 100)")
+    refresh: bool = Field(default=False, description="Reload the region's rules from AWS before answering")
+
+
+class AnalyzeSGRulesParams(MultiRegionParams):
     region: str = Field(default="ap-south-1")
+    group_ids: Optional[List[str]] = Field(default=None, description="Groups to check (default: every group in the region)")
+    max_results: Optional[int] = Field(default=None, ge=1, description="Maximum number of groups with findings to return (defaults to 100)")
+    refresh: bool = Field(default=False, description="Reload the region's rules from AWS before answering")
@@ -0,0 +1,47 @@
+"""Models for cross-service inventory tools."""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from mcp_server.core.config import Settings
+from mcp_server.models.common import MultiRegionParams, PaginationParams
+
+
+class QueryTagsParams(PaginationParams, MultiRegionParams):
+    query: str = Field(
+        ...,
+        description=(
+            "Boolean tag query: key=value, key!=value, key=prefix*, key (has key), key* (has a key with "
+            "that prefix), combined with AND, OR, NOT and parentheses, e.g. 'team=payments AND env!=prod'. "
+            "Quote keys or values containing spaces."
+        ),
+    )
+    resource_types: Optional[List[str]] = Field(
+        default=None,
+        description="Subset of instances | volumes | snapshots | security_groups | vpcs | subnets (default: all)",
+    )
+    refresh: bool = Field(default=False, description="Reload the index from AWS before answering")
+    region: str = Field(default="ap-south-1")
+
+
+class InventoryChangesParams(BaseModel):
+    since: Optional[str] = Field(
+        default=None,
+        description="token from a previous call; omit to get a starting token without changes",
+    )
+    resource_types: Optional[List[str]] = Field(
+        default=None,
+        description="Subset of instances | volumes (default: both)",
+    )
+    max_results: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of changes to return in one call (defaults to 100); more=true means call again with the new token.",
+    )
+    wait_seconds: float = Field(
+        default=0,
+        ge=0,
+        le=Settings.MAX_WAIT_SECONDS,
+        description="Wait up to this many seconds for a change before returning an empty list",
+    )
+    region: str = Field(default="ap-south-1")
@@ -0,0 +1,24 @@
+"""Models for long-running operation tools."""
+
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from mcp_server.core.config import Settings
+
+
+class OperationStatusParams(BaseModel):
+    operation_id: str = Field(..., description="operation_id returned by a create/copy/launch tool")
+
+
+class WaitOperationParams(BaseModel):
+    operation_id: str = Field(..., description="operation_id returned by a create/copy/launch tool")
+    timeout_seconds: float = Field(
+        default=60,
+        ge=0,
+        le=Settings.MAX_WAIT_SECONDS,
+        description="Return after this many seconds even if the operation is still pending",
+    )
+
+
+class ListOperationsParams(BaseModel):
+    status: Optional[str] = Field(default=None, description="pending | succeeded | failed")
@@ -0,0 +1,12 @@
+"""Models for server introspection tools."""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class ServerStatsParams(BaseModel):
+    sections: Optional[List[str]] = Field(
+        default=None,
+        description="Subset of tools | aws | throttling | clients | cache | batching | operations | ami_catalog | tag_index | change_feed | topology | sg_rules (default: all)",
+    )
+    reset: bool = Field(default=False, description="Clear tool and AWS call metrics after reading them")
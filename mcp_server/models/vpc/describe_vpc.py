@@ -3,17 +3,27 @@
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from mcp_server.models.common import PaginationParams, MultiRegionParams, ConsistencyParams
+
 
 class RegionOnlyParams(BaseModel):
     region: str = Field(default="ap-south-1")
 
 
-class DescribeVpcParams(BaseModel):
+class ListVpcsParams(PaginationParams, MultiRegionParams):
+    region: str = Field(default="ap-south-1")
+
+
+class ListSubnetsParams(PaginationParams, MultiRegionParams, ConsistencyParams):
+    region: str = Field(default="ap-south-1")
+
+
+class DescribeVpcParams(MultiRegionParams):
     region: str = "ap-south-1"
     vpc_id: Optional[str] = None
 
 
-class DescribeSubnetParams(BaseModel):
+class DescribeSubnetParams(MultiRegionParams):
     region: str = "ap-south-1"
     subnet_id: Optional[str] = None
     vpc_id: Optional[str] = None
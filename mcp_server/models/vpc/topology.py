@@ -0,0 +1,33 @@
+# mcp_server/models/vpc/topology.py
+
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+from mcp_server.models.common import MultiRegionParams
+
+_NODE_TYPES = "vpc | subnet | route_table | network_interface | instance | security_group"
+
+
+class TopologyParams(BaseModel):
+    region: str = Field(default="ap-south-1")
+    refresh: bool = Field(default=False, description="Rebuild the region's topology graph before answering")
+
+
+class TopologyNeighborsParams(TopologyParams):
+    resource_id: str = Field(..., description="VPC, subnet, route table, ENI, instance or security group ID")
+    depth: int = Field(default=1, ge=1, le=4, description="Follow links this many hops away")
+    resource_types: Optional[List[str]] = Field(default=None, description=f"Only return these node types: {_NODE_TYPES}")
+    max_results: Optional[int] = Field(default=None, ge=1, description="Maximum number of nodes to return (defaults to 100)")
+
+
+class TopologyMembersParams(TopologyParams):
+    container_id: str = Field(..., description="VPC or subnet ID")
+    resource_types: Optional[List[str]] = Field(default=None, description=f"Only return these node types: {_NODE_TYPES}")
+    max_results: Optional[int] = Field(default=None, ge=1, description="Maximum number of members to return (defaults to 100)")
+
+
+class SubnetUtilizationParams(TopologyParams, MultiRegionParams):
+    vpc_id: Optional[str] = Field(default=None, description="Only subnets of this VPC")
+    min_utilization: Optional[float] = Field(
+        default=None, ge=0, le=100, description="Only subnets at or above this percentage of usable IPs in use"
+    )
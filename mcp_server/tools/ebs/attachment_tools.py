@@ -1,6 +1,7 @@
 # mcp_server/tools/ec2/ebs/attachment_tools.py
 
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.core.cache import invalidates
 from fastmcp.tools import FunctionTool
 from typing import Optional
 from mcp_server.models.ebs import (
@@ -11,6 +12,7 @@ from mcp_server.models.ebs import (
 # =======================================================
 # ATTACH
 # =======================================================
+@invalidates("volumes", "instances")
 def attach_volume(
     *,
     VolumeId: str,
@@ -18,7 +20,7 @@ def attach_volume(
     Device: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     return ec2.attach_volume(
         VolumeId=VolumeId,
         InstanceId=InstanceId,
@@ -29,6 +31,7 @@ def attach_volume(
 # =======================================================
 # DETACH
 # =======================================================
+@invalidates("volumes", "instances")
 def detach_volume(
     *,
     VolumeId: str,
@@ -36,7 +39,7 @@ def detach_volume(
     Force: Optional[bool] = False,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     return ec2.detach_volume(
         VolumeId=VolumeId,
         InstanceId=InstanceId,
@@ -1,12 +1,21 @@
 # mcp_server/tools/ec2/ebs/snapshot_tools.py
 
-import boto3
+from mcp_server.aws.batcher import coalesced, describe_one
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_FILTER_VALUES, paginate, page_size_for
+from mcp_server.aws.regions import multi_region
+from mcp_server.core.cache import cached, invalidates
+from mcp_server.core.operations import operations
+from mcp_server.utils.aggregation import AGE_LABELS, StreamingAggregate, age_bucket, tag_value
+from mcp_server.utils.projection import compile_projection
 from fastmcp.tools import FunctionTool
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 
 from mcp_server.models.ebs import (
     ListSnapshotsParams,
     SnapshotIdParam,
+    SnapshotProgressParams,
     DeleteSnapshotParams,
     CopySnapshotParams,
     CreateVolumeFromSnapshotParams,
@@ -17,6 +26,7 @@ from mcp_server.models.ebs import (
 # =======================================================
 # CREATE SNAPSHOT
 # =======================================================
+@invalidates("snapshots")
 def create_snapshot(
     *,
     VolumeId: str,
@@ -24,7 +34,7 @@ def create_snapshot(
     Tags: Optional[Dict[str, str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req = {
         "VolumeId": VolumeId,
@@ -39,60 +49,192 @@ def create_snapshot(
             }
         ]
 
-    return ec2.create_snapshot(**req)
+    resp = ec2.create_snapshot(**req)
+    resp["operation_id"] = operations.start("snapshot", region, [resp["SnapshotId"]], "ebs.create_snapshot")
+    return resp
 
 
 # =======================================================
 # LIST SNAPSHOTS
 # =======================================================
+# Dimensions list_snapshots can aggregate on, besides "age" and "tag:<Key>"
+SNAPSHOT_DIMENSIONS = {
+    "volume": lambda s: s.get("VolumeId"),
+    "encrypted": lambda s: bool(s.get("Encrypted")),
+    "state": lambda s: s.get("State"),
+    "storage_tier": lambda s: s.get("StorageTier", "standard"),
+    "owner": lambda s: s.get("OwnerId"),
+}
+
+# Groups returned per aggregation dimension (largest first)
+AGGREGATE_GROUP_LIMIT = 100
+
+
+def _snapshot_dimensions(aggregate_by: List[str]):
+    now = datetime.now(timezone.utc)
+    dimensions = {}
+    for name in aggregate_by:
+        if name == "age":
+            dimensions[name] = lambda s: age_bucket(s.get("StartTime"), now)
+        elif name.startswith("tag:"):
+            dimensions[name] = lambda s, key=name[4:]: tag_value(s, key)
+        elif name in SNAPSHOT_DIMENSIONS:
+            dimensions[name] = SNAPSHOT_DIMENSIONS[name]
+        else:
+            raise ValueError(
+                f"Unknown aggregation '{name}'; use age, tag:<Key> or one of {', '.join(SNAPSHOT_DIMENSIONS)}"
+            )
+    return dimensions
+
+
+def _has_owner_filter(filters: Optional[List[Dict[str, Any]]]) -> bool:
+    return any(f.get("Name") in ("owner-id", "owner-alias") for f in filters or [])
+
+
+@multi_region("snapshots")
+@cached("snapshots")
 def list_snapshots(
     *,
     OwnerIds: Optional[List[str]] = None,
     Filters: Optional[List[Dict[str, Any]]] = None,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    aggregate_by: Optional[List[str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
-
-    req = {}
-
-    if OwnerIds:
-        req["OwnerIds"] = OwnerIds
-
-    if Filters:
-        req["Filters"] = Filters
-
-    resp = ec2.describe_snapshots(**req)
-    return resp.get("Snapshots", [])
+    ec2 = get_ec2_client(region)
+
+    # Without an owner, DescribeSnapshots also walks every public snapshot
+    if not OwnerIds and not _has_owner_filter(Filters):
+        OwnerIds = ["self"]
+
+    if aggregate_by:
+        try:
+            aggregate = StreamingAggregate(
+                _snapshot_dimensions(aggregate_by),
+                lambda s: s.get("VolumeSize", 0),
+                "size_gib",
+                order={"age": AGE_LABELS},
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
+        # One pass over every page; no snapshot outlives its page
+        cursor = paginate(
+            ec2,
+            "describe_snapshots",
+            "Snapshots",
+            max_results=0,
+            page_size=page_size_for(0),
+            OwnerIds=OwnerIds,
+            Filters=Filters or None,
+        )
+        for snapshot in cursor:
+            aggregate.add(snapshot)
+
+        return {
+            "region": region,
+            "owner_ids": OwnerIds,
+            "snapshots": [],
+            "aggregates": aggregate.result(AGGREGATE_GROUP_LIMIT),
+        }
+
+    project = compile_projection(fields, "snapshots")
+
+    cursor = paginate(
+        ec2,
+        "describe_snapshots",
+        "Snapshots",
+        max_results=max_results,
+        next_token=next_token,
+        page_size=page_size_for(max_results),
+        OwnerIds=OwnerIds,
+        Filters=Filters or None,
+    )
+    snapshots = [project(snapshot) for snapshot in cursor]
+
+    return {
+        "region": region,
+        "owner_ids": OwnerIds,
+        "snapshots": snapshots,
+        "next_token": cursor.next_token,
+    }
 
 
 # =======================================================
 # DESCRIBE A SPECIFIC SNAPSHOT
 # =======================================================
+@coalesced
 def describe_snapshot(
     *,
     SnapshotId: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
-    resp = ec2.describe_snapshots(SnapshotIds=[SnapshotId])
-    return resp.get("Snapshots", [])
+    snapshot = describe_one("snapshot", region, SnapshotId)
+    return [snapshot] if snapshot is not None else []
+
+
+# =======================================================
+# SNAPSHOT PROGRESS
+# =======================================================
+def get_snapshot_progress(
+    *,
+    SnapshotId: Optional[str] = None,
+    SnapshotIds: Optional[List[str]] = None,
+    region: str = "ap-south-1"
+):
+    ids = list(dict.fromkeys([*([SnapshotId] if SnapshotId else []), *(SnapshotIds or [])]))
+    if not ids:
+        return {"error": "Provide SnapshotId or SnapshotIds"}
+
+    ec2 = get_ec2_client(region)
+    found: Dict[str, Dict[str, Any]] = {}
+
+    # A filter instead of SnapshotIds, so one unknown ID
+    # does not fail the whole call
+    for start in range(0, len(ids), MAX_FILTER_VALUES):
+        cursor = paginate(
+            ec2,
+            "describe_snapshots",
+            "Snapshots",
+            max_results=0,
+            Filters=[{"Name": "snapshot-id", "Values": ids[start:start + MAX_FILTER_VALUES]}],
+        )
+        for snapshot in cursor:
+            progress = snapshot.get("Progress", "").rstrip("%")
+            found[snapshot["SnapshotId"]] = {
+                "state": snapshot.get("State"),
+                "progress_percent": float(progress) if progress else None,
+                "volume_id": snapshot.get("VolumeId"),
+                "volume_size": snapshot.get("VolumeSize"),
+                "start_time": snapshot.get("StartTime"),
+            }
+
+    return {
+        "region": region,
+        "snapshots": {sid: found.get(sid, {"state": "not-found"}) for sid in ids},
+        "all_completed": all(found.get(sid, {}).get("state") == "completed" for sid in ids),
+    }
 
 
 # =======================================================
 # DELETE SNAPSHOT
 # =======================================================
+@invalidates("snapshots", ids_from="SnapshotId")
 def delete_snapshot(
     *,
     SnapshotId: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     return ec2.delete_snapshot(SnapshotId=SnapshotId)
 
 
 # =======================================================
 # COPY SNAPSHOT (Cross Region Snapshot Copy)
 # =======================================================
+@invalidates("snapshots")
 def copy_snapshot(
     *,
     SourceRegion: str,
@@ -103,7 +245,7 @@ def copy_snapshot(
     Tags: Optional[Dict[str, str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req = {
         "SourceRegion": SourceRegion,
@@ -125,12 +267,15 @@ def copy_snapshot(
             }
         ]
 
-    return ec2.copy_snapshot(**req)
+    resp = ec2.copy_snapshot(**req)
+    resp["operation_id"] = operations.start("snapshot", region, [resp["SnapshotId"]], "ebs.copy_snapshot")
+    return resp
 
 
 # =======================================================
 # CREATE VOLUME FROM SNAPSHOT (RESTORE)
 # =======================================================
+@invalidates("volumes")
 def restore_volume_from_snapshot(
     *,
     SnapshotId: str,
@@ -144,7 +289,7 @@ def restore_volume_from_snapshot(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req = {
         "SnapshotId": SnapshotId,
@@ -178,7 +323,7 @@ def manage_fast_snapshot_restore(
     State: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     if State not in ("enable", "disable"):
         return {"error": "State must be 'enable' or 'disable'"}
@@ -208,7 +353,11 @@ tools = [
     ),
     FunctionTool(
         name="ebs.list_snapshots",
-        description="List EBS snapshots (owned/shared/public).",
+        description=(
+            "List EBS snapshots (your own unless OwnerIds says otherwise). With aggregate_by, "
+            "summarize every matching snapshot in one pass: counts and GiB by volume, age, "
+            "encryption, state, tier, owner or tag."
+        ),
         fn=list_snapshots,
         parameters=ListSnapshotsParams.model_json_schema(),
     ),
@@ -218,6 +367,12 @@ tools = [
         fn=describe_snapshot,
         parameters=SnapshotIdParam.model_json_schema(),
     ),
+    FunctionTool(
+        name="ebs.get_snapshot_progress",
+        description="Get state and completion percentage for one or more snapshots.",
+        fn=get_snapshot_progress,
+        parameters=SnapshotProgressParams.model_json_schema(),
+    ),
     FunctionTool(
         name="ebs.delete_snapshot",
         description="Delete a snapshot.",
@@ -1,6 +1,11 @@
 # mcp_server/tools/ec2/ebs/volume_tools.py
 
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import paginate, page_size_for
+from mcp_server.aws.pricing_index import GP3_BASELINE_IOPS, GP3_BASELINE_THROUGHPUT_MIBPS, ebs_monthly_cost, pricing_index
+from mcp_server.aws.regions import multi_region
+from mcp_server.core.cache import cached, invalidates
+from mcp_server.utils.projection import compile_projection
 from fastmcp.tools import FunctionTool
 from typing import Optional, Dict, Any, List
 from mcp_server.models.ebs import (
@@ -8,11 +13,13 @@ from mcp_server.models.ebs import (
     ModifyVolumeParams,
     DeleteVolumeParams,
     DescribeVolumeParams,
+    EstimateVolumeCostParams,
 )
 
 # =======================================================
 # CREATE VOLUME
 # =======================================================
+@invalidates("volumes")
 def create_volume(
     *,
     AvailabilityZone: str,
@@ -27,7 +34,7 @@ def create_volume(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req = {
         "AvailabilityZone": AvailabilityZone,
@@ -64,6 +71,7 @@ def create_volume(
 # =======================================================
 # MODIFY VOLUME
 # =======================================================
+@invalidates("volumes", ids_from="VolumeId")
 def modify_volume(
     *,
     VolumeId: str,
@@ -73,7 +81,7 @@ def modify_volume(
     Throughput: Optional[int] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req = {"VolumeId": VolumeId}
 
@@ -92,32 +100,110 @@ def modify_volume(
 # =======================================================
 # DELETE VOLUME
 # =======================================================
+@invalidates("volumes", ids_from="VolumeId")
 def delete_volume(
     *,
     VolumeId: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     return ec2.delete_volume(VolumeId=VolumeId)
 
 
 # =======================================================
 # DESCRIBE VOLUMES
 # =======================================================
+@multi_region("volumes")
+@cached("volumes")
 def describe_volumes(
     *,
     VolumeId: Optional[str] = None,
     Filters: Optional[List[Dict[str, Any]]] = None,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+    fields: Optional[List[str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
+    project = compile_projection(fields, "volumes")
+
+    # DescribeVolumes caps MaxResults at 500 and rejects it alongside VolumeIds
+    cursor = paginate(
+        ec2,
+        "describe_volumes",
+        "Volumes",
+        max_results=max_results,
+        next_token=next_token,
+        page_size=None if VolumeId else page_size_for(max_results, cap=500),
+        VolumeIds=[VolumeId] if VolumeId else None,
+        Filters=Filters or None,
+    )
+    volumes = [project(volume) for volume in cursor]
+
+    return {
+        "region": region,
+        "volumes": volumes,
+        "next_token": cursor.next_token,
+    }
 
-    if VolumeId:
-        resp = ec2.describe_volumes(VolumeIds=[VolumeId])
-    else:
-        resp = ec2.describe_volumes(Filters=Filters or [])
 
-    return resp.get("Volumes", [])
+# =======================================================
+# ESTIMATE VOLUME COST
+# =======================================================
+def estimate_volume_cost(
+    *,
+    Size: int,
+    VolumeType: str = "gp3",
+    Iops: Optional[int] = None,
+    Throughput: Optional[int] = None,
+    SnapshotSize: Optional[int] = None,
+    SnapshotTier: str = "standard",
+    CopyToRegion: Optional[str] = None,
+    region: str = "ap-south-1"
+):
+    if not pricing_index.available():
+        return {"error": "No local pricing index; run: python -m mcp_server.aws.pricing_index ingest <offer file>"}
+
+    rates = pricing_index.ebs_prices(region, VolumeType)
+    if rates is None:
+        return {"error": f"No price for {VolumeType} volumes in {region} in the pricing index"}
+
+    if Iops and not rates["iops_tiers"] and (VolumeType != "gp3" or Iops > GP3_BASELINE_IOPS):
+        return {"error": f"{VolumeType} volumes do not take provisioned IOPS"}
+    if Throughput and Throughput > GP3_BASELINE_THROUGHPUT_MIBPS and rates["throughput_per_gibps_month"] is None:
+        return {"error": f"{VolumeType} volumes do not take provisioned throughput"}
+
+    monthly = ebs_monthly_cost(rates, VolumeType, Size, Iops, Throughput)
+
+    one_time = {}
+    if SnapshotSize:
+        snapshot_rate = pricing_index.snapshot_price(region, SnapshotTier)
+        if snapshot_rate is None:
+            return {"error": f"No {SnapshotTier} snapshot price for {region} in the pricing index"}
+        monthly["snapshot"] = SnapshotSize * snapshot_rate
+        rates["snapshot_per_gb_month"] = snapshot_rate
+
+        if CopyToRegion:
+            transfer_rate = pricing_index.transfer_price(region, CopyToRegion)
+            if transfer_rate is None:
+                return {"error": f"No transfer price from {region} to {CopyToRegion} in the pricing index"}
+            # The copy itself is charged once; the copy's storage is billed in CopyToRegion
+            one_time["snapshot_copy_transfer"] = SnapshotSize * transfer_rate
+            rates["transfer_per_gb"] = transfer_rate
+
+    return {
+        "region": region,
+        "volume_type": VolumeType,
+        "size_gib": Size,
+        "monthly_cost_usd": {
+            **{k: round(v, 4) for k, v in monthly.items()},
+            "total": round(sum(monthly.values()), 2),
+        },
+        "one_time_cost_usd": {k: round(v, 4) for k, v in one_time.items()},
+        "rates_usd": rates,
+        "source": "price_list_index",
+        "price_list_version": pricing_index.version(),
+    }
 
 
 tools = [
@@ -145,4 +231,10 @@ tools = [
         fn=describe_volumes,
         parameters=DescribeVolumeParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="ebs.estimate_volume_cost",
+        description="Estimate monthly EBS volume, snapshot and snapshot copy cost from the local pricing index",
+        fn=estimate_volume_cost,
+        parameters=EstimateVolumeCostParams.model_json_schema(),
+    ),
 ]
@@ -1,6 +1,12 @@
 # mcp_server/tools/ec2/ami_tools.py
 
-import boto3
+from mcp_server.aws.ami_catalog import ami_catalog
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import paginate, page_size_for
+from mcp_server.aws.regions import multi_region
+from mcp_server.core.cache import invalidates
+from mcp_server.core.operations import operations
+from mcp_server.utils.projection import compile_projection
 from fastmcp.tools import FunctionTool
 from typing import Dict, Any, Optional, List
 
@@ -8,8 +14,10 @@ from mcp_server.models.ec2.ami import (
     CreateAMIParams,
     DescribeImagesParams,
     DeregisterAMIParams,
+    ResolveLatestAMIParams,
 )
 
+@invalidates("images")
 def create_ami(
     *,
     instance_id: str,
@@ -19,7 +27,7 @@ def create_ami(
     tags: Optional[Dict[str, str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req: Dict[str, Any] = {
         "InstanceId": instance_id,
@@ -39,39 +47,94 @@ def create_ami(
             }
         ]
 
-    return ec2.create_image(**req)
+    resp = ec2.create_image(**req)
+    resp["operation_id"] = operations.start("image", region, [resp["ImageId"]], "ec2.create_ami")
+    return resp
 
+@multi_region("images")
 def describe_images(
     *,
     owners: Optional[List[str]] = None,
     image_ids: Optional[List[str]] = None,
     filters: Optional[List[Dict[str, Any]]] = None,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+    fields: Optional[List[str]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
+    project = compile_projection(fields, "images")
 
-    req: Dict[str, Any] = {}
+    cursor = paginate(
+        ec2,
+        "describe_images",
+        "Images",
+        max_results=max_results,
+        next_token=next_token,
+        page_size=None if image_ids else page_size_for(max_results),
+        Owners=owners or None,
+        ImageIds=image_ids or None,
+        Filters=filters or None,
+    )
+    images = [project(image) for image in cursor]
 
-    if owners:
-        req["Owners"] = owners
-
-    if image_ids:
-        req["ImageIds"] = image_ids
-
-    if filters:
-        req["Filters"] = filters
-
-    resp = ec2.describe_images(**req)
-    return resp.get("Images", [])
+    return {
+        "region": region,
+        "images": images,
+        "next_token": cursor.next_token,
+    }
 
+@invalidates("images", ids_from="image_id")
 def deregister_ami(
     *,
     image_id: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     return ec2.deregister_image(ImageId=image_id)
 
+def resolve_latest_ami(
+    *,
+    name_pattern: str,
+    owner: str = "amazon",
+    architecture: Optional[str] = "x86_64",
+    virtualization_type: Optional[str] = "hvm",
+    root_device_type: Optional[str] = "ebs",
+    alternatives: int = 4,
+    refresh: bool = False,
+    region: str = "ap-south-1"
+):
+    try:
+        matches, total, catalog = ami_catalog.find(
+            region,
+            owner,
+            name_pattern,
+            limit=1 + alternatives,
+            refresh=refresh,
+            Architecture=architecture,
+            VirtualizationType=virtualization_type,
+            RootDeviceType=root_device_type,
+        )
+    except Exception as e:
+        return {"region": region, "error": str(e)}
+
+    if not matches:
+        return {
+            "region": region,
+            "error": f"No available AMI owned by {owner} matches '{name_pattern}'",
+            "catalog": catalog,
+        }
+
+    return {
+        "region": region,
+        "image_id": matches[0]["ImageId"],
+        "image": matches[0],
+        "alternatives": matches[1:],
+        # Only counted for selective patterns; broad ones stop at the newest
+        "match_count": total,
+        "catalog": catalog,
+    }
+
 tools = [
     FunctionTool(
         name="aws.create_ami",
@@ -91,4 +154,15 @@ tools = [
         fn=deregister_ami,
         parameters=DeregisterAMIParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="ec2.resolve_latest_ami",
+        description=(
+            "Find the newest available AMI whose name matches a glob (e.g. 'al2023-ami-2023.*-x86_64', "
+            "'ubuntu/images/hvm-ssd*/ubuntu-noble-24.04-amd64-server-*') for an owner "
+            "(amazon, self, canonical, debian, redhat, suse or an account ID), answered from a "
+            "local per-region catalog."
+        ),
+        fn=resolve_latest_ami,
+        parameters=ResolveLatestAMIParams.model_json_schema(),
+    ),
 ]
@@ -4,13 +4,17 @@ from mcp_server.models.ec2 import (
     InstanceSSHInstructionParams,
     CreateSpotInstanceParams
 )
-import boto3
+from mcp_server.aws.batcher import coalesced, describe_one
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.core.cache import invalidates
+from mcp_server.core.operations import operations
 import os
 from fastmcp.tools import FunctionTool
 from typing import Optional, List, Dict, Any
 
 DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
+@invalidates("instances", "volumes", "subnets")
 def create_instance(
     *,
     ImageId: str,
@@ -30,7 +34,7 @@ def create_instance(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     payload = {
         "ImageId": ImageId,
@@ -72,17 +76,21 @@ def create_instance(
     try:
         resp = ec2.run_instances(**payload)
         inst = resp["Instances"][0]
+        instance_ids = [i["InstanceId"] for i in resp["Instances"]]
 
         return {
             "region": region,
             "instance_id": inst["InstanceId"],
+            "instance_ids": instance_ids,
             "instance_type": inst["InstanceType"],
             "state": inst["State"]["Name"],
+            "operation_id": operations.start("instance", region, instance_ids, "ec2.create_instance"),
         }
 
     except Exception as e:
         return {"error": str(e)}
 
+@invalidates("instances", "volumes", "subnets")
 def create_instance_minimal(
     *,
     ImageId: str,
@@ -94,7 +102,7 @@ def create_instance_minimal(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         payload = {
@@ -123,12 +131,16 @@ def create_instance_minimal(
             "region": region,
             "instance_id": inst["InstanceId"],
             "public_ip": inst.get("PublicIpAddress"),
-            "state": inst["State"]["Name"]
+            "state": inst["State"]["Name"],
+            "operation_id": operations.start(
+                "instance", region, [i["InstanceId"] for i in resp["Instances"]], "ec2.create_instance_minimal"
+            ),
         }
 
     except Exception as e:
         return {"error": str(e)}
 
+@invalidates("instances", "volumes", "subnets")
 def create_spot_instance(
     *,
     ImageId: str,
@@ -147,7 +159,7 @@ def create_spot_instance(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     launch_spec = {
         "ImageId": ImageId,
@@ -203,6 +215,7 @@ def create_spot_instance(
     except Exception as e:
         return {"error": str(e)}
     
+@coalesced
 def generate_instance_ssh_instruction(
     *,
     instance_id: str,
@@ -211,11 +224,11 @@ def generate_instance_ssh_instruction(
     region: str = "ap-south-1"
 ):
     region = region or DEFAULT_REGION
-    ec2 = boto3.client("ec2", region_name=region)
 
     try:
-        resp = ec2.describe_instances(InstanceIds=[instance_id])
-        inst = resp["Reservations"][0]["Instances"][0]
+        inst = describe_one("instance", region, instance_id)
+        if inst is None:
+            return {"error": f"Instance {instance_id} not found"}
 
         pub_ip = inst.get("PublicIpAddress")
         if not pub_ip:
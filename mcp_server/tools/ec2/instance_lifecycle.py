@@ -1,7 +1,11 @@
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.regions import map_regions
+from mcp_server.core.cache import invalidates
 import os
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from fastmcp.tools import FunctionTool
+from typing import Dict, List, Optional
 from mcp_server.models.ec2 import (
     InstanceLifeCycleParams,
 )
@@ -10,102 +14,195 @@ load_dotenv()
 
 DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "ap-south-1")
 
-def start_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
+# Instance IDs per Start/Stop/Reboot/TerminateInstances call
+LIFECYCLE_BATCH_SIZE = 1000
 
-    try:
-        resp = ec2.start_instances(InstanceIds=[instance_id])
-        state = resp["StartingInstances"][0]["CurrentState"]["Name"]
-
-        return {"status": "success", "instance_id": instance_id, "state": state}
-
-    except Exception as e:
-        return {"status": "error", "instance_id": instance_id, "error": str(e)}
-
-def stop_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
-
-    try:
-        resp = ec2.stop_instances(InstanceIds=[instance_id])
-        state = resp["StoppingInstances"][0]["CurrentState"]["Name"]
-
-        return {"status": "success", "instance_id": instance_id, "state": state}
-
-    except Exception as e:
-        return {"status": "error", "instance_id": instance_id, "error": str(e)}
-
-def reboot_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
-
-    try:
-        ec2.reboot_instances(InstanceIds=[instance_id])
-
-        return {
-            "status": "success",
-            "instance_id": instance_id,
-            "message": "Reboot initiated"
-        }
-
-    except Exception as e:
-        return {"status": "error", "instance_id": instance_id, "error": str(e)}
-
-def hard_reboot_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
-
-    try:
-        ec2.reboot_instances(InstanceIds=[instance_id], Force=True)
-
-        return {
-            "status": "success",
-            "instance_id": instance_id,
-            "message": "Forced reboot initiated"
-        }
+_INSTANCE_ID_ARGS = ("instance_id", "instance_ids")
 
-    except Exception as e:
-        return {"status": "error", "instance_id": instance_id, "error": str(e)}
+# Errors caused by particular instances in a batch; anything else (throttling,
+# permissions) would fail the same way for every instance
+_PER_INSTANCE_ERRORS = (
+    "InvalidInstanceID",
+    "IncorrectInstanceState",
+    "IncorrectState",
+    "UnsupportedOperation",
+    "OperationNotPermitted",
+)
 
-def terminate_instance(*, instance_id: str, region: str = DEFAULT_REGION) -> dict:
-    ec2 = boto3.client("ec2", region_name=region)
 
+# =======================================================
+# BATCHING
+# =======================================================
+def _call_chunk(ec2, action: dict, ids: List[str]) -> List[dict]:
+    """
+    Run one API call for ``ids``. EC2 rejects the whole call when any one
+    instance is invalid (unknown ID, wrong state), so a chunk failing with a
+    per-instance error is split in half and retried until the failing
+    instances are isolated.
+    """
     try:
-        resp = ec2.terminate_instances(InstanceIds=[instance_id])
-        state = resp["TerminatingInstances"][0]["CurrentState"]["Name"]
-
-        return {"status": "success", "instance_id": instance_id, "state": state}
-
-    except Exception as e:
-        return {"status": "error", "instance_id": instance_id, "error": str(e)}
+        resp = getattr(ec2, action["api"])(InstanceIds=ids, **action.get("extra", {}))
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if len(ids) == 1 or not code.startswith(_PER_INSTANCE_ERRORS):
+            return [{"status": "error", "instance_id": i, "error": str(e)} for i in ids]
+        middle = len(ids) // 2
+        return _call_chunk(ec2, action, ids[:middle]) + _call_chunk(ec2, action, ids[middle:])
+
+    if "result_key" not in action:
+        return [{"status": "success", "instance_id": i, "message": action["message"]} for i in ids]
+
+    states = {
+        item["InstanceId"]: item["CurrentState"]["Name"]
+        for item in resp.get(action["result_key"], [])
+    }
+    return [
+        {"status": "success", "instance_id": i, "state": states.get(i)}
+        for i in ids
+    ]
+
+
+def _run_in_region(action: dict, region: str, ids: List[str]) -> List[dict]:
+    ec2 = get_ec2_client(region)
+    results = []
+    for start in range(0, len(ids), LIFECYCLE_BATCH_SIZE):
+        chunk = ids[start:start + LIFECYCLE_BATCH_SIZE]
+        try:
+            results.extend(_call_chunk(ec2, action, chunk))
+        except Exception as e:
+            # Not instance specific (bad parameters, credentials): fail the chunk
+            results.extend({"status": "error", "instance_id": i, "error": str(e)} for i in chunk)
+    for result in results:
+        result["region"] = region
+    return results
+
+
+def _lifecycle(
+    action: dict,
+    instance_id: Optional[str],
+    instance_ids: Optional[List[str]],
+    instance_ids_by_region: Optional[Dict[str, List[str]]],
+    region: str,
+) -> dict:
+    work: Dict[str, List[str]] = {}
+    if instance_id or instance_ids:
+        work[region] = [*([instance_id] if instance_id else []), *(instance_ids or [])]
+    for other, ids in (instance_ids_by_region or {}).items():
+        work.setdefault(other, []).extend(ids)
+    work = {r: list(dict.fromkeys(ids)) for r, ids in work.items() if ids}
+
+    if not work:
+        return {"status": "error", "error": "Provide instance_id, instance_ids or instance_ids_by_region"}
+
+    results: List[dict] = []
+    for r, outcome in map_regions(lambda r, ids: _run_in_region(action, r, ids), work).items():
+        if isinstance(outcome, Exception):
+            results.extend({"status": "error", "instance_id": i, "region": r, "error": str(outcome)} for i in work[r])
+        else:
+            results.extend(outcome)
+
+    # A single instance keeps the original one-instance response
+    if instance_id and not instance_ids and not instance_ids_by_region:
+        return results[0]
+
+    failed = sum(1 for result in results if result["status"] == "error")
+    return {
+        "status": "success" if not failed else ("error" if failed == len(results) else "partial"),
+        "requested": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": results,
+    }
+
+
+_START = {"api": "start_instances", "result_key": "StartingInstances"}
+_STOP = {"api": "stop_instances", "result_key": "StoppingInstances"}
+_REBOOT = {"api": "reboot_instances", "message": "Reboot initiated"}
+_HARD_REBOOT = {"api": "reboot_instances", "extra": {"Force": True}, "message": "Forced reboot initiated"}
+_TERMINATE = {"api": "terminate_instances", "result_key": "TerminatingInstances"}
+
+
+@invalidates("instances", ids_from=_INSTANCE_ID_ARGS, regions_from="instance_ids_by_region")
+def start_instance(
+    *,
+    instance_id: Optional[str] = None,
+    instance_ids: Optional[List[str]] = None,
+    instance_ids_by_region: Optional[Dict[str, List[str]]] = None,
+    region: str = DEFAULT_REGION
+) -> dict:
+    return _lifecycle(_START, instance_id, instance_ids, instance_ids_by_region, region)
+
+@invalidates("instances", ids_from=_INSTANCE_ID_ARGS, regions_from="instance_ids_by_region")
+def stop_instance(
+    *,
+    instance_id: Optional[str] = None,
+    instance_ids: Optional[List[str]] = None,
+    instance_ids_by_region: Optional[Dict[str, List[str]]] = None,
+    region: str = DEFAULT_REGION
+) -> dict:
+    return _lifecycle(_STOP, instance_id, instance_ids, instance_ids_by_region, region)
+
+@invalidates("instances", ids_from=_INSTANCE_ID_ARGS, regions_from="instance_ids_by_region")
+def reboot_instance(
+    *,
+    instance_id: Optional[str] = None,
+    instance_ids: Optional[List[str]] = None,
+    instance_ids_by_region: Optional[Dict[str, List[str]]] = None,
+    region: str = DEFAULT_REGION
+) -> dict:
+    return _lifecycle(_REBOOT, instance_id, instance_ids, instance_ids_by_region, region)
+
+@invalidates("instances", ids_from=_INSTANCE_ID_ARGS, regions_from="instance_ids_by_region")
+def hard_reboot_instance(
+    *,
+    instance_id: Optional[str] = None,
+    instance_ids: Optional[List[str]] = None,
+    instance_ids_by_region: Optional[Dict[str, List[str]]] = None,
+    region: str = DEFAULT_REGION
+) -> dict:
+    return _lifecycle(_HARD_REBOOT, instance_id, instance_ids, instance_ids_by_region, region)
+
+@invalidates("instances", ids_from=_INSTANCE_ID_ARGS, regions_from="instance_ids_by_region")
+@invalidates("volumes", "subnets", regions_from="instance_ids_by_region")
+def terminate_instance(
+    *,
+    instance_id: Optional[str] = None,
+    instance_ids: Optional[List[str]] = None,
+    instance_ids_by_region: Optional[Dict[str, List[str]]] = None,
+    region: str = DEFAULT_REGION
+) -> dict:
+    return _lifecycle(_TERMINATE, instance_id, instance_ids, instance_ids_by_region, region)
 
 
 tools = [
     FunctionTool(
         name="ec2.start_instance",
-        description="Start an EC2 Instance",
+        description="Start one or more EC2 instances",
         fn=start_instance,
         parameters=InstanceLifeCycleParams.model_json_schema()
     ),
     FunctionTool(
         name="ec2.stop_instance",
-        description="Stop a running EC2 instance",
+        description="Stop one or more running EC2 instances",
         fn=stop_instance,
         parameters=InstanceLifeCycleParams.model_json_schema()
     ),
     FunctionTool(
         name="ec2.reboot_instance",
-        description="Reboot a running EC2 instance",
+        description="Reboot one or more running EC2 instances",
         fn=reboot_instance,
         parameters=InstanceLifeCycleParams.model_json_schema()
     ),
     FunctionTool(
         name="ec2.hard_reboot_instance",
-        description="Hard Reboot a running EC2 instance",
+        description="Hard Reboot one or more running EC2 instances",
         fn=hard_reboot_instance,
         parameters=InstanceLifeCycleParams.model_json_schema()
     ),
     FunctionTool(
         name="ec2.terminate_instance",
-        description="Terminate a stopped EC2 Instance",
+        description="Terminate one or more EC2 instances",
         fn=terminate_instance,
         parameters=InstanceLifeCycleParams.model_json_schema()
     ),
-]
\ No newline at end of file
+]
@@ -1,4 +1,4 @@
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
 from typing import Dict, Any
 from pathlib import Path
 import stat
@@ -13,7 +13,7 @@ def create_keypair(region: str, key_name: str) -> Dict[str, Any]:
     """
     Creates an EC2 KeyPair and returns the PEM material.
     """
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         resp = ec2.create_key_pair(KeyName=key_name)
@@ -31,7 +31,7 @@ def delete_keypair(region: str, key_name: str) -> Dict[str, Any]:
     """
     Deletes an EC2 KeyPair.
     """
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         ec2.delete_key_pair(KeyName=key_name)
@@ -48,7 +48,7 @@ def list_keypairs(region: str) -> Dict[str, Any]:
     """
     Returns all key pairs in the region.
     """
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         resp = ec2.describe_key_pairs()
@@ -5,7 +5,9 @@ from mcp_server.models.ec2.launch_templates import (
     DeleteLaunchTemplateParams,
     LaunchFromTemplateParams
 )
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.core.cache import invalidates
+from mcp_server.core.operations import operations
 import base64
 from fastmcp.tools import FunctionTool
 from typing import Optional, List, Dict, Any
@@ -29,7 +31,7 @@ def create_launch_template(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     lt_data = {
         "ImageId": ImageId,
@@ -96,7 +98,7 @@ def create_launch_template_version(
     ExtraParams: Optional[Dict[str, Any]] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     lt_data = {}
 
@@ -144,7 +146,7 @@ def describe_launch_template(
     LaunchTemplateId: Optional[str] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     if LaunchTemplateId:
         return ec2.describe_launch_templates(
@@ -166,7 +168,7 @@ def delete_launch_template(
     LaunchTemplateId: Optional[str] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     if LaunchTemplateId:
         return ec2.delete_launch_template(
@@ -183,7 +185,7 @@ def delete_launch_template(
 # ================================================
 
 def list_launch_templates(region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     return ec2.describe_launch_templates()
 
 
@@ -191,6 +193,7 @@ def list_launch_templates(region: str = "ap-south-1"):
 # LAUNCH INSTANCE FROM TEMPLATE
 # ================================================
 
+@invalidates("instances", "volumes", "subnets")
 def launch_from_template(
     *,
     LaunchTemplateName: str,
@@ -199,7 +202,7 @@ def launch_from_template(
     MaxCount: int = 1,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     resp = ec2.run_instances(
         LaunchTemplate={
@@ -210,6 +213,9 @@ def launch_from_template(
         MaxCount=MaxCount
     )
 
+    instance_ids = [inst["InstanceId"] for inst in resp.get("Instances", [])]
+    if instance_ids:
+        resp["operation_id"] = operations.start("instance", region, instance_ids, "ec2.launch_from_template")
     return resp
 
 tools = [
@@ -2,12 +2,19 @@ from fastmcp.tools import FunctionTool
 from mcp_server.models.ec2 import (
     ListEC2Params,
     GetInstanceDetailsParams,
+    GetInstanceStatusParams,
+    ListRunningEC2Params,
     ListEC2ParamsTagwise,
     ListSpotRequestsParams,
     GetSpotRequestDetailsParams,
     CancelSpotRequestParams
 )
-import boto3
+from mcp_server.aws.batcher import coalesced, describe_one
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import paginate, page_size_for
+from mcp_server.aws.regions import multi_region
+from mcp_server.core.cache import cached
+from mcp_server.utils.projection import compile_projection
 import os
 from typing import Dict, Any, List, Optional
 
@@ -16,6 +23,8 @@ DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 # -------------------------
 # TOOL FUNCTION 1 — LIST EC2
 # -------------------------
+@multi_region("instances")
+@cached("instances")
 def list_ec2_instances(
     *,
     region: Optional[str] = None,
@@ -31,11 +40,15 @@ def list_ec2_instances(
     exclude_spot: bool = False,
     spot_request_id: Optional[str] = None,
     custom_filters: Optional[List[Dict[str, Any]]] = None,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+    fields: Optional[List[str]] = None,
 ):
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
+    project = compile_projection(fields, "instances")
     filters = []
 
     # ---- Standard Filters ----
@@ -73,19 +86,28 @@ def list_ec2_instances(
 
     # ---- Query AWS ----
     try:
-        if instance_ids:
-            resp = ec2.describe_instances(InstanceIds=instance_ids, Filters=filters or None)
-        else:
-            resp = ec2.describe_instances(Filters=filters or None)
+        # MaxResults cannot be combined with InstanceIds
+        cursor = paginate(
+            ec2,
+            "describe_instances",
+            "Reservations",
+            max_results=max_results,
+            next_token=next_token,
+            page_size=None if instance_ids else page_size_for(max_results),
+            count_key="Instances",
+            InstanceIds=instance_ids,
+            Filters=filters or None,
+        )
 
         instances = []
-        for res in resp.get("Reservations", []):
-            instances.extend(res.get("Instances", []))
+        for res in cursor:
+            instances.extend(project(inst) for inst in res.get("Instances", []))
 
         return {
             "region": region,
             "filters_applied": filters,
             "instances": instances,
+            "next_token": cursor.next_token,
         }
 
     except Exception as e:
@@ -95,16 +117,15 @@ def list_ec2_instances(
 # -------------------------
 # TOOL FUNCTION 2 — GET DETAILS
 # -------------------------
-def get_instance_details(*, instance_id: str, region: str = None):
+@coalesced
+@cached("instances")
+def get_instance_details(*, instance_id: str, region: str = None, fields: Optional[List[str]] = None):
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
-
-    resp = ec2.describe_instances(InstanceIds=[instance_id])
-    reservations = resp.get("Reservations", [])
+    instance = describe_one("instance", region, instance_id)
 
-    if not reservations or not reservations[0].get("Instances"):
+    if instance is None:
         return {
             "instance_id": instance_id,
             "region": region,
@@ -115,16 +136,15 @@ def get_instance_details(*, instance_id: str, region: str = None):
     return {
         "instance_id": instance_id,
         "region": region,
-        "details": reservations[0]["Instances"][0]
+        "details": compile_projection(fields, "instances")(instance)
     }
 
+@coalesced
+@cached("instances")
 def get_instance_status(*, instance_id: str, region: str = DEFAULT_REGION):
-    ec2 = boto3.client("ec2", region_name=region)
-
     try:
-        resp = ec2.describe_instances(InstanceIds=[instance_id])
-        reservations = resp.get("Reservations", [])
-        if not reservations:
+        inst = describe_one("instance", region, instance_id)
+        if inst is None:
             return {
                 "instance_id": instance_id,
                 "state": "not_found",
@@ -132,81 +152,103 @@ def get_instance_status(*, instance_id: str, region: str = DEFAULT_REGION):
                 "instance_type": None
             }
 
-        inst = reservations[0]["Instances"][0]
-
         return {
             "instance_id": instance_id,
             "state": inst["State"]["Name"],
             "public_ip": inst.get("PublicIpAddress"),
             "instance_type": inst.get("InstanceType"),
-            "launch_time": str(inst.get("LaunchTime")),
+            "launch_time": inst.get("LaunchTime"),
             "lifecycle": inst.get("InstanceLifecycle", "on-demand")
         }
 
     except Exception as e:
         return {"error": str(e), "instance_id": instance_id}
         
-def list_running_instances(*, region: str = DEFAULT_REGION, spot_only: bool = False):
-    filters = [
-        {"Name": "instance-state-name", "Values": ["running"]}
-    ]
+def _instance_summary(inst: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "instance_id": inst["InstanceId"],
+        "instance_type": inst.get("InstanceType"),
+        "public_ip": inst.get("PublicIpAddress"),
+        "private_ip": inst.get("PrivateIpAddress"),
+        "state": inst["State"]["Name"],
+        "tags": inst.get("Tags", []),
+        "lifecycle": inst.get("InstanceLifecycle", "on-demand"),
+        "launch_time": inst.get("LaunchTime")
+    }
 
-    if spot_only:
-        filters.append({"Name": "instance-lifecycle", "Values": ["spot"]})
 
-    ec2 = boto3.client("ec2", region_name=region)
-    resp = ec2.describe_instances(Filters=filters)
+def _list_instance_summaries(region, filters, max_results, next_token):
+    ec2 = get_ec2_client(region)
+    cursor = paginate(
+        ec2,
+        "describe_instances",
+        "Reservations",
+        max_results=max_results,
+        next_token=next_token,
+        page_size=page_size_for(max_results),
+        count_key="Instances",
+        Filters=filters,
+    )
 
     instances = []
-    for reservation in resp.get("Reservations", []):
+    for reservation in cursor:
         for inst in reservation.get("Instances", []):
-            instances.append({
-                "instance_id": inst["InstanceId"],
-                "instance_type": inst["InstanceType"],
-                "public_ip": inst.get("PublicIpAddress"),
-                "private_ip": inst.get("PrivateIpAddress"),
-                "state": inst["State"]["Name"],
-                "tags": inst.get("Tags", []),
-                "lifecycle": inst.get("InstanceLifecycle", "on-demand"),
-                "launch_time": str(inst.get("LaunchTime"))
-            })
+            instances.append(_instance_summary(inst))
 
-    return instances
+    return {
+        "region": region,
+        "instances": instances,
+        "next_token": cursor.next_token,
+    }
 
 
-def list_instances_by_tag(*, tag_key: str, tag_value: str, region: str = DEFAULT_REGION, spot_only=False):
+@multi_region("instances")
+@cached("instances")
+def list_running_instances(
+    *,
+    region: str = DEFAULT_REGION,
+    spot_only: bool = False,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+):
     filters = [
-        {"Name": f"tag:{tag_key}", "Values": [tag_value]}
+        {"Name": "instance-state-name", "Values": ["running"]}
     ]
 
     if spot_only:
         filters.append({"Name": "instance-lifecycle", "Values": ["spot"]})
 
-    ec2 = boto3.client("ec2", region_name=region)
+    return _list_instance_summaries(region or DEFAULT_REGION, filters, max_results, next_token)
 
-    resp = ec2.describe_instances(Filters=filters)
 
-    instances = []
-    for reservation in resp.get("Reservations", []):
-        for inst in reservation.get("Instances", []):
-            instances.append({
-                "instance_id": inst["InstanceId"],
-                "instance_type": inst.get("InstanceType"),
-                "public_ip": inst.get("PublicIpAddress"),
-                "private_ip": inst.get("PrivateIpAddress"),
-                "state": inst["State"]["Name"],
-                "tags": inst.get("Tags", []),
-                "lifecycle": inst.get("InstanceLifecycle", "on-demand"),
-                "launch_time": str(inst.get("LaunchTime"))
-            })
-
-    return instances
+@multi_region("instances")
+@cached("instances")
+def list_instances_by_tag(
+    *,
+    tag_key: str,
+    tag_value: str,
+    region: str = DEFAULT_REGION,
+    spot_only=False,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+):
+    filters = [
+        {"Name": f"tag:{tag_key}", "Values": [tag_value]}
+    ]
+
+    if spot_only:
+        filters.append({"Name": "instance-lifecycle", "Values": ["spot"]})
 
+    return _list_instance_summaries(region or DEFAULT_REGION, filters, max_results, next_token)
+
+@multi_region("spot_requests")
 def list_spot_requests(
     *,
     region: Optional[str] = None,
     spot_request_ids: Optional[List[str]] = None,
     states: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
 ):
     """
     List all Spot Instance Requests (SIRs).
@@ -215,25 +257,30 @@ def list_spot_requests(
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     filters = []
     if states:
         filters.append({"Name": "state", "Values": states})
 
     try:
-        if spot_request_ids:
-            resp = ec2.describe_spot_instance_requests(
-                SpotInstanceRequestIds=spot_request_ids,
-                Filters=filters or None
-            )
-        else:
-            resp = ec2.describe_spot_instance_requests(Filters=filters or None)
+        cursor = paginate(
+            ec2,
+            "describe_spot_instance_requests",
+            "SpotInstanceRequests",
+            max_results=max_results,
+            next_token=next_token,
+            page_size=None if spot_request_ids else page_size_for(max_results),
+            SpotInstanceRequestIds=spot_request_ids,
+            Filters=filters or None,
+        )
+        spot_requests = list(cursor)
 
         return {
             "region": region,
             "filters_applied": filters,
-            "spot_requests": resp.get("SpotInstanceRequests", [])
+            "spot_requests": spot_requests,
+            "next_token": cursor.next_token,
         }
 
     except Exception as e:
@@ -251,7 +298,7 @@ def get_spot_request_details(
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         resp = ec2.describe_spot_instance_requests(
@@ -290,7 +337,7 @@ def cancel_spot_request(
     if not region:
         region = DEFAULT_REGION
 
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         resp = ec2.cancel_spot_instance_requests(
@@ -332,13 +379,13 @@ tools = [
         name="ec2.get_instance_running_details",
         description="Get running status of an EC2 instance",
         fn=get_instance_status,
-        parameters=GetInstanceDetailsParams.model_json_schema(),
+        parameters=GetInstanceStatusParams.model_json_schema(),
     ),
     FunctionTool(
         name="ec2.list_running_instances",
         description="Get full list of instances currently running and being billed",
         fn=list_running_instances,
-        parameters=ListEC2Params.model_json_schema(),
+        parameters=ListRunningEC2Params.model_json_schema(),
     ),
     FunctionTool(
         name="ec2.list_instances_by_tag",
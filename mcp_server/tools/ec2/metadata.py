@@ -1,6 +1,8 @@
 # mcp_server/tools/ec2/metadata_tools.py
 
-import boto3
+from mcp_server.aws.batcher import coalesced, describe_one
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.core.cache import invalidates
 import base64
 from fastmcp.tools import FunctionTool
 from typing import Optional
@@ -16,7 +18,7 @@ def get_user_data(
     instance_id: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     resp = ec2.describe_instance_attribute(
         InstanceId=instance_id,
@@ -35,22 +37,22 @@ def get_user_data(
         "user_data": decoded,
     }
 
+@coalesced
 def describe_metadata_options(
     *,
     instance_id: str,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
-
-    resp = ec2.describe_instances(InstanceIds=[instance_id])
-
-    instance = resp["Reservations"][0]["Instances"][0]
+    instance = describe_one("instance", region, instance_id)
+    if instance is None:
+        return {"instance_id": instance_id, "error": f"Instance {instance_id} not found"}
 
     return {
         "instance_id": instance_id,
         "metadata_options": instance.get("MetadataOptions", {})
     }
 
+@invalidates("instances", ids_from="instance_id")
 def modify_metadata_options(
     *,
     instance_id: str,
@@ -59,7 +61,7 @@ def modify_metadata_options(
     http_put_response_hop_limit: Optional[int] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     req = {"InstanceId": instance_id}
 
@@ -1,65 +1,31 @@
 # mcp_server/tools/ec2/pricing_tools.py
 
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pricing_client import AWS_PRICING_REGION_MAP, get_pricing_client
+from mcp_server.aws.pricing_index import ebs_monthly_cost, pricing_index
+from mcp_server.aws.pagination import MAX_FILTER_VALUES, MAX_PAGE_SIZE, paginate
+from mcp_server.aws.regions import fan_out, map_regions
+from mcp_server.tools.ec2.list import list_ec2_instances
+from mcp_server.utils import spot_analytics, vector
 import json
+import threading
 from fastmcp.tools import FunctionTool
-from botocore.exceptions import ClientError
-from typing import Optional
-from datetime import datetime
+from botocore.exceptions import BotoCoreError, ClientError
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 
+from mcp_server.models.ec2.list import EC2ListFilters
 from mcp_server.models.ec2.pricing import (
     EC2OnDemandPriceParams,
     SpotPriceHistoryParams,
-    EC2CostEstimateParams
+    EC2CostEstimateParams,
+    ScanSpotPricesParams,
+    EstimateFleetCostParams,
 )
 
-AWS_PRICING_REGION_MAP = {
-    "us-east-1": "US East (N. Virginia)",
-    "us-east-2": "US East (Ohio)",
-    "us-west-1": "US West (N. California)",
-    "us-west-2": "US West (Oregon)",
-
-    "af-south-1": "Africa (Cape Town)",
-    "ap-east-1": "Asia Pacific (Hong Kong)",
-    "ap-south-1": "Asia Pacific (Mumbai)",
-    "ap-south-2": "Asia Pacific (Hyderabad)",
-    "ap-southeast-1": "Asia Pacific (Singapore)",
-    "ap-southeast-2": "Asia Pacific (Sydney)",
-    "ap-southeast-3": "Asia Pacific (Jakarta)",
-    "ap-southeast-4": "Asia Pacific (Melbourne)",
-    "ap-northeast-1": "Asia Pacific (Tokyo)",
-    "ap-northeast-2": "Asia Pacific (Seoul)",
-    "ap-northeast-3": "Asia Pacific (Osaka)",
-
-    "ca-central-1": "Canada (Central)",
-    "ca-west-1": "Canada West (Calgary)",
-
-    "eu-central-1": "EU (Frankfurt)",
-    "eu-central-2": "EU (Zurich)",
-    "eu-west-1": "EU (Ireland)",
-    "eu-west-2": "EU (London)",
-    "eu-west-3": "EU (Paris)",
-    "eu-north-1": "EU (Stockholm)",
-    "eu-south-1": "EU (Milan)",
-    "eu-south-2": "EU (Spain)",
-
-    "me-south-1": "Middle East (Bahrain)",
-    "me-central-1": "Middle East (UAE)",
-
-    "sa-east-1": "South America (São Paulo)",
-
-    "us-gov-east-1": "AWS GovCloud (US-East)",
-    "us-gov-west-1": "AWS GovCloud (US-West)"
-}
-
-def get_ondemand_price(
-    *, 
-    instance_type: str, 
-    operating_system: str = "Linux",
-    region: str = "ap-south-1"
-):
 
-    pricing = boto3.client("pricing", region_name="us-east-1")
+def _ondemand_price_from_api(instance_type, operating_system, region, tenancy, license_model):
+    pricing = get_pricing_client()
 
     region_name = AWS_PRICING_REGION_MAP.get(region)
     if not region_name:
@@ -69,9 +35,12 @@ def get_ondemand_price(
         {"Type": "TERM_MATCH", "Field": "instanceType", "Value": instance_type},
         {"Type": "TERM_MATCH", "Field": "location", "Value": region_name},
         {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": operating_system},
+        {"Type": "TERM_MATCH", "Field": "tenancy", "Value": tenancy},
         {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
         {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
     ]
+    if license_model:
+        filters.append({"Type": "TERM_MATCH", "Field": "licenseModel", "Value": license_model})
 
     resp = pricing.get_products(ServiceCode="AmazonEC2", Filters=filters)
 
@@ -83,7 +52,30 @@ def get_ondemand_price(
     # Get the OnDemand price per hour
     on_demand_terms = next(iter(price_item["terms"]["OnDemand"].values()))
     price_dimension = next(iter(on_demand_terms["priceDimensions"].values()))
-    price_per_hour = float(price_dimension["pricePerUnit"]["USD"])
+    return float(price_dimension["pricePerUnit"]["USD"])
+
+
+def get_ondemand_price(
+    *, 
+    instance_type: str, 
+    operating_system: str = "Linux",
+    region: str = "ap-south-1",
+    tenancy: str = "Shared",
+    license_model: Optional[str] = None
+):
+    # Local price list index first; the Pricing API only when it has no answer
+    price_per_hour = pricing_index.ondemand_price(
+        region, instance_type, operating_system, tenancy, license_model
+    )
+    if price_per_hour is not None:
+        source = {"source": "price_list_index", "price_list_version": pricing_index.version()}
+    else:
+        price_per_hour = _ondemand_price_from_api(
+            instance_type, operating_system, region, tenancy, license_model
+        )
+        if isinstance(price_per_hour, dict):
+            return price_per_hour
+        source = {"source": "pricing_api"}
 
     return {
         "instance_type": instance_type,
@@ -91,6 +83,7 @@ def get_ondemand_price(
         "region": region,
         "price_per_hour_usd": price_per_hour,
         "price_per_month_usd": round(price_per_hour * 720, 2),
+        **source,
     }
 
 
@@ -101,9 +94,17 @@ def get_spot_price_history(
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None,
     availability_zone: Optional[str] = None,
+    analyze: bool = False,
+    bid_price: Optional[float] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
+
+    if analyze:
+        return _analyze_spot_prices(
+            ec2, instance_type, product_description, start_time, end_time,
+            availability_zone, bid_price, region,
+        )
 
     req = {
         "InstanceTypes": [instance_type],
@@ -138,17 +139,183 @@ def get_spot_price_history(
         "history": history,
     }
 
+# Analytics look back a week unless start_time says otherwise
+SPOT_ANALYSIS_WINDOW = timedelta(days=7)
+
+
+def _analyze_spot_prices(ec2, instance_type, product_description, start_time, end_time, availability_zone, bid_price, region):
+    end = spot_analytics.as_datetime(end_time) if end_time else datetime.now(timezone.utc)
+    start = spot_analytics.as_datetime(start_time) if start_time else end - SPOT_ANALYSIS_WINDOW
+
+    cursor = paginate(
+        ec2,
+        "describe_spot_price_history",
+        "SpotPriceHistory",
+        max_results=0,
+        page_size=MAX_PAGE_SIZE,
+        InstanceTypes=[instance_type],
+        ProductDescriptions=[product_description],
+        StartTime=start,
+        EndTime=end,
+        AvailabilityZone=availability_zone,
+    )
+    history = list(cursor)
+
+    return {
+        "instance_type": instance_type,
+        "product_description": product_description,
+        "region": region,
+        "start_time": start.isoformat(),
+        "end_time": end.isoformat(),
+        "history_count": len(history),
+        "bid_price": bid_price,
+        "engine": spot_analytics.engine(),
+        **spot_analytics.analyze_history(history, start, end, bid_price),
+    }
+
+
+# vCPU and memory per instance type; static and the same in every region
+_instance_specs: Dict[str, Dict[str, float]] = {}
+_instance_specs_lock = threading.Lock()
+
+# describe_instance_types accepts at most 100 types per call
+INSTANCE_TYPES_PER_CALL = 100
+
+# rank_by -> option field the scan is sorted on
+SPOT_RANK_KEYS = {"vcpu": "price_per_vcpu", "memory": "price_per_gib", "price": "current_price"}
+
+
+def _instance_specs_for(ec2, instance_types: List[str]) -> Dict[str, Dict[str, float]]:
+    with _instance_specs_lock:
+        missing = [t for t in instance_types if t not in _instance_specs]
+
+    for i in range(0, len(missing), INSTANCE_TYPES_PER_CALL):
+        resp = ec2.describe_instance_types(InstanceTypes=missing[i:i + INSTANCE_TYPES_PER_CALL])
+        with _instance_specs_lock:
+            for item in resp.get("InstanceTypes", []):
+                _instance_specs[item["InstanceType"]] = {
+                    "vcpus": item["VCpuInfo"]["DefaultVCpus"],
+                    "memory_gib": item["MemoryInfo"]["SizeInMiB"] / 1024,
+                }
+
+    with _instance_specs_lock:
+        return {t: _instance_specs[t] for t in instance_types if t in _instance_specs}
+
+
+def _spot_options(*, region, instance_types, product_description, start, end):
+    """One region's (AZ, type) options: current price, recent stats and unit prices."""
+    ec2 = get_ec2_client(region)
+
+    cursor = paginate(
+        ec2,
+        "describe_spot_price_history",
+        "SpotPriceHistory",
+        max_results=0,
+        page_size=MAX_PAGE_SIZE,
+        InstanceTypes=instance_types,
+        ProductDescriptions=[product_description],
+        StartTime=start,
+        EndTime=end,
+    )
+    points: Dict[tuple, list] = {}
+    for item in cursor:
+        points.setdefault((item["AvailabilityZone"], item["InstanceType"]), []).append(
+            (spot_analytics.as_datetime(item["Timestamp"]), float(item["SpotPrice"]))
+        )
+
+    specs = _instance_specs_for(ec2, sorted({instance_type for _, instance_type in points}))
+
+    options = []
+    for (zone, instance_type), series in points.items():
+        prices, weights = spot_analytics.segments(series, start, end)
+        if not prices:
+            continue
+        stats = spot_analytics.summarize(prices, weights)
+        current = max(series)[1]
+        option = {
+            "az": zone,
+            "instance_type": instance_type,
+            "current_price": current,
+            "mean_price": round(stats["mean"], 6),
+            "max_price": stats["max"],
+            "volatility": round(stats["volatility"], 4),
+        }
+        spec = specs.get(instance_type)
+        if spec:
+            option.update({
+                "vcpus": spec["vcpus"],
+                "memory_gib": spec["memory_gib"],
+                "price_per_vcpu": round(current / spec["vcpus"], 6),
+                "price_per_gib": round(current / spec["memory_gib"], 6),
+            })
+        options.append(option)
+
+    return {"options": options}
+
+
+def scan_spot_prices(
+    *,
+    instance_types: List[str],
+    regions: Optional[List[str]] = None,
+    product_description: str = "Linux/UNIX",
+    lookback_hours: float = 24,
+    rank_by: str = "vcpu",
+    top: int = 20,
+    region_timeout: Optional[float] = None
+):
+    if rank_by not in SPOT_RANK_KEYS:
+        return {"error": f"rank_by must be one of {', '.join(SPOT_RANK_KEYS)}"}
+
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(hours=lookback_hours)
+
+    # Every region is scanned at once on the shared fan-out pool
+    scan = fan_out(
+        _spot_options,
+        regions or ["ap-south-1"],
+        "options",
+        timeout=region_timeout,
+        instance_types=list(dict.fromkeys(instance_types)),
+        product_description=product_description,
+        start=start,
+        end=end,
+    )
+    if "options" not in scan:
+        return scan
+
+    key = SPOT_RANK_KEYS[rank_by]
+    # Options without instance specs (unknown type) rank after the rest
+    ranked = sorted(scan["options"], key=lambda o: (key not in o, o.get(key, 0), o["current_price"]))
+
+    return {
+        "instance_types": instance_types,
+        "product_description": product_description,
+        "lookback_hours": lookback_hours,
+        "rank_by": rank_by,
+        "regions": scan["regions"],
+        "option_count": len(ranked),
+        "options": ranked[:top],
+        "errors": scan["errors"],
+        "partial": scan["partial"],
+        "elapsed_ms": scan["elapsed_ms"],
+    }
+
+
 def estimate_instance_cost(
     *,
     instance_type: str,
     operating_system: str = "Linux",
     hours_per_month: int = 730,
-    region: str = "ap-south-1"
+    region: str = "ap-south-1",
+    tenancy: str = "Shared",
+    license_model: Optional[str] = None
 ):
     price_info = get_ondemand_price(
         instance_type=instance_type,
         operating_system=operating_system,
-        region=region
+        region=region,
+        tenancy=tenancy,
+        license_model=license_model
     )
 
     if "error" in price_info:
@@ -161,10 +328,322 @@ def estimate_instance_cost(
         "instance_type": instance_type,
         "hours_per_month": hours_per_month,
         "price_per_hour_usd": hourly,
-        "estimated_cost_usd": round(monthly, 2)
+        "estimated_cost_usd": round(monthly, 2),
+        "source": price_info["source"]
     }
     
 
+# PlatformDetails as EC2 reports it -> operatingSystem as the price list names it
+PLATFORM_OPERATING_SYSTEMS = {
+    "Linux/UNIX": "Linux",
+    "Red Hat Enterprise Linux": "RHEL",
+    "SUSE Linux": "SUSE",
+    "Ubuntu Pro": "Ubuntu Pro",
+}
+
+# operatingSystem -> Spot ProductDescription
+SPOT_PRODUCTS = {"Linux": "Linux/UNIX", "Windows": "Windows", "RHEL": "Red Hat Enterprise Linux", "SUSE": "SUSE Linux"}
+
+TENANCIES = {"default": "Shared", "dedicated": "Dedicated", "host": "Host"}
+
+# Only these states pay for compute; stopped instances still pay for their volumes
+BILLED_STATES = ("pending", "running")
+GONE_STATES = ("shutting-down", "terminated")
+
+# Projection used when the tool lists the fleet itself
+FLEET_FIELDS = [
+    "InstanceId", "InstanceType", "State.Name", "Placement.AvailabilityZone",
+    "Placement.Tenancy", "PlatformDetails", "InstanceLifecycle", "Tags",
+    "BlockDeviceMappings.Ebs.VolumeId",
+]
+
+
+def _operating_system(platform: Optional[str]) -> str:
+    if not platform:
+        return "Linux"
+    if platform.startswith("Windows"):
+        return "Windows"
+    return PLATFORM_OPERATING_SYSTEMS.get(platform, "Linux")
+
+
+def _fleet_row(instance: Dict, default_region: str, group_by_tag: Optional[str]) -> Dict:
+    """
+    The fields pricing needs from one instance: a describe_instances item or an
+    ec2.list_* summary (instance_id, instance_type, state, lifecycle, tags).
+    """
+    state = instance.get("State", instance.get("state"))
+    placement = instance.get("Placement") or {}
+    tags = instance.get("Tags") or instance.get("tags") or []
+    if not isinstance(tags, dict):
+        tags = {t.get("Key"): t.get("Value") for t in tags}
+    return {
+        "instance_id": instance.get("InstanceId") or instance.get("instance_id"),
+        "region": instance.get("region") or default_region,
+        "az": placement.get("AvailabilityZone") or instance.get("availability_zone"),
+        "instance_type": instance.get("InstanceType") or instance.get("instance_type"),
+        "state": state.get("Name", "running") if isinstance(state, dict) else state or "running",
+        "operating_system": _operating_system(instance.get("PlatformDetails") or instance.get("platform_details")),
+        "tenancy": TENANCIES.get(placement.get("Tenancy", "default"), "Shared"),
+        "spot": (instance.get("InstanceLifecycle") or instance.get("lifecycle")) == "spot",
+        "tag": tags.get(group_by_tag, "(untagged)") if group_by_tag else None,
+        "volume_ids": [
+            m["Ebs"]["VolumeId"] for m in instance.get("BlockDeviceMappings") or [] if m.get("Ebs", {}).get("VolumeId")
+        ],
+    }
+
+
+def _region_results(results: Dict[str, object], errors: Dict[str, str], what: str) -> Dict:
+    """Merge map_regions results; a region that raised is reported in ``errors``."""
+    merged: Dict = {}
+    for region, found in results.items():
+        if isinstance(found, Exception):
+            message = f"{what} failed: {found}"
+            errors[region] = f"{errors[region]}; {message}" if region in errors else message
+        else:
+            merged.update(found)
+    return merged
+
+
+def _ondemand_prices(keys, errors: Dict[str, str]) -> Tuple[Dict[tuple, tuple], Dict[tuple, str]]:
+    """
+    ({(region, type, os, tenancy): (hourly price, source)}, {key: why it has no
+    price}); index first, then the Pricing API.
+    """
+    prices: Dict[tuple, tuple] = {}
+    missing: Dict[str, list] = {}
+    for key in keys:
+        price = pricing_index.ondemand_price(*key)
+        if price is not None:
+            prices[key] = (price, "price_list_index")
+        else:
+            missing.setdefault(key[0], []).append(key)
+
+    def lookup(region, region_keys):
+        found = {}
+        for key in region_keys:
+            try:
+                price = _ondemand_price_from_api(key[1], key[2], region, key[3], None)
+            except (BotoCoreError, ClientError) as e:
+                found[key] = (None, str(e))
+                continue
+            found[key] = (None, price["error"]) if isinstance(price, dict) else (price, "pricing_api")
+        return found
+
+    reasons: Dict[tuple, str] = {}
+    for key, (price, source) in _region_results(map_regions(lookup, missing), errors, "On-demand price lookup").items():
+        if price is None:
+            reasons[key] = source
+        else:
+            prices[key] = (price, source)
+    return prices, reasons
+
+
+def _spot_prices(wanted: Dict[str, set], errors: Dict[str, str]) -> Dict[tuple, float]:
+    """{(region, az, type, os): current Spot price} for the running Spot instances."""
+
+    def lookup(region, keys):
+        ec2 = get_ec2_client(region)
+        by_product: Dict[str, set] = {}
+        for _, instance_type, operating_system in keys:
+            if operating_system in SPOT_PRODUCTS:
+                by_product.setdefault(SPOT_PRODUCTS[operating_system], set()).add(instance_type)
+
+        found = {}
+        now = datetime.now(timezone.utc)
+        for product, types in by_product.items():
+            # StartTime=now returns the price currently in effect, newest first
+            cursor = paginate(
+                ec2,
+                "describe_spot_price_history",
+                "SpotPriceHistory",
+                max_results=0,
+                page_size=MAX_PAGE_SIZE,
+                InstanceTypes=sorted(types),
+                ProductDescriptions=[product],
+                StartTime=now,
+            )
+            for item in cursor:
+                found.setdefault((item["AvailabilityZone"], item["InstanceType"], product), float(item["SpotPrice"]))
+        return {
+            (region, az, instance_type, operating_system): found[(az, instance_type, SPOT_PRODUCTS[operating_system])]
+            for az, instance_type, operating_system in keys
+            if (az, instance_type, SPOT_PRODUCTS.get(operating_system)) in found
+        }
+
+    return _region_results(map_regions(lookup, wanted), errors, "Spot price lookup")
+
+
+def _volume_costs(volume_ids: Dict[str, List[str]], errors: Dict[str, str]) -> Dict[str, tuple]:
+    """{volume_id: (size GiB, monthly USD or None)} from describe_volumes and the pricing index."""
+
+    def lookup(region, ids):
+        ec2 = get_ec2_client(region)
+        rates: Dict[str, Optional[Dict]] = {}
+        costs = {}
+        # A filter instead of VolumeIds, so a volume deleted meanwhile does not fail the call
+        for start in range(0, len(ids), MAX_FILTER_VALUES):
+            cursor = paginate(
+                ec2,
+                "describe_volumes",
+                "Volumes",
+                max_results=0,
+                page_size=500,
+                Filters=[{"Name": "volume-id", "Values": ids[start:start + MAX_FILTER_VALUES]}],
+            )
+            for volume in cursor:
+                volume_type = volume.get("VolumeType", "gp2")
+                if volume_type not in rates:
+                    rates[volume_type] = pricing_index.ebs_prices(region, volume_type)
+                costs[volume["VolumeId"]] = (volume.get("Size", 0), _volume_monthly_cost(volume, rates[volume_type]))
+        return costs
+
+    return _region_results(map_regions(lookup, volume_ids), errors, "Volume lookup")
+
+
+def _volume_monthly_cost(volume: Dict, rates: Optional[Dict]) -> Optional[float]:
+    if rates is None:
+        return None
+    monthly = ebs_monthly_cost(
+        rates, volume.get("VolumeType"), volume.get("Size", 0), volume.get("Iops"), volume.get("Throughput")
+    )
+    return sum(monthly.values())
+
+
+def _cost_groups(labels, columns, label_name: str) -> List[Dict]:
+    groups = [
+        {
+            label_name: label,
+            "instances": int(sums["instances"]),
+            "compute_monthly_usd": round(sums["compute"], 2),
+            "storage_monthly_usd": round(sums["storage"], 2),
+            "total_monthly_usd": round(sums["compute"] + sums["storage"], 2),
+        }
+        for label, sums in vector.group_sums(labels, columns).items()
+    ]
+    return sorted(groups, key=lambda g: -g["total_monthly_usd"])
+
+
+def estimate_fleet_cost(
+    *,
+    filters: Optional[EC2ListFilters] = None,
+    instances: Optional[List[Dict]] = None,
+    region: str = "ap-south-1",
+    group_by_tag: Optional[str] = None,
+    include_volumes: bool = True,
+    hours_per_month: int = 730
+):
+    errors: Dict[str, str] = {}
+    if instances is None:
+        filters = EC2ListFilters.model_validate(filters or {})
+        params = filters.model_dump(exclude_unset=True, exclude={"max_results", "next_token", "fields"})
+        params.setdefault("region", region)
+        listing = list_ec2_instances(**params, max_results=0, fields=FLEET_FIELDS)
+        if "error" in listing:
+            return listing
+        instances = listing["instances"]
+        errors = dict(listing.get("errors", {}))
+        # Single-region listings carry the region once, not per instance
+        region = listing.get("region") or region
+
+    rows = [_fleet_row(instance, region, group_by_tag) for instance in instances]
+    unreadable = [i for i, row in enumerate(rows) if not row["instance_type"]]
+    if unreadable:
+        return {
+            "error": f"{len(unreadable)} of {len(rows)} instances have no InstanceType or instance_type",
+            "unreadable": unreadable[:20],
+        }
+    rows = [row for row in rows if row["state"] not in GONE_STATES]
+
+    # Each distinct price is resolved once, however many instances share it
+    billed = [row for row in rows if row["state"] in BILLED_STATES]
+    spot_wanted: Dict[str, set] = {}
+    for row in billed:
+        if row["spot"] and row["az"]:
+            spot_wanted.setdefault(row["region"], set()).add((row["az"], row["instance_type"], row["operating_system"]))
+    spot_prices = _spot_prices(spot_wanted, errors) if spot_wanted else {}
+
+    def spot_key(row):
+        return (row["region"], row["az"], row["instance_type"], row["operating_system"])
+
+    def ondemand_key(row):
+        return (row["region"], row["instance_type"], row["operating_system"], row["tenancy"])
+
+    # Spot instances without a current Spot price fall back to on-demand
+    ondemand, unpriced_reasons = _ondemand_prices(
+        {ondemand_key(row) for row in billed if not (row["spot"] and spot_key(row) in spot_prices)}, errors
+    )
+
+    hourly: List[float] = []
+    unpriced: Dict[tuple, int] = {}
+    for row in rows:
+        price = 0.0
+        if row["state"] in BILLED_STATES:
+            if row["spot"] and spot_key(row) in spot_prices:
+                price = spot_prices[spot_key(row)]
+            elif ondemand_key(row) in ondemand:
+                price = ondemand[ondemand_key(row)][0]
+            else:
+                unpriced[ondemand_key(row)] = unpriced.get(ondemand_key(row), 0) + 1
+        hourly.append(price)
+
+    volumes: Dict[str, tuple] = {}
+    if include_volumes:
+        volume_ids: Dict[str, List[str]] = {}
+        for row in rows:
+            volume_ids.setdefault(row["region"], []).extend(row["volume_ids"])
+        volumes = _volume_costs({r: list(dict.fromkeys(ids)) for r, ids in volume_ids.items() if ids}, errors)
+    storage = [sum(volumes[v][1] or 0.0 for v in row["volume_ids"] if v in volumes) for row in rows]
+
+    columns = {
+        "instances": [1.0] * len(rows),
+        "compute": [price * hours_per_month for price in hourly],
+        "storage": storage,
+    }
+    compute_total = sum(columns["compute"])
+    storage_total = sum(storage)
+
+    result = {
+        "instance_count": len(rows),
+        "billed_instances": len(billed),
+        "hours_per_month": hours_per_month,
+        "monthly_cost_usd": {
+            "compute": round(compute_total, 2),
+            "storage": round(storage_total, 2),
+            "total": round(compute_total + storage_total, 2),
+        },
+        "by_type": _cost_groups([row["instance_type"] for row in rows], columns, "instance_type"),
+        "by_region": _cost_groups([row["region"] for row in rows], columns, "region"),
+        "prices": [
+            {"region": k[0], "instance_type": k[1], "operating_system": k[2], "tenancy": k[3], "price_per_hour_usd": p, "source": s}
+            for k, (p, s) in sorted(ondemand.items())
+        ] + [
+            {"region": k[0], "az": k[1], "instance_type": k[2], "operating_system": k[3], "price_per_hour_usd": p, "source": "spot"}
+            for k, p in sorted(spot_prices.items())
+        ],
+        "unpriced": [
+            {
+                "region": k[0], "instance_type": k[1], "operating_system": k[2], "tenancy": k[3], "instances": n,
+                "reason": unpriced_reasons.get(k, errors.get(k[0], "No price found")),
+            }
+            for k, n in sorted(unpriced.items())
+        ],
+        "price_list_version": pricing_index.version(),
+        "engine": vector.engine(),
+    }
+    if group_by_tag:
+        result["by_tag"] = {"tag": group_by_tag, "groups": _cost_groups([row["tag"] for row in rows], columns, "value")}
+    if include_volumes:
+        result["volumes"] = {
+            "count": len(volumes),
+            "size_gib": sum(size for size, _ in volumes.values()),
+            "unpriced": sum(1 for _, cost in volumes.values() if cost is None),
+        }
+    if errors:
+        result["errors"] = errors
+        result["partial"] = True
+    return result
+
+
 tools = [
     FunctionTool(
         name="aws.get_ondemand_price",
@@ -174,14 +653,38 @@ tools = [
     ),
     FunctionTool(
         name="aws.get_spot_price_history",
-        description="Get EC2 Spot Instance price history.",
+        description=(
+            "Get EC2 Spot Instance price history. With analyze=true, walk the full "
+            "window and return per-AZ time-weighted statistics (mean, p50/p90/p99, "
+            "volatility, time under bid_price) plus a recommended AZ and MaxPrice."
+        ),
         fn=get_spot_price_history,
         parameters=SpotPriceHistoryParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="ec2.scan_spot_prices",
+        description=(
+            "Compare current and recent Spot prices for several instance types across "
+            "regions at once; returns (region, AZ, type) options ranked by price per "
+            "vCPU, per GiB of memory or absolute price."
+        ),
+        fn=scan_spot_prices,
+        parameters=ScanSpotPricesParams.model_json_schema(),
+    ),
     FunctionTool(
         name="aws.estimate_instance_cost",
         description="Estimate monthly EC2 cost (uses on-demand pricing).",
         fn=estimate_instance_cost,
         parameters=EC2CostEstimateParams.model_json_schema(),
     ),
+    FunctionTool(
+        name="ec2.estimate_fleet_cost",
+        description=(
+            "Estimate monthly cost of many instances at once: lists them with ec2.list_ec2_instances "
+            "filters (or takes a list call's output), prices each distinct type/OS/region once, "
+            "adds attached EBS volumes and totals by type, region and optionally a tag."
+        ),
+        fn=estimate_fleet_cost,
+        parameters=EstimateFleetCostParams.model_json_schema(),
+    ),
 ]
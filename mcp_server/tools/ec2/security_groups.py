@@ -1,4 +1,18 @@
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import paginate, page_size_for
+from mcp_server.aws.regions import multi_region
+from mcp_server.aws.sg_rules import (
+    COVERS,
+    DIRECTIONS,
+    MAX_PORT,
+    MIN_PORT,
+    OVERLAPS,
+    normalize_protocol,
+    public_rule,
+    sg_rules,
+)
+from mcp_server.core.cache import invalidates
+from mcp_server.core.config import Settings
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from fastmcp.tools import FunctionTool
@@ -8,7 +22,9 @@ from mcp_server.models.ec2 import (
     DeleteSecurityGroupParams,
     ModifyRulesParams,
     DescribeSGParams,
-    ListSGParams
+    ListSGParams,
+    FindSGExposureParams,
+    AnalyzeSGRulesParams,
 )
 
 def to_ip_permissions(rules: List[IpPermission]):
@@ -23,6 +39,7 @@ def to_ip_permissions(rules: List[IpPermission]):
         })
     return perms
 
+@invalidates("security_groups")
 def create_security_group(
     region: str,
     group_name: str,
@@ -30,7 +47,7 @@ def create_security_group(
     vpc_id: str,
     inbound_rules: Optional[List[IpPermission]] = None,
 ) -> Dict[str, Any]:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         resp = ec2.create_security_group(
@@ -55,8 +72,9 @@ def create_security_group(
         return {"error": str(e)}
 
 
+@invalidates("security_groups", ids_from="group_id")
 def delete_security_group(region: str, group_id: str) -> Dict[str, Any]:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         ec2.delete_security_group(GroupId=group_id)
@@ -66,8 +84,9 @@ def delete_security_group(region: str, group_id: str) -> Dict[str, Any]:
         return {"error": str(e), "group_id": group_id}
 
 
+@invalidates("security_groups", ids_from="group_id")
 def authorize_rules(region: str, group_id: str, rules: List[IpPermission]):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         ec2.authorize_security_group_ingress(
@@ -80,8 +99,9 @@ def authorize_rules(region: str, group_id: str, rules: List[IpPermission]):
         return {"error": str(e), "group_id": group_id}
 
 
+@invalidates("security_groups", ids_from="group_id")
 def revoke_rules(region: str, group_id: str, rules: List[IpPermission]):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         ec2.revoke_security_group_ingress(
@@ -95,7 +115,7 @@ def revoke_rules(region: str, group_id: str, rules: List[IpPermission]):
 
 
 def describe_security_group(region: str, group_id: str = None, group_name: str = None):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     try:
         filters = []
@@ -112,14 +132,26 @@ def describe_security_group(region: str, group_id: str = None, group_name: str =
         return {"error": str(e)}
 
 
-def list_security_groups(region: str):
-    ec2 = boto3.client("ec2", region_name=region)
+@multi_region("security_groups")
+def list_security_groups(
+    region: str,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+):
+    ec2 = get_ec2_client(region)
 
     try:
-        resp = ec2.describe_security_groups()
+        cursor = paginate(
+            ec2,
+            "describe_security_groups",
+            "SecurityGroups",
+            max_results=max_results,
+            next_token=next_token,
+            page_size=page_size_for(max_results),
+        )
         sgs = []
 
-        for sg in resp.get("SecurityGroups", []):
+        for sg in cursor:
             sgs.append({
                 "group_id": sg["GroupId"],
                 "group_name": sg["GroupName"],
@@ -128,11 +160,114 @@ def list_security_groups(region: str):
                 "inbound_rule_count": len(sg.get("IpPermissions", [])),
             })
 
-        return {"region": region, "security_groups": sgs}
+        return {"region": region, "security_groups": sgs, "next_token": cursor.next_token}
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@multi_region("security_groups", ("group_count", "rule_count", "truncated", "refreshed"))
+def find_exposure(
+    *,
+    port: Optional[int] = None,
+    to_port: Optional[int] = None,
+    protocol: str = "tcp",
+    cidr: Optional[str] = None,
+    source_group: Optional[str] = None,
+    match: str = COVERS,
+    direction: str = "ingress",
+    vpc_id: Optional[str] = None,
+    max_results: Optional[int] = None,
+    refresh: bool = False,
+    region: str = "ap-south-1",
+):
+    if direction not in DIRECTIONS:
+        return {"error": f"direction must be one of: {', '.join(DIRECTIONS)}"}
+    if match not in (COVERS, OVERLAPS):
+        return {"error": f"match must be {COVERS} or {OVERLAPS}"}
+    if cidr and source_group:
+        return {"error": "Pass cidr or source_group, not both"}
+    from_port = MIN_PORT if port is None else port
+    to_port = (MAX_PORT if port is None else port) if to_port is None else to_port
+    if to_port < from_port:
+        return {"error": "to_port must not be below port"}
+
+    limit = max_results or Settings.DEFAULT_MAX_RESULTS
+    try:
+        index, refreshed = sg_rules.compiled(region, refresh=refresh)
+        with index.lock:
+            matched = index.exposure(direction, normalize_protocol(protocol), from_port, to_port, cidr, source_group, match)
+            by_group: Dict[str, List[int]] = {}
+            for rule_id in matched:
+                group_id = index.rules[rule_id]["group_id"]
+                if vpc_id and index.groups[group_id]["vpc_id"] != vpc_id:
+                    continue
+                by_group.setdefault(group_id, []).append(rule_id)
+            # Only the returned page is turned into response records
+            groups = [
+                {**index.groups[group_id], "rules": [public_rule(index.rules[i]) for i in sorted(by_group[group_id])]}
+                for group_id in sorted(by_group)[:limit]
+            ]
+    except Exception as e:
+        return {"error": str(e)}
+
+    return {
+        "region": region,
+        "group_count": len(by_group),
+        "rule_count": sum(len(ids) for ids in by_group.values()),
+        "security_groups": groups,
+        "truncated": len(by_group) > limit,
+        "refreshed": refreshed,
+    }
+
 
+@multi_region(
+    "security_groups",
+    ("groups_checked", "groups_with_findings", "duplicate_rules", "shadowed_rules", "truncated", "refreshed"),
+)
+def analyze_rules(
+    *,
+    group_ids: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    refresh: bool = False,
+    region: str = "ap-south-1",
+):
+    try:
+        index, refreshed = sg_rules.compiled(region, refresh=refresh)
+        with index.lock:
+            unknown = [g for g in group_ids or [] if g not in index.groups]
+            if unknown:
+                return {"error": f"Unknown security groups in {region}: {', '.join(unknown)}"}
+            findings = []
+            for group_id in group_ids or sorted(index.groups):
+                duplicates, shadowed = index.analyze(group_id)
+                if duplicates or shadowed:
+                    findings.append({
+                        **index.groups[group_id],
+                        "duplicates": [
+                            {"rule": public_rule(d["rule"]), "duplicate_of": public_rule(d["duplicate_of"])} for d in duplicates
+                        ],
+                        "shadowed": [
+                            {"rule": public_rule(s["rule"]), "shadowed_by": public_rule(s["shadowed_by"])} for s in shadowed
+                        ],
+                    })
+            checked = len(group_ids) if group_ids else len(index.groups)
     except Exception as e:
         return {"error": str(e)}
-    
+
+    limit = max_results or Settings.DEFAULT_MAX_RESULTS
+    return {
+        "region": region,
+        "groups_checked": checked,
+        "groups_with_findings": len(findings),
+        "duplicate_rules": sum(len(f["duplicates"]) for f in findings),
+        "shadowed_rules": sum(len(f["shadowed"]) for f in findings),
+        "security_groups": findings[:limit],
+        "truncated": len(findings) > limit,
+        "refreshed": refreshed,
+    }
+
+
 tools = [
     FunctionTool(
         name="ec2.create_security_group",
@@ -169,5 +304,20 @@ tools = [
         description="List all security groups in a region.",
         fn=list_security_groups,
         parameters=ListSGParams.model_json_schema(),
-    )   
+    ),
+    FunctionTool(
+        name="ec2.find_security_group_exposure",
+        description=(
+            "Security groups whose rules allow a port (or range) and protocol from a CIDR or another group, "
+            "e.g. which groups expose 22 to 0.0.0.0/0; answered from compiled CIDR and port indexes."
+        ),
+        fn=find_exposure,
+        parameters=FindSGExposureParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="ec2.analyze_security_group_rules",
+        description="Find duplicate rules and rules shadowed by a broader rule of the same security group.",
+        fn=analyze_rules,
+        parameters=AnalyzeSGRulesParams.model_json_schema(),
+    ),
 ]
\ No newline at end of file
@@ -1,10 +1,10 @@
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
 import os
 
 DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
 def list_ec2_instances(region: str = DEFAULT_REGION):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     resp = ec2.describe_instances()
 
     instances = []
@@ -0,0 +1,19 @@
+"""
+Inventory Tools Module
+
+Queries that span resource types and a feed of inventory changes,
+answered from in-memory state kept by the server.
+"""
+
+from .changes import tools as change_tools
+from .tags import tools as tag_tools
+
+tools = [
+    *tag_tools,
+    *change_tools,
+]
+
+__all__ = [
+    "tag_tools",
+    "change_tools",
+]
@@ -0,0 +1,45 @@
+# mcp_server/tools/inventory/changes.py
+
+from fastmcp.tools import FunctionTool
+from typing import List, Optional
+
+from mcp_server.core.change_feed import change_feed
+from mcp_server.core.config import Settings
+from mcp_server.core.executor import long_poll
+from mcp_server.models.inventory import InventoryChangesParams
+
+
+# A waiting call holds a waiter slot, not one of the region's slots
+@long_poll
+def inventory_changes(
+    *,
+    since: Optional[str] = None,
+    resource_types: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    wait_seconds: float = 0,
+    region: str = "ap-south-1",
+):
+    try:
+        feed = change_feed.changes(
+            region,
+            since,
+            resource_types,
+            limit=max_results or Settings.DEFAULT_MAX_RESULTS,
+            wait=min(max(wait_seconds, 0), Settings.MAX_WAIT_SECONDS),
+        )
+    except Exception as e:
+        return {"error": str(e)}
+    return {"region": region, **feed}
+
+
+tools = [
+    FunctionTool(
+        name="inventory.changes",
+        description=(
+            "Instances and volumes added, removed or modified (state, IP, type, attachment or tag changes) "
+            "since a token, from a background sync of the region. Returns a new token; reset=true means re-list."
+        ),
+        fn=inventory_changes,
+        parameters=InventoryChangesParams.model_json_schema(),
+    ),
+]
@@ -0,0 +1,60 @@
+# mcp_server/tools/inventory/tags.py
+
+from fastmcp.tools import FunctionTool
+from typing import List, Optional
+
+from mcp_server.aws.regions import multi_region
+from mcp_server.aws.tag_index import tag_index
+from mcp_server.core.config import Settings
+from mcp_server.models.inventory import QueryTagsParams
+
+
+@multi_region("resources", ("count", "by_type", "index"))
+def query_tags(
+    *,
+    query: str,
+    resource_types: Optional[List[str]] = None,
+    refresh: bool = False,
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+    region: str = "ap-south-1",
+):
+    limit = max_results or Settings.DEFAULT_MAX_RESULTS
+    # Matches are ordered by (type, id); the token is the last pair returned
+    after = tuple(next_token.split("/", 1)) if next_token else None
+
+    try:
+        # One extra match tells whether another page follows
+        page, counts, info = tag_index.query(
+            region, query, resource_types, refresh=refresh, limit=limit + 1, after=after
+        )
+    except Exception as e:
+        return {"error": str(e)}
+
+    more = len(page) > limit
+    page = page[:limit]
+    return {
+        "region": region,
+        "query": query,
+        "count": sum(counts.values()),
+        "by_type": {resource_type: n for resource_type, n in counts.items() if n},
+        "resources": [
+            {"resource_type": resource_type, "id": resource_id, "tags": tags}
+            for resource_type, resource_id, tags in page
+        ],
+        "next_token": f"{page[-1][0]}/{page[-1][1]}" if more else None,
+        "index": info,
+    }
+
+
+tools = [
+    FunctionTool(
+        name="inventory.query_tags",
+        description=(
+            "Find instances, volumes, snapshots, security groups, VPCs and subnets by a boolean tag query "
+            "(AND/OR/NOT, key exists, value prefix), answered from an in-memory tag index."
+        ),
+        fn=query_tags,
+        parameters=QueryTagsParams.model_json_schema(),
+    ),
+]
@@ -0,0 +1,15 @@
+"""
+Operations Tools Module
+
+Status and wait tools for long-running operations started by other tools.
+"""
+
+from .operations import tools as operation_tools
+
+tools = [
+    *operation_tools,
+]
+
+__all__ = [
+    "operation_tools",
+]
@@ -0,0 +1,54 @@
+# mcp_server/tools/ops/operations.py
+
+from fastmcp.tools import FunctionTool
+from typing import Optional
+
+from mcp_server.core.config import Settings
+from mcp_server.core.executor import long_poll
+from mcp_server.core.operations import operations
+from mcp_server.models.ops import (
+    OperationStatusParams,
+    WaitOperationParams,
+    ListOperationsParams,
+)
+
+
+def operation_status(*, operation_id: str):
+    status = operations.status(operation_id)
+    if status is None:
+        return {"error": f"Unknown or expired operation: {operation_id}"}
+    return status
+
+
+@long_poll
+def wait_operation(*, operation_id: str, timeout_seconds: float = 60):
+    status = operations.wait(operation_id, min(max(timeout_seconds, 0), Settings.MAX_WAIT_SECONDS))
+    if status is None:
+        return {"error": f"Unknown or expired operation: {operation_id}"}
+    return {**status, "timed_out": status["status"] == "pending"}
+
+
+def list_operations(*, status: Optional[str] = None):
+    return {"operations": operations.list(status)}
+
+
+tools = [
+    FunctionTool(
+        name="ops.status",
+        description="Get the status and progress of a long-running operation (snapshot, copy, AMI, launch).",
+        fn=operation_status,
+        parameters=OperationStatusParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="ops.wait",
+        description="Wait until a long-running operation finishes or the timeout passes, then return its status.",
+        fn=wait_operation,
+        parameters=WaitOperationParams.model_json_schema(),
+    ),
+    FunctionTool(
+        name="ops.list",
+        description="List tracked long-running operations.",
+        fn=list_operations,
+        parameters=ListOperationsParams.model_json_schema(),
+    ),
+]
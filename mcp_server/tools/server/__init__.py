@@ -0,0 +1,15 @@
+"""
+Server Tools Module
+
+Introspection tools for the MCP server itself.
+"""
+
+from .stats import tools as stats_tools
+
+tools = [
+    *stats_tools,
+]
+
+__all__ = [
+    "stats_tools",
+]
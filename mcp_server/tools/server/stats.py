@@ -0,0 +1,60 @@
+# mcp_server/tools/server/stats.py
+
+from fastmcp.tools import FunctionTool
+from typing import List, Optional
+
+from mcp_server.aws.ami_catalog import ami_catalog_stats
+from mcp_server.aws.batcher import batcher_stats
+from mcp_server.aws.pool import pool_stats
+from mcp_server.aws.sg_rules import sg_rules_stats
+from mcp_server.aws.tag_index import tag_index_stats
+from mcp_server.aws.throttle import throttle_stats
+from mcp_server.core.cache import inventory_cache
+from mcp_server.core.change_feed import change_feed_stats
+from mcp_server.core.metrics import metrics
+from mcp_server.core.operations import operations
+from mcp_server.models.server import ServerStatsParams
+from mcp_server.tools.vpc.graph import topology_stats
+
+SECTIONS = {
+    "throttling": throttle_stats,
+    "clients": pool_stats,
+    "cache": inventory_cache.stats,
+    "batching": batcher_stats,
+    "operations": operations.stats,
+    "ami_catalog": ami_catalog_stats,
+    "tag_index": tag_index_stats,
+    "change_feed": change_feed_stats,
+    "topology": topology_stats,
+    "sg_rules": sg_rules_stats,
+}
+
+
+def server_stats(*, sections: Optional[List[str]] = None, reset: bool = False):
+    wanted = set(sections or ["tools", "aws", *SECTIONS])
+    unknown = wanted - {"tools", "aws", *SECTIONS}
+    if unknown:
+        return {"error": f"Unknown sections: {', '.join(sorted(unknown))}"}
+
+    snapshot = metrics.snapshot()
+    stats = {"uptime_seconds": snapshot["uptime_seconds"]}
+    for section in ("tools", "aws"):
+        if section in wanted:
+            stats[section] = snapshot[section]
+    for section, read in SECTIONS.items():
+        if section in wanted:
+            stats[section] = read()
+
+    if reset:
+        metrics.reset()
+    return stats
+
+
+tools = [
+    FunctionTool(
+        name="server.stats",
+        description="Server metrics: per-tool and per-AWS-call latency percentiles, errors, retries and bytes, plus throttling, client pool, cache, batching, operation, AMI catalog, tag index, change feed, VPC topology and security group rule index stats.",
+        fn=server_stats,
+        parameters=ServerStatsParams.model_json_schema(),
+    ),
+]
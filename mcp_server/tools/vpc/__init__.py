@@ -6,12 +6,15 @@ Import this module to get access to all EC2 tools.
 """
 
 from .describe_vpc import tools as describe_tools
+from .topology import tools as topology_tools
 
 # Aggregate all tools into a single list
 tools = [
     *describe_tools,
+    *topology_tools,
 ]
 
 __all__ = [
     "describe_tools",
+    "topology_tools",
 ]
@@ -1,11 +1,16 @@
 # mcp_server/tools/ec2/vpc_tools.py
 
-import boto3
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import paginate, page_size_for
+from mcp_server.aws.regions import multi_region
+from mcp_server.core.cache import cached
 from fastmcp.tools import FunctionTool
 from typing import Optional
 
 from mcp_server.models.vpc.describe_vpc import (
     RegionOnlyParams,
+    ListVpcsParams,
+    ListSubnetsParams,
     DescribeVpcParams,
     DescribeSubnetParams
 )
@@ -14,12 +19,27 @@ from mcp_server.models.vpc.describe_vpc import (
 # LIST ALL VPCS
 # ============================================================
 
-def list_vpcs(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
-    resp = ec2.describe_vpcs()
+@multi_region("vpcs")
+def list_vpcs(
+    *,
+    region: str = "ap-south-1",
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+):
+    ec2 = get_ec2_client(region)
+    cursor = paginate(
+        ec2,
+        "describe_vpcs",
+        "Vpcs",
+        max_results=max_results,
+        next_token=next_token,
+        page_size=page_size_for(max_results),
+    )
+    vpcs = list(cursor)
     return {
         "region": region,
-        "vpcs": resp.get("Vpcs", [])
+        "vpcs": vpcs,
+        "next_token": cursor.next_token,
     }
 
 
@@ -28,7 +48,7 @@ def list_vpcs(*, region: str = "ap-south-1"):
 # ============================================================
 
 def get_default_vpc(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
     resp = ec2.describe_vpcs(
         Filters=[{"Name": "isDefault", "Values": ["true"]}]
     )
@@ -44,8 +64,9 @@ def get_default_vpc(*, region: str = "ap-south-1"):
 # DESCRIBE SPECIFIC VPC
 # ============================================================
 
+@multi_region("vpcs")
 def describe_vpc(*, vpc_id: Optional[str] = None, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     if vpc_id:
         resp = ec2.describe_vpcs(VpcIds=[vpc_id])
@@ -62,12 +83,28 @@ def describe_vpc(*, vpc_id: Optional[str] = None, region: str = "ap-south-1"):
 # LIST SUBNETS
 # ============================================================
 
-def list_subnets(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
-    resp = ec2.describe_subnets()
+@multi_region("subnets")
+@cached("subnets")
+def list_subnets(
+    *,
+    region: str = "ap-south-1",
+    max_results: Optional[int] = None,
+    next_token: Optional[str] = None,
+):
+    ec2 = get_ec2_client(region)
+    cursor = paginate(
+        ec2,
+        "describe_subnets",
+        "Subnets",
+        max_results=max_results,
+        next_token=next_token,
+        page_size=page_size_for(max_results),
+    )
+    subnets = list(cursor)
     return {
         "region": region,
-        "subnets": resp.get("Subnets", [])
+        "subnets": subnets,
+        "next_token": cursor.next_token,
     }
 
 
@@ -76,7 +113,7 @@ def list_subnets(*, region: str = "ap-south-1"):
 # ============================================================
 
 def get_default_subnets(*, region: str = "ap-south-1"):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     # Fetch default VPC
     vpcs = ec2.describe_vpcs(
@@ -107,13 +144,14 @@ def get_default_subnets(*, region: str = "ap-south-1"):
 # DESCRIBE SPECIFIC SUBNET OR FILTER BY VPC
 # ============================================================
 
+@multi_region("subnets")
 def describe_subnet(
     *,
     subnet_id: Optional[str] = None,
     vpc_id: Optional[str] = None,
     region: str = "ap-south-1"
 ):
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = get_ec2_client(region)
 
     filters = []
     if vpc_id:
@@ -139,7 +177,7 @@ tools = [
         name="vpc.list_vpcs",
         description="List all VPCs in a region.",
         fn=list_vpcs,
-        parameters=RegionOnlyParams.model_json_schema()
+        parameters=ListVpcsParams.model_json_schema()
     ),
     FunctionTool(
         name="vpc.get_default_vpc",
@@ -157,7 +195,7 @@ tools = [
         name="vpc.list_subnets",
         description="List all subnets in a region.",
         fn=list_subnets,
-        parameters=RegionOnlyParams.model_json_schema()
+        parameters=ListSubnetsParams.model_json_schema()
     ),
     FunctionTool(
         name="vpc.get_default_subnets",
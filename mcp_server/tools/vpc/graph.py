@@ -0,0 +1,319 @@
+"""
+Per-region VPC topology graph.
+
+Questions like "what runs in this subnet and which security groups front it"
+used to take several sequential describe calls. The graph fetches a region's
+VPCs, subnets, route tables, network interfaces, instances and security groups
+concurrently (six paginated describes in parallel) and links them:
+
+    vpc ── subnet ── network interface ── instance
+     │       │               └── security group ── vpc
+     └── route table ── subnet (explicit association, else the main table)
+
+Every node keeps a compact record, and membership is indexed by VPC and by
+subnet. Neighbour, membership and IP utilization queries are then answered from
+memory. A graph is rebuilt after AWS_MCP_TOPOLOGY_TTL seconds, or on the next
+query after a mutating tool invalidates one of the resource types it holds.
+"""
+
+import ipaddress
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from mcp_server.aws.ec2_client import get_ec2_client
+from mcp_server.aws.pagination import MAX_PAGE_SIZE, paginate
+from mcp_server.core.cache import IndexState, RegionalIndex
+from mcp_server.core.config import Settings
+
+# AWS reserves the first four and the last address of every subnet
+RESERVED_IPS_PER_SUBNET = 5
+
+# Instances in these states no longer hold addresses
+GONE_STATES = {"shutting-down", "terminated"}
+
+NODE_TYPES = ("vpc", "subnet", "route_table", "network_interface", "instance", "security_group")
+
+# Inventory cache resource types whose invalidation makes a graph stale
+INVALIDATED_BY = {"vpcs", "subnets", "route_tables", "network_interfaces", "instances", "security_groups"}
+
+# describe_route_tables pages hold at most 100 items
+_ROUTE_TABLE_PAGE = 100
+
+_fetch_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="aws-mcp-topology")
+
+
+def _name(item: Dict[str, Any]) -> Optional[str]:
+    for tag in item.get("Tags") or []:
+        if tag.get("Key") == "Name":
+            return tag.get("Value")
+    return None
+
+
+def usable_ips(cidr: str) -> int:
+    return max(ipaddress.ip_network(cidr, strict=False).num_addresses - RESERVED_IPS_PER_SUBNET, 0)
+
+
+def _route_target(route: Dict[str, Any]) -> Optional[str]:
+    for key in (
+        "GatewayId", "NatGatewayId", "TransitGatewayId", "VpcPeeringConnectionId",
+        "NetworkInterfaceId", "InstanceId", "EgressOnlyInternetGatewayId", "LocalGatewayId",
+    ):
+        if route.get(key):
+            return route[key]
+    return None
+
+
+class Topology:
+    """One region's graph: node records, undirected edges and type and membership indexes."""
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: Dict[str, Set[str]] = {}
+        self.by_vpc: Dict[str, Set[str]] = {}
+        self.by_subnet: Dict[str, Set[str]] = {}
+        self.by_type: Dict[str, List[str]] = {}
+        self.built_at = 0.0
+        self.build_seconds = 0.0
+
+    def _add(self, node_id: str, record: Dict[str, Any]):
+        self.nodes[node_id] = {"id": node_id, **record}
+        self.edges.setdefault(node_id, set())
+        self.by_type.setdefault(record["type"], []).append(node_id)
+        if record.get("vpc_id"):
+            self.by_vpc.setdefault(record["vpc_id"], set()).add(node_id)
+        if record.get("subnet_id"):
+            self.by_subnet.setdefault(record["subnet_id"], set()).add(node_id)
+
+    def _link(self, a: Optional[str], b: Optional[str]):
+        # Both ends must be nodes: references to resources outside the fetch are dropped
+        if a in self.nodes and b in self.nodes:
+            self.edges[a].add(b)
+            self.edges[b].add(a)
+
+    @classmethod
+    def build(cls, fetched: Dict[str, List[Dict[str, Any]]]) -> "Topology":
+        graph = cls()
+        for vpc in fetched["vpcs"]:
+            graph._add(vpc["VpcId"], {
+                "type": "vpc",
+                "name": _name(vpc),
+                "cidr": vpc.get("CidrBlock"),
+                "is_default": vpc.get("IsDefault", False),
+                "state": vpc.get("State"),
+            })
+        for subnet in fetched["subnets"]:
+            total = usable_ips(subnet["CidrBlock"]) if subnet.get("CidrBlock") else 0
+            available = subnet.get("AvailableIpAddressCount", 0)
+            graph._add(subnet["SubnetId"], {
+                "type": "subnet",
+                "name": _name(subnet),
+                "vpc_id": subnet.get("VpcId"),
+                "cidr": subnet.get("CidrBlock"),
+                "az": subnet.get("AvailabilityZone"),
+                "usable_ips": total,
+                "available_ips": available,
+                "default_for_az": subnet.get("DefaultForAz", False),
+                "map_public_ip": subnet.get("MapPublicIpOnLaunch", False),
+                "network_interfaces": 0,
+            })
+        for group in fetched["security_groups"]:
+            graph._add(group["GroupId"], {
+                "type": "security_group",
+                "name": group.get("GroupName"),
+                "vpc_id": group.get("VpcId"),
+                "description": group.get("Description"),
+            })
+        for instance in fetched["instances"]:
+            graph._add(instance["InstanceId"], {
+                "type": "instance",
+                "name": _name(instance),
+                "vpc_id": instance.get("VpcId"),
+                "subnet_id": instance.get("SubnetId"),
+                "state": instance.get("State", {}).get("Name"),
+                "instance_type": instance.get("InstanceType"),
+                "private_ip": instance.get("PrivateIpAddress"),
+                "public_ip": instance.get("PublicIpAddress"),
+                "security_groups": [g["GroupId"] for g in instance.get("SecurityGroups", [])],
+            })
+        for eni in fetched["network_interfaces"]:
+            graph._add(eni["NetworkInterfaceId"], {
+                "type": "network_interface",
+                "interface_type": eni.get("InterfaceType"),
+                "vpc_id": eni.get("VpcId"),
+                "subnet_id": eni.get("SubnetId"),
+                "status": eni.get("Status"),
+                "private_ips": [a["PrivateIpAddress"] for a in eni.get("PrivateIpAddresses", [])],
+                "public_ip": eni.get("Association", {}).get("PublicIp"),
+                "instance_id": eni.get("Attachment", {}).get("InstanceId"),
+                "security_groups": [g["GroupId"] for g in eni.get("Groups", [])],
+                "description": eni.get("Description"),
+            })
+
+        explicit: Dict[str, str] = {}
+        main: Dict[str, str] = {}
+        for table in fetched["route_tables"]:
+            table_id = table["RouteTableId"]
+            associations = table.get("Associations", [])
+            subnets = [a["SubnetId"] for a in associations if a.get("SubnetId")]
+            is_main = any(a.get("Main") for a in associations)
+            graph._add(table_id, {
+                "type": "route_table",
+                "name": _name(table),
+                "vpc_id": table.get("VpcId"),
+                "main": is_main,
+                "routes": [
+                    {
+                        "destination": r.get("DestinationCidrBlock") or r.get("DestinationIpv6CidrBlock") or r.get("DestinationPrefixListId"),
+                        "target": _route_target(r),
+                        "state": r.get("State"),
+                    }
+                    for r in table.get("Routes", [])
+                ],
+            })
+            for subnet_id in subnets:
+                explicit[subnet_id] = table_id
+            if is_main and table.get("VpcId"):
+                main[table["VpcId"]] = table_id
+
+        for node_id, node in list(graph.nodes.items()):
+            graph._link(node_id, node.get("vpc_id"))
+            graph._link(node_id, node.get("subnet_id"))
+            if node["type"] in ("instance", "network_interface"):
+                for group_id in node["security_groups"]:
+                    graph._link(node_id, group_id)
+            if node["type"] == "network_interface":
+                graph._link(node_id, node["instance_id"])
+                subnet = graph.nodes.get(node.get("subnet_id"))
+                if subnet:
+                    subnet["network_interfaces"] += 1
+            if node["type"] == "subnet":
+                table_id = explicit.get(node_id) or main.get(node.get("vpc_id"))
+                node["route_table_id"] = table_id
+                graph._link(node_id, table_id)
+        return graph
+
+    def neighbors(self, node_id: str, depth: int, types: Optional[Iterable[str]] = None) -> List[Tuple[int, Dict[str, Any]]]:
+        """(distance, record) for every node within ``depth`` hops, nearest first."""
+        wanted = set(types) if types else None
+        seen = {node_id}
+        frontier = deque([(node_id, 0)])
+        found: List[Tuple[int, Dict[str, Any]]] = []
+        while frontier:
+            current, distance = frontier.popleft()
+            if distance == depth:
+                continue
+            for other in sorted(self.edges.get(current, ())):
+                if other in seen:
+                    continue
+                seen.add(other)
+                record = self.nodes[other]
+                if wanted is None or record["type"] in wanted:
+                    found.append((distance + 1, record))
+                frontier.append((other, distance + 1))
+        return found
+
+    def members(self, container_id: str) -> List[Dict[str, Any]]:
+        """Nodes placed in a VPC or subnet, ordered by type and ID."""
+        index = self.by_vpc if self.nodes[container_id]["type"] == "vpc" else self.by_subnet
+        ids = index.get(container_id, set())
+        return sorted((self.nodes[i] for i in ids), key=lambda n: (NODE_TYPES.index(n["type"]), n["id"]))
+
+    def fronting_groups(self, subnet_id: str) -> List[str]:
+        """Security groups attached to the interfaces and instances in a subnet."""
+        groups: Set[str] = set()
+        for node_id in self.by_subnet.get(subnet_id, ()):
+            groups.update(self.nodes[node_id].get("security_groups") or ())
+        return sorted(groups)
+
+
+def _items(region: str, operation: str, result_key: str, page_size: int) -> List[Dict[str, Any]]:
+    cursor = paginate(get_ec2_client(region), operation, result_key, max_results=0, page_size=page_size)
+    return list(cursor)
+
+
+def _instances(region: str) -> List[Dict[str, Any]]:
+    return [
+        instance
+        for reservation in _items(region, "describe_instances", "Reservations", MAX_PAGE_SIZE)
+        for instance in reservation.get("Instances", [])
+        if instance.get("State", {}).get("Name") not in GONE_STATES
+    ]
+
+
+# fetched key -> loader(region)
+FETCHES: Dict[str, Callable[[str], List[Dict[str, Any]]]] = {
+    "vpcs": lambda region: _items(region, "describe_vpcs", "Vpcs", MAX_PAGE_SIZE),
+    "subnets": lambda region: _items(region, "describe_subnets", "Subnets", MAX_PAGE_SIZE),
+    "route_tables": lambda region: _items(region, "describe_route_tables", "RouteTables", _ROUTE_TABLE_PAGE),
+    "network_interfaces": lambda region: _items(region, "describe_network_interfaces", "NetworkInterfaces", MAX_PAGE_SIZE),
+    "instances": _instances,
+    "security_groups": lambda region: _items(region, "describe_security_groups", "SecurityGroups", MAX_PAGE_SIZE),
+}
+
+
+class _Entry(IndexState):
+    def __init__(self):
+        super().__init__()
+        self.graph: Optional[Topology] = None
+
+
+class TopologyCache(RegionalIndex):
+    resource_types = frozenset(INVALIDATED_BY)
+
+    def __init__(self, ttl: float = Settings.TOPOLOGY_TTL):
+        super().__init__(ttl)
+
+    def _new_entry(self, region: str) -> _Entry:
+        return _Entry()
+
+    def get(self, region: str, refresh: bool = False) -> Tuple[Topology, bool]:
+        """(graph for the region, whether it was rebuilt for this call)"""
+        entry = self._entry(region)
+
+        # The load lock single-flights builds of this region
+        with entry.load_lock:
+            stale, _ = entry.take()
+            graph = entry.graph
+            if graph and not refresh and not stale and not entry.expired(self.ttl):
+                return graph, False
+            started = time.monotonic()
+            futures = {name: _fetch_pool.submit(load, region) for name, load in FETCHES.items()}
+            try:
+                graph = Topology.build({name: future.result() for name, future in futures.items()})
+            except Exception:
+                # The previous graph stays in place until a build succeeds
+                entry.restore(True, ())
+                raise
+            graph.built_at = entry.loaded_at = time.monotonic()
+            graph.build_seconds = graph.built_at - started
+            entry.graph = graph
+            entry.full_loads += 1
+            return graph, True
+
+    def _invalidate(self, scope: Tuple[str, ...], entry: _Entry, resource_type: str, ids: Optional[List[str]]):
+        # The graph is rebuilt as a whole, so any change makes it stale
+        entry.invalidate()
+
+    def _entry_stats(self, region: str, scope: Tuple[str, ...], entry: _Entry, now: float) -> Optional[Dict[str, Any]]:
+        graph = entry.graph
+        if graph is None:
+            return None
+        return {
+            "region": region,
+            "nodes": len(graph.nodes),
+            "edges": sum(len(e) for e in graph.edges.values()) // 2,
+            "age_seconds": round(now - graph.built_at, 1),
+            "build_ms": round(graph.build_seconds * 1000, 1),
+            "builds": entry.full_loads,
+            "stale": entry.stale,
+        }
+
+
+# Process-wide graphs shared by every topology tool
+topology_cache = TopologyCache()
+
+
+def topology_stats() -> Dict[str, Any]:
+    return topology_cache.stats()
@@ -0,0 +1,191 @@
+# mcp_server/tools/vpc/topology.py
+
+from fastmcp.tools import FunctionTool
+from typing import Optional, List
+
+from mcp_server.aws.regions import multi_region
+from mcp_server.core.config import Settings
+from mcp_server.models.vpc.topology import (
+    TopologyNeighborsParams,
+    TopologyMembersParams,
+    SubnetUtilizationParams,
+)
+from mcp_server.tools.vpc.graph import NODE_TYPES, topology_cache
+
+
+def _check_types(resource_types: Optional[List[str]]) -> Optional[str]:
+    unknown = [t for t in resource_types or [] if t not in NODE_TYPES]
+    return f"Unknown resource types: {', '.join(unknown)}" if unknown else None
+
+
+def _counts(records) -> dict:
+    counts = {}
+    for record in records:
+        counts[record["type"]] = counts.get(record["type"], 0) + 1
+    return counts
+
+
+# ============================================================
+# NEIGHBORS
+# ============================================================
+
+def topology_neighbors(
+    *,
+    resource_id: str,
+    depth: int = 1,
+    resource_types: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    refresh: bool = False,
+    region: str = "ap-south-1",
+):
+    error = _check_types(resource_types)
+    if error:
+        return {"error": error}
+    try:
+        graph, rebuilt = topology_cache.get(region, refresh=refresh)
+    except Exception as e:
+        return {"error": str(e)}
+
+    node = graph.nodes.get(resource_id)
+    if node is None:
+        return {"error": f"{resource_id} is not in the topology of {region}"}
+
+    found = graph.neighbors(resource_id, depth, resource_types)
+    limit = max_results or Settings.DEFAULT_MAX_RESULTS
+    return {
+        "region": region,
+        "resource": node,
+        "count": len(found),
+        "by_type": _counts(record for _, record in found),
+        "neighbors": [{"distance": distance, **record} for distance, record in found[:limit]],
+        "truncated": len(found) > limit,
+        "rebuilt": rebuilt,
+    }
+
+
+# ============================================================
+# MEMBERS OF A VPC OR SUBNET
+# ============================================================
+
+def topology_members(
+    *,
+    container_id: str,
+    resource_types: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    refresh: bool = False,
+    region: str = "ap-south-1",
+):
+    error = _check_types(resource_types)
+    if error:
+        return {"error": error}
+    try:
+        graph, rebuilt = topology_cache.get(region, refresh=refresh)
+    except Exception as e:
+        return {"error": str(e)}
+
+    container = graph.nodes.get(container_id)
+    if container is None or container["type"] not in ("vpc", "subnet"):
+        return {"error": f"{container_id} is not a VPC or subnet in the topology of {region}"}
+
+    members = graph.members(container_id)
+    if resource_types:
+        members = [m for m in members if m["type"] in resource_types]
+    limit = max_results or Settings.DEFAULT_MAX_RESULTS
+
+    result = {
+        "region": region,
+        "container": container,
+        "count": len(members),
+        "by_type": _counts(members),
+        "members": members[:limit],
+        "truncated": len(members) > limit,
+        "rebuilt": rebuilt,
+    }
+    if container["type"] == "subnet":
+        result["route_table"] = graph.nodes.get(container.get("route_table_id"))
+        result["fronting_security_groups"] = [
+            graph.nodes.get(group_id, {"id": group_id}) for group_id in graph.fronting_groups(container_id)
+        ]
+    return result
+
+
+# ============================================================
+# SUBNET IP UTILIZATION
+# ============================================================
+
+@multi_region("subnets", ("usable_ips", "used_ips", "rebuilt"))
+def subnet_utilization(
+    *,
+    vpc_id: Optional[str] = None,
+    min_utilization: Optional[float] = None,
+    refresh: bool = False,
+    region: str = "ap-south-1",
+):
+    try:
+        graph, rebuilt = topology_cache.get(region, refresh=refresh)
+    except Exception as e:
+        return {"error": str(e)}
+
+    subnets = []
+    for subnet_id in graph.by_type.get("subnet", ()):
+        node = graph.nodes[subnet_id]
+        if vpc_id and node["vpc_id"] != vpc_id:
+            continue
+        usable = node["usable_ips"]
+        used = max(usable - node["available_ips"], 0)
+        utilization = round(100 * used / usable, 1) if usable else 0.0
+        if min_utilization is not None and utilization < min_utilization:
+            continue
+        subnets.append({
+            "subnet_id": subnet_id,
+            "name": node["name"],
+            "vpc_id": node["vpc_id"],
+            "az": node["az"],
+            "cidr": node["cidr"],
+            "usable_ips": usable,
+            "available_ips": node["available_ips"],
+            "used_ips": used,
+            "utilization_percent": utilization,
+            "network_interfaces": node["network_interfaces"],
+        })
+    subnets.sort(key=lambda s: (-s["utilization_percent"], s["subnet_id"]))
+
+    return {
+        "region": region,
+        "subnets": subnets,
+        "usable_ips": sum(s["usable_ips"] for s in subnets),
+        "used_ips": sum(s["used_ips"] for s in subnets),
+        "rebuilt": rebuilt,
+    }
+
+
+# ============================================================
+# REGISTER TOOLS
+# ============================================================
+
+tools = [
+    FunctionTool(
+        name="vpc.topology_neighbors",
+        description=(
+            "Resources linked to a VPC, subnet, route table, ENI, instance or security group within N hops, "
+            "from a cached per-region topology graph."
+        ),
+        fn=topology_neighbors,
+        parameters=TopologyNeighborsParams.model_json_schema()
+    ),
+    FunctionTool(
+        name="vpc.topology_members",
+        description=(
+            "Everything placed in a VPC or subnet (subnets, route tables, ENIs, instances, security groups); "
+            "for a subnet also its effective route table and the security groups fronting it."
+        ),
+        fn=topology_members,
+        parameters=TopologyMembersParams.model_json_schema()
+    ),
+    FunctionTool(
+        name="vpc.subnet_utilization",
+        description="Per-subnet IP utilization (usable, available and used addresses, ENI count), fullest first.",
+        fn=subnet_utilization,
+        parameters=SubnetUtilizationParams.model_json_schema()
+    ),
+]
@@ -0,0 +1,94 @@
+"""
+Single-pass group-by over items streamed from a paginated describe call.
+
+``StreamingAggregate`` keeps one running (count, total) per group and per
+dimension, so summarizing 50k snapshots holds a few hundred counters rather
+than 50k dicts. Feed it items straight off a PageCursor and call ``result``
+once the cursor is exhausted.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+# (upper bound in days, label); anything older is ">1y"
+AGE_BUCKETS = ((1, "<1d"), (7, "1-7d"), (30, "7-30d"), (90, "30-90d"), (365, "90d-1y"))
+AGE_LABELS = tuple(label for _, label in AGE_BUCKETS) + (">1y",)
+
+UNTAGGED = "(untagged)"
+
+
+def age_bucket(timestamp: Optional[datetime], now: datetime) -> str:
+    if timestamp is None:
+        return "unknown"
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    days = (now - timestamp).total_seconds() / 86400
+    for limit, label in AGE_BUCKETS:
+        if days < limit:
+            return label
+    return AGE_LABELS[-1]
+
+
+def tag_value(item: Dict[str, Any], key: str) -> str:
+    for tag in item.get("Tags") or []:
+        if tag.get("Key") == key:
+            return tag.get("Value", "")
+    return UNTAGGED
+
+
+class StreamingAggregate:
+    """
+    Count items and sum ``measure`` per group for every dimension. A
+    dimension is a function from an item to its group key; ``order`` fixes
+    the output order of a dimension's groups (age buckets), otherwise groups
+    are listed largest first.
+    """
+
+    def __init__(
+        self,
+        dimensions: Dict[str, Callable[[Dict[str, Any]], Hashable]],
+        measure: Callable[[Dict[str, Any]], float],
+        measure_name: str,
+        order: Optional[Dict[str, Sequence[Hashable]]] = None,
+    ):
+        self.dimensions = dimensions
+        self.measure = measure
+        self.measure_name = measure_name
+        self.order = order or {}
+        self.count = 0
+        self.total = 0.0
+        # dimension -> group -> [count, total]
+        self._groups: Dict[str, Dict[Hashable, List[float]]] = {name: {} for name in dimensions}
+
+    def add(self, item: Dict[str, Any]):
+        value = self.measure(item) or 0
+        self.count += 1
+        self.total += value
+        for name, key_of in self.dimensions.items():
+            key = key_of(item)
+            group = self._groups[name].get(key)
+            if group is None:
+                self._groups[name][key] = [1, value]
+            else:
+                group[0] += 1
+                group[1] += value
+
+    def result(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Totals and, per dimension, up to ``limit`` groups."""
+        by: Dict[str, Any] = {}
+        for name, groups in self._groups.items():
+            if name in self.order:
+                rank = {key: i for i, key in enumerate(self.order[name])}
+                keys = sorted(groups, key=lambda k: rank.get(k, len(rank)))
+            else:
+                keys = sorted(groups, key=lambda k: (-groups[k][1], -groups[k][0]))
+            shown = keys[:limit] if limit else keys
+            by[name] = {
+                "group_count": len(groups),
+                "truncated": len(shown) < len(keys),
+                "groups": [
+                    {"key": key, "count": int(groups[key][0]), self.measure_name: groups[key][1]}
+                    for key in shown
+                ],
+            }
+        return {"count": self.count, self.measure_name: self.total, "by": by}
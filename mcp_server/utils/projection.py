@@ -0,0 +1,103 @@
+"""
+Field projection for raw boto3 describe payloads.
+
+Callers pass ``fields`` as dotted paths ("State.Name", "Tags") and/or preset
+names ("summary", "network"). Paths are compiled once into a nested tree and
+applied to each item as it comes off a page, so unrequested data is dropped
+before it is retained or serialized. A path step that hits a list applies the
+rest of the path to every element ("NetworkInterfaces.PrivateIpAddress").
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+PRESETS: Dict[str, Dict[str, List[str]]] = {
+    "instances": {
+        "summary": [
+            "InstanceId", "InstanceType", "State.Name", "LaunchTime",
+            "PrivateIpAddress", "PublicIpAddress", "InstanceLifecycle",
+            "Placement.AvailabilityZone", "Tags",
+        ],
+        "network": [
+            "InstanceId", "VpcId", "SubnetId", "PrivateIpAddress",
+            "PublicIpAddress", "PrivateDnsName", "PublicDnsName",
+            "SecurityGroups", "NetworkInterfaces.NetworkInterfaceId",
+            "NetworkInterfaces.SubnetId", "NetworkInterfaces.PrivateIpAddresses",
+            "NetworkInterfaces.Association.PublicIp",
+        ],
+        "storage": [
+            "InstanceId", "RootDeviceName", "RootDeviceType", "EbsOptimized",
+            "BlockDeviceMappings.DeviceName", "BlockDeviceMappings.Ebs.VolumeId",
+        ],
+    },
+    "volumes": {
+        "summary": [
+            "VolumeId", "Size", "VolumeType", "State", "AvailabilityZone",
+            "Encrypted", "Iops", "Throughput", "CreateTime", "Tags",
+        ],
+        "attachments": [
+            "VolumeId", "State", "Attachments.InstanceId",
+            "Attachments.Device", "Attachments.State",
+        ],
+    },
+    "snapshots": {
+        "summary": [
+            "SnapshotId", "VolumeId", "VolumeSize", "State", "Progress",
+            "StartTime", "Encrypted", "OwnerId", "Description", "Tags",
+        ],
+    },
+    "images": {
+        "summary": [
+            "ImageId", "Name", "CreationDate", "State", "OwnerId",
+            "ImageOwnerAlias", "Architecture", "PlatformDetails",
+            "VirtualizationType", "RootDeviceType",
+        ],
+    },
+}
+
+
+def _build_tree(paths: List[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            if part in node and node[part] == {}:
+                # An earlier, shorter path already keeps the whole subtree
+                break
+            if last:
+                node[part] = {}
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _apply(value: Any, tree: Dict[str, Any]) -> Any:
+    # An empty subtree keeps the whole value
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_apply(v, tree) for v in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: _apply(value[key], sub) for key, sub in tree.items() if key in value}
+
+
+def compile_projection(
+    fields: Optional[List[str]], resource_type: str
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Return a function projecting one item; identity when no fields are given."""
+    if not fields:
+        return lambda item: item
+
+    presets = PRESETS.get(resource_type, {})
+    paths: List[str] = []
+    for field in fields:
+        paths.extend(presets.get(field, [field]))
+
+    tree = _build_tree(paths)
+    return lambda item: _apply(item, tree)
+
+
+def preset_names(resource_type: str) -> List[str]:
+    return sorted(PRESETS.get(resource_type, {}))
@@ -0,0 +1,110 @@
+"""
+Central response encoding for tool results.
+
+Tools return raw dicts straight from boto3: datetimes, Decimals, bytes and the
+occasional StreamingBody, plus a ResponseMetadata block nobody asked for.
+``render`` encodes a result once with orjson (stdlib json when orjson is not
+installed) and hands FastMCP a finished ToolResult, so the generic
+pydantic-based serialization, which walks the payload twice, is skipped.
+"""
+
+import base64
+import datetime
+import decimal
+import json
+from typing import Any
+
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+DROPPED_KEYS = ("ResponseMetadata",)
+
+
+def _encode_bytes(data: bytes) -> str:
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return base64.b64encode(data).decode("ascii")
+
+
+def _default(obj: Any) -> Any:
+    # orjson handles datetime/date natively; the stdlib fallback does not
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return _encode_bytes(bytes(obj))
+    # botocore's StreamingBody, matched by name so botocore is not imported here
+    if type(obj).__name__ == "StreamingBody":
+        return _encode_bytes(obj.read())
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # Tool arguments validated into Pydantic models (e.g. security group rules)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def strip_metadata(data: Any) -> Any:
+    """
+    Drop ResponseMetadata from a result. boto3 only puts it at the top of a
+    response, and tools embed responses one level down at most, so only the
+    first two levels are checked rather than walking large payloads.
+    """
+    if not isinstance(data, dict):
+        return data
+    if not any(key in data for key in DROPPED_KEYS) and not any(
+        isinstance(v, dict) and any(key in v for key in DROPPED_KEYS) for v in data.values()
+    ):
+        return data
+
+    cleaned = {}
+    for key, value in data.items():
+        if key in DROPPED_KEYS:
+            continue
+        if isinstance(value, dict) and any(k in value for k in DROPPED_KEYS):
+            value = {k: v for k, v in value.items() if k not in DROPPED_KEYS}
+        cleaned[key] = value
+    return cleaned
+
+
+def dumps(data: Any) -> bytes:
+    """Encode a tool result as compact JSON bytes."""
+    data = strip_metadata(data)
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def render(result: Any) -> Any:
+    """
+    Turn a raw tool result into a ToolResult. Dicts also become the structured
+    content; other values are returned as text only. Results that are already
+    ToolResults pass through untouched.
+    """
+    if isinstance(result, ToolResult):
+        return result
+
+    encoded = dumps(result)
+    structured = loads(encoded) if isinstance(result, dict) else None
+    # model_construct skips ToolResult.__init__, which would push the already
+    # JSON-safe structured content through pydantic serialization again
+    return ToolResult.model_construct(
+        content=[TextContent(type="text", text=encoded.decode("utf-8"))],
+        structured_content=structured,
+        meta=None,
+        is_error=False,
+    )
@@ -0,0 +1,152 @@
+"""
+Time-weighted statistics over spot price history.
+
+A spot price holds from its timestamp until the next change in the same
+Availability Zone, so a plain average over the points overweights bursts of
+short-lived changes. Every point is weighted by how long its price was in
+effect inside the requested window; the last point runs to the window's end.
+
+NumPy does the work when it is installed and is imported on first use, so the
+server starts without it. Without NumPy the same statistics are computed in
+pure Python, which is fine for the few thousand points a week of history holds.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from mcp_server.utils.vector import engine, numpy
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Suggested MaxPrice = recommended AZ's p99 plus this much headroom
+MAX_PRICE_HEADROOM = 0.1
+
+
+def as_datetime(value: Any) -> datetime:
+    """Timezone-aware datetime from a datetime or an ISO 8601 string."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def segments(
+    points: Iterable[Tuple[datetime, float]], start: datetime, end: datetime
+) -> Tuple[List[float], List[float]]:
+    """
+    (prices, seconds in effect) for one AZ's points, clipped to [start, end].
+    The price in effect at ``start`` is the last point at or before it.
+    """
+    ordered = sorted(points)
+    prices: List[float] = []
+    durations: List[float] = []
+    for i, (timestamp, price) in enumerate(ordered):
+        begins = max(timestamp, start)
+        ends = min(ordered[i + 1][0] if i + 1 < len(ordered) else end, end)
+        if ends > begins:
+            prices.append(price)
+            durations.append((ends - begins).total_seconds())
+    return prices, durations
+
+
+def _summary_numpy(np, prices: Sequence[float], weights: Sequence[float], bid: Optional[float]) -> Dict[str, Any]:
+    p = np.asarray(prices, dtype=float)
+    w = np.asarray(weights, dtype=float)
+    total = w.sum()
+    mean = float(np.dot(p, w) / total)
+    std = float(np.sqrt(np.dot(w, (p - mean) ** 2) / total))
+
+    order = np.argsort(p, kind="stable")
+    cumulative = np.cumsum(w[order])
+    ranks = np.searchsorted(cumulative, np.asarray(QUANTILES) * total, side="left")
+    quantiles = p[order][np.minimum(ranks, len(p) - 1)]
+
+    summary = {
+        "mean": mean,
+        "min": float(p.min()),
+        "max": float(p.max()),
+        "stddev": std,
+        **{f"p{round(q * 100)}": float(v) for q, v in zip(QUANTILES, quantiles)},
+    }
+    if bid is not None:
+        summary["fraction_under_bid"] = float(w[p <= bid].sum() / total)
+    return summary
+
+
+def _summary_python(prices: Sequence[float], weights: Sequence[float], bid: Optional[float]) -> Dict[str, Any]:
+    total = sum(weights)
+    mean = sum(p * w for p, w in zip(prices, weights)) / total
+    std = math.sqrt(sum(w * (p - mean) ** 2 for p, w in zip(prices, weights)) / total)
+
+    ordered = sorted(zip(prices, weights))
+    quantiles = {}
+    for q in QUANTILES:
+        target, cumulative = q * total, 0.0
+        for price, weight in ordered:
+            cumulative += weight
+            if cumulative >= target:
+                break
+        quantiles[f"p{round(q * 100)}"] = price
+
+    summary = {"mean": mean, "min": min(prices), "max": max(prices), "stddev": std, **quantiles}
+    if bid is not None:
+        summary["fraction_under_bid"] = sum(w for p, w in zip(prices, weights) if p <= bid) / total
+    return summary
+
+
+def summarize(prices: Sequence[float], weights: Sequence[float], bid: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Time-weighted mean, min, max, standard deviation, p50/p90/p99, volatility
+    (stddev / mean) and, with ``bid``, the fraction of time the price was at
+    or under it.
+    """
+    np = numpy()
+    summary = _summary_numpy(np, prices, weights, bid) if np else _summary_python(prices, weights, bid)
+    summary["volatility"] = summary["stddev"] / summary["mean"] if summary["mean"] else 0.0
+    return summary
+
+
+def analyze_history(
+    history: Iterable[Dict[str, Any]],
+    start: datetime,
+    end: datetime,
+    bid: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Per-AZ statistics for raw ``SpotPriceHistory`` items plus the cheapest AZ
+    (lowest mean), the most stable one (lowest volatility), a recommended AZ
+    (lowest p90, i.e. cheap most of the time) and a MaxPrice suggestion.
+    """
+    by_zone: Dict[str, List[Tuple[datetime, float]]] = {}
+    for item in history:
+        by_zone.setdefault(item["AvailabilityZone"], []).append(
+            (as_datetime(item["Timestamp"]), float(item["SpotPrice"]))
+        )
+
+    zones = []
+    for zone, points in by_zone.items():
+        prices, weights = segments(points, start, end)
+        if not prices:
+            continue
+        stats = summarize(prices, weights, bid)
+        zones.append({
+            "az": zone,
+            "points": len(points),
+            "current": max(points)[1],
+            **{key: round(value, 6) for key, value in stats.items()},
+        })
+    zones.sort(key=lambda z: z["mean"])
+
+    result: Dict[str, Any] = {"zones": zones}
+    if zones:
+        recommended = min(zones, key=lambda z: (z["p90"], z["volatility"]))
+        result.update({
+            "cheapest_az": zones[0]["az"],
+            "most_stable_az": min(zones, key=lambda z: (z["volatility"], z["mean"]))["az"],
+            "recommended_az": recommended["az"],
+            # MaxPrice is a string parameter of create_spot_instance
+            "suggested_max_price": f"{recommended['p99'] * (1 + MAX_PRICE_HEADROOM):.6f}",
+        })
+    return result
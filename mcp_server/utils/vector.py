@@ -0,0 +1,51 @@
+"""
+Optional NumPy support for the analytics tools.
+
+NumPy is not a requirement of the server. ``numpy()`` imports it on first use
+(keeping it off the start-up path) and returns None when it is not installed,
+so callers can keep a pure-Python path for small inputs.
+"""
+
+from typing import Any, Dict, Hashable, List, Sequence
+
+_numpy: Any = None
+
+
+def numpy():
+    """The NumPy module, or None when it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy as np
+        except ImportError:
+            np = False
+        _numpy = np
+    return _numpy or None
+
+
+def engine() -> str:
+    return "numpy" if numpy() else "python"
+
+
+def group_sums(labels: Sequence[Hashable], columns: Dict[str, Sequence[float]]) -> Dict[Hashable, Dict[str, float]]:
+    """
+    Sum every column per label: {label: {column: total}}. Labels keep their
+    first-seen order.
+    """
+    groups: Dict[Hashable, int] = {}
+    index: List[int] = [groups.setdefault(label, len(groups)) for label in labels]
+    totals: Dict[str, Sequence[float]] = {}
+
+    np = numpy()
+    if np is not None:
+        codes = np.asarray(index, dtype=np.intp)
+        for name, values in columns.items():
+            totals[name] = np.bincount(codes, weights=np.asarray(values, dtype=float), minlength=len(groups)).tolist()
+    else:
+        for name, values in columns.items():
+            sums = [0.0] * len(groups)
+            for i, value in zip(index, values):
+                sums[i] += value
+            totals[name] = sums
+
+    return {label: {name: totals[name][i] for name in columns} for label, i in groups.items()}
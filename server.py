@@ -1,13 +1,17 @@
 from fastmcp import FastMCP
+from mcp_server.core.config import Settings
+from mcp_server.core.metrics import serve_prometheus
 from mcp_server.core.registry import ToolRegistry
 
 mcp = FastMCP("aws-mcp")
 
-# Auto-load all tools
-for tool in ToolRegistry.load_all_tools():
+# Advertise every tool from the manifest; modules load on first call
+for tool in ToolRegistry.load_lazy_tools():
     mcp.add_tool(tool)
 
 def run():
+    if Settings.METRICS_PORT:
+        serve_prometheus(Settings.METRICS_PORT, Settings.METRICS_HOST)
     mcp.run()
 
 if __name__ == "__main__":
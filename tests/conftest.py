@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+# The stand-in answers before anything is signed, but botocore still wants
+# credentials to exist
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+
+from benchmarks.fake_aws import FakeAWS, SyntheticAccount  # noqa: E402
+from mcp_server.aws.pool import pool  # noqa: E402
+from mcp_server.core.cache import inventory_cache  # noqa: E402
+
+REGION = "us-east-1"
+
+
+@pytest.fixture(scope="session")
+def account():
+    return SyntheticAccount(region=REGION, instances=300, snapshots=300, security_groups=60, images=300)
+
+
+@pytest.fixture(scope="session")
+def _installed(account):
+    # A client keeps the first stand-in installed on it, so there is one per session
+    fake = FakeAWS(account)
+    fake.install(pool.get_client("ec2", REGION))
+    return fake
+
+
+@pytest.fixture
+def fake_aws(_installed):
+    inventory_cache.clear()
+    _installed.calls.clear()
+    return _installed
@@ -0,0 +1,57 @@
+import threading
+
+from botocore.exceptions import ClientError
+
+from mcp_server.aws import ami_catalog as catalog_module
+from mcp_server.aws.ami_catalog import AmiCatalog
+from mcp_server.tools.ec2.ami import resolve_latest_ami
+from tests.conftest import REGION
+
+
+def _own_images(account):
+    return sorted(
+        (i for i in account.images if not i["Public"]), key=lambda i: i["CreationDate"], reverse=True
+    )
+
+
+def test_find_returns_newest_first_and_counts_selective_patterns(fake_aws, account):
+    catalog = AmiCatalog()
+    own = _own_images(account)
+
+    matches, total, info = catalog.find(REGION, "self", "app-*", limit=3)
+    assert [m["ImageId"] for m in matches] == [i["ImageId"] for i in own[:3]]
+    assert total == len(own)
+    assert info["refreshed"] == "full"
+
+    # Answered from the catalog: no second load
+    _, _, info = catalog.find(REGION, "self", "app-*")
+    assert info["refreshed"] is None
+    assert catalog.stats()["catalogs"][0]["full_loads"] == 1
+
+
+def test_invalidation_does_not_wait_for_a_load(fake_aws, account):
+    catalog = AmiCatalog()
+    newest = _own_images(account)[0]["ImageId"]
+    catalog.find(REGION, "self", "app-*")
+    owner_catalog = catalog._entry(REGION, "self")
+
+    # A lookup holding the catalog for a load must not block the deregistering call
+    with owner_catalog.load_lock:
+        done = threading.Thread(target=catalog._invalidated, args=(REGION, "images", [newest]))
+        done.start()
+        done.join(timeout=2)
+        assert not done.is_alive()
+
+    matches, _, _ = catalog.find(REGION, "self", "app-*", limit=5)
+    assert newest not in [m["ImageId"] for m in matches]
+    assert owner_catalog.stale is False
+
+
+def test_resolve_latest_ami_reports_load_errors(fake_aws, monkeypatch):
+    def denied(*args, **kwargs):
+        raise ClientError({"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}}, "DescribeImages")
+
+    monkeypatch.setattr(catalog_module.ami_catalog, "_load_full", denied)
+    result = resolve_latest_ami(name_pattern="app-*", owner="self", region=REGION, refresh=True)
+    assert "UnauthorizedOperation" in result["error"]
+    assert result["region"] == REGION
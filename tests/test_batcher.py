@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from mcp_server.aws.batcher import batcher
+from mcp_server.core.executor import ToolExecutor
+from mcp_server.tools.ebs.snapshot_tools import describe_snapshot
+from mcp_server.tools.ec2.list import get_instance_details
+
+from tests.conftest import REGION
+
+
+@pytest.fixture(autouse=True)
+def wide_window(monkeypatch):
+    # Room for every call to reach the batcher on a slow machine or through a GC pause
+    monkeypatch.setattr(batcher, "window", 0.5)
+
+
+def _concurrently(fn, arguments, workers=64):
+    executor = ToolExecutor(max_workers=workers)
+    tool = executor.wrap(fn, "ec2")
+
+    async def run():
+        return await asyncio.gather(*(tool(**kwargs) for kwargs in arguments), return_exceptions=True)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+
+def test_concurrent_instance_lookups_share_one_request(fake_aws, account):
+    ids = [i["InstanceId"] for i in account.instances[:50]]
+
+    results = _concurrently(get_instance_details, [{"instance_id": i, "region": REGION} for i in ids])
+
+    assert [r["details"]["InstanceId"] for r in results] == ids
+    assert fake_aws.calls["DescribeInstances"] == 1
+
+
+def test_concurrent_snapshot_lookups_share_one_request(fake_aws, account):
+    ids = [s["SnapshotId"] for s in account.snapshots[:50]]
+
+    results = _concurrently(describe_snapshot, [{"SnapshotId": i, "region": REGION} for i in ids])
+
+    assert all("error" not in r for r in results)
+    assert fake_aws.calls["DescribeSnapshots"] == 1
+
+
+def test_unknown_id_fails_only_its_own_lookup(fake_aws, account):
+    ids = [i["InstanceId"] for i in account.instances[:5]] + ["i-0000000000000dead"]
+
+    results = _concurrently(get_instance_details, [{"instance_id": i, "region": REGION} for i in ids])
+
+    assert all(r["details"] for r in results[:5])
+    assert "InvalidInstanceID.NotFound" in str(results[5])
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from mcp_server.core import change_feed as feed_module
+from mcp_server.core.change_feed import ChangeFeed, _RegionFeed
+from mcp_server.tools.inventory.changes import inventory_changes
+from tests.conftest import REGION
+
+
+def _record(state="running", **fields):
+    return {"state": state, "instance_type": "t3.micro", "tags": {}, **fields}
+
+
+@pytest.fixture
+def feed():
+    region_feed = _RegionFeed(REGION)
+    region_feed.apply({("instances", "i-1"): _record(), ("instances", "i-2"): _record()})
+    return region_feed
+
+
+def test_first_sync_is_the_baseline(feed):
+    assert feed.seq == 0
+    assert feed.events == []
+    assert feed.counts == {"instances": 2, "volumes": 0}
+
+
+def test_apply_numbers_added_removed_and_modified(feed):
+    feed.apply({
+        ("instances", "i-1"): _record(state="stopped"),
+        ("volumes", "vol-1"): {"state": "available", "size": 8},
+    })
+    by_id = {event["id"]: event for event in feed.events}
+    assert sorted(event["seq"] for event in feed.events) == [1, 2, 3]
+    assert by_id["i-1"]["change"] == "modified"
+    assert by_id["i-1"]["fields"] == {"state": {"old": "running", "new": "stopped"}}
+    assert by_id["vol-1"]["change"] == "added"
+    assert by_id["i-2"]["change"] == "removed"
+    assert feed.token() == f"{feed.epoch}.3"
+
+
+def test_read_pages_and_filters(feed):
+    feed.apply({("instances", f"i-{n}"): _record() for n in range(1, 6)})
+    events, token, more = feed.read(0, None, limit=2)
+    assert [e["id"] for e in events] == ["i-3", "i-4"]
+    assert more
+    # The token resumes just before the first event not returned
+    assert token == f"{feed.epoch}.2"
+    events, token, more = feed.read(2, None, limit=2)
+    assert [e["id"] for e in events] == ["i-5"]
+    assert not more and token == feed.token()
+    assert feed.read(0, ["volumes"], limit=10)[0] == []
+
+
+def test_retention_drops_the_oldest_events(feed, monkeypatch):
+    monkeypatch.setattr(feed_module, "RETAINED_EVENTS", 2)
+    feed.apply({("instances", f"i-{n}"): _record() for n in range(1, 6)})
+    assert feed.seqs == [2, 3]
+
+
+def test_tokens_reset_on_other_epochs_and_out_of_range(fake_aws):
+    changes = ChangeFeed(interval=3600)
+    start = changes.changes(REGION)
+    assert start["reset"] is False and start["changes"] == []
+    epoch, _, seq = start["token"].partition(".")
+
+    feed = changes._entry(REGION)
+    instance_id = next(key for key in feed.snapshot if key[0] == "instances")
+    current = dict(feed.snapshot)
+    current[instance_id] = {**current[instance_id], "state": "stopping"}
+    feed.apply(current)
+
+    got = changes.changes(REGION, since=start["token"])
+    assert not got["reset"]
+    assert [(c["id"], c["change"]) for c in got["changes"]] == [(instance_id[1], "modified")]
+    assert got["token"] == f"{epoch}.{int(seq) + 1}"
+
+    for stale in ("0000.0", f"{epoch}.99", f"{epoch}.x", "garbage"):
+        reset = changes.changes(REGION, since=stale)
+        assert reset["reset"] and reset["changes"] == []
+        assert reset["token"] == got["token"]
+
+    # The current token is in range and simply has nothing new
+    assert changes.changes(REGION, since=got["token"])["reset"] is False
+
+
+def test_wait_returns_on_the_next_change(fake_aws):
+    changes = ChangeFeed(interval=3600)
+    token = changes.changes(REGION)["token"]
+    feed = changes._entry(REGION)
+    current = dict(feed.snapshot)
+    current[("volumes", "vol-new")] = {"state": "creating"}
+    threading.Timer(0.2, feed.apply, [current]).start()
+
+    started = time.monotonic()
+    got = changes.changes(REGION, since=token, wait=5)
+    assert time.monotonic() - started < 2
+    assert [c["id"] for c in got["changes"]] == ["vol-new"]
+
+
+def test_the_tool_is_a_long_poll():
+    # Waiting callers take a waiter slot instead of one of the region's slots
+    assert inventory_changes.long_poll is True
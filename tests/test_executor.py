@@ -0,0 +1,45 @@
+import asyncio
+import threading
+import time
+
+from mcp_server.core.executor import ToolExecutor, long_poll
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_long_polls_are_capped_and_do_not_hold_region_slots():
+    executor = ToolExecutor(max_workers=8, default_region_limit=1, max_waiters=2)
+    release = threading.Event()
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    @long_poll
+    def wait(*, region: str = "us-east-1"):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        release.wait(5)
+        with lock:
+            active[0] -= 1
+        return {}
+
+    def describe(*, region: str = "us-east-1"):
+        return {"done": time.monotonic()}
+
+    async def scenario():
+        waits = [asyncio.ensure_future(executor.wrap(wait, "ops")(region="us-east-1")) for _ in range(4)]
+        await asyncio.sleep(0.1)
+        # The region allows one call at a time; the waiters must not be holding it
+        result = await asyncio.wait_for(executor.wrap(describe, "ec2")(region="us-east-1"), 2)
+        release.set()
+        await asyncio.gather(*waits)
+        return result
+
+    try:
+        assert "done" in _run(scenario())
+        assert peak[0] == 2
+    finally:
+        release.set()
+        executor.shutdown()
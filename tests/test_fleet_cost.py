@@ -0,0 +1,87 @@
+import pytest
+from botocore.exceptions import EndpointConnectionError
+
+from mcp_server.models.ec2.list import EC2ListFilters
+from mcp_server.tools.ec2 import pricing
+from mcp_server.tools.ec2.list import list_ec2_instances, list_running_instances
+from tests.conftest import REGION
+
+HOURLY = 0.1
+ondemand_prices = pricing._ondemand_prices
+
+
+@pytest.fixture(autouse=True)
+def flat_prices(monkeypatch):
+    # Every instance type costs the same, without the Pricing API
+    monkeypatch.setattr(pricing, "_ondemand_prices", lambda keys, errors: ({key: (HOURLY, "test") for key in keys}, {}))
+    monkeypatch.setattr(pricing, "_spot_prices", lambda wanted, errors: {})
+
+
+def test_summary_shape_costs_the_same_as_describe_items(fake_aws):
+    raw = list_ec2_instances(region=REGION, states=["running"], max_results=0)["instances"]
+    summaries = list_running_instances(region=REGION, max_results=1000)["instances"]
+    assert len(summaries) == len(raw) > 0
+
+    from_raw = pricing.estimate_fleet_cost(instances=raw, region=REGION, include_volumes=False, group_by_tag="team")
+    from_summaries = pricing.estimate_fleet_cost(
+        instances=summaries, region=REGION, include_volumes=False, group_by_tag="team"
+    )
+
+    assert from_summaries["instance_count"] == len(raw)
+    assert from_summaries["monthly_cost_usd"] == from_raw["monthly_cost_usd"]
+    assert from_summaries["monthly_cost_usd"]["compute"] == pytest.approx(len(raw) * HOURLY * 730, abs=0.01)
+    assert from_summaries["by_tag"] == from_raw["by_tag"]
+
+
+def test_unreadable_instances_are_an_error_not_zero_cost(fake_aws):
+    result = pricing.estimate_fleet_cost(
+        instances=[{"InstanceType": "m5.large"}, {"id": "i-0123"}, {"type": "t3.micro"}],
+        region=REGION,
+        include_volumes=False,
+    )
+    assert "2 of 3" in result["error"]
+    assert result["unreadable"] == [1, 2]
+
+
+def test_filters_accept_the_model_or_its_dict(fake_aws):
+    as_dict = pricing.estimate_fleet_cost(filters={"region": REGION, "states": ["stopped"]}, include_volumes=False)
+    as_model = pricing.estimate_fleet_cost(
+        filters=EC2ListFilters(region=REGION, states=["stopped"]), include_volumes=False
+    )
+    assert as_dict["instance_count"] == as_model["instance_count"] > 0
+    assert as_dict["billed_instances"] == 0
+
+
+def test_pricing_failures_are_reported_per_key_and_per_region(monkeypatch):
+    monkeypatch.setattr(pricing.pricing_index, "ondemand_price", lambda *key: None)
+
+    def from_api(instance_type, operating_system, region, tenancy, license_model):
+        if region == "eu-west-1":
+            raise RuntimeError("credentials expired")
+        if instance_type == "m5.large":
+            raise EndpointConnectionError(endpoint_url="https://api.pricing")
+        return HOURLY
+
+    monkeypatch.setattr(pricing, "_ondemand_price_from_api", from_api)
+    keys = {
+        (REGION, "t3.micro", "Linux", "Shared"),
+        (REGION, "m5.large", "Linux", "Shared"),
+        ("eu-west-1", "t3.micro", "Linux", "Shared"),
+    }
+    errors = {}
+    prices, reasons = ondemand_prices(keys, errors)
+
+    assert prices == {(REGION, "t3.micro", "Linux", "Shared"): (HOURLY, "pricing_api")}
+    assert "Could not connect" in reasons[(REGION, "m5.large", "Linux", "Shared")]
+    assert errors == {"eu-west-1": "On-demand price lookup failed: credentials expired"}
+
+
+def test_unpriced_instances_carry_the_reason(fake_aws, monkeypatch):
+    def failing(keys, errors):
+        errors[REGION] = "On-demand price lookup failed: boom"
+        return {}, {}
+
+    monkeypatch.setattr(pricing, "_ondemand_prices", failing)
+    result = pricing.estimate_fleet_cost(filters={"region": REGION, "states": ["running"]}, include_volumes=False)
+    assert result["partial"] and result["errors"] == {REGION: "On-demand price lookup failed: boom"}
+    assert result["unpriced"] and all(u["reason"] == result["errors"][REGION] for u in result["unpriced"])
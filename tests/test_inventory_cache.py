@@ -0,0 +1,22 @@
+from mcp_server.core.cache import cached, inventory_cache
+from tests.conftest import REGION
+
+
+def test_results_read_across_an_invalidation_are_not_cached(fake_aws):
+    reads = []
+
+    @cached("widgets")
+    def list_widgets(*, region=REGION, mutate=False):
+        reads.append(mutate)
+        if mutate:
+            # A mutating tool finishing while this read is in flight
+            inventory_cache.invalidate(region, "widgets")
+        return {"widgets": len(reads)}
+
+    first = list_widgets(mutate=True)
+    assert first["cache"]["hit"] is False
+    assert list_widgets(mutate=True)["cache"]["hit"] is False
+
+    list_widgets()
+    assert list_widgets()["cache"]["hit"] is True
+    assert len(reads) == 3
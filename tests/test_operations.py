@@ -0,0 +1,18 @@
+import pytest
+
+from mcp_server.core.operations import FAILED, PENDING, SUCCEEDED, _instance_state
+
+
+@pytest.mark.parametrize(
+    "state, outcome",
+    [
+        ("pending", PENDING),
+        ("running", SUCCEEDED),
+        ("stopping", FAILED),
+        ("stopped", FAILED),
+        ("shutting-down", FAILED),
+        ("terminated", FAILED),
+    ],
+)
+def test_only_running_instances_are_a_successful_launch(state, outcome):
+    assert _instance_state({"State": {"Name": state}})[:2] == (outcome, state)
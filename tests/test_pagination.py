@@ -0,0 +1,59 @@
+import copy
+
+import boto3
+from botocore.stub import Stubber
+
+from mcp_server.aws.pagination import paginate
+
+
+def _reservation(*instance_ids):
+    return {"ReservationId": "r-" + instance_ids[0][2:], "Instances": [{"InstanceId": i} for i in instance_ids]}
+
+
+def _walk(pages, max_results, next_token=None):
+    client = boto3.client("ec2", region_name="us-east-1", aws_access_key_id="x", aws_secret_access_key="x")
+    with Stubber(client) as stubber:
+        for page in pages:
+            # botocore slices a resumed first page in place
+            stubber.add_response("describe_instances", copy.deepcopy(page))
+        cursor = paginate(
+            client, "describe_instances", "Reservations",
+            max_results=max_results, next_token=next_token, count_key="Instances",
+        )
+        instances = [i["InstanceId"] for r in cursor for i in r["Instances"]]
+    return instances, cursor.next_token
+
+
+PAGES = [
+    {"Reservations": [_reservation("i-1", "i-2", "i-3"), _reservation("i-4", "i-5")], "NextToken": "p2"},
+    {"Reservations": [_reservation("i-6"), _reservation("i-7", "i-8")]},
+]
+
+
+def test_limit_counts_instances_not_reservations():
+    instances, token = _walk(PAGES[:1], max_results=3)
+    assert instances == ["i-1", "i-2", "i-3"]
+    assert token is not None
+
+
+def test_resume_token_continues_after_the_last_returned_reservation():
+    _, token = _walk(PAGES[:1], max_results=4)
+    # The second reservation would have taken the count to 5
+    instances, token = _walk([PAGES[0], PAGES[1]], max_results=4, next_token=token)
+    assert instances == ["i-4", "i-5", "i-6"]
+    instances, token = _walk(PAGES[1:], max_results=4, next_token=token)
+    assert instances == ["i-7", "i-8"]
+    assert token is None
+
+
+def test_oversized_reservation_is_returned_whole():
+    instances, _ = _walk(PAGES[:1], max_results=2)
+    assert instances == ["i-1", "i-2", "i-3"]
+
+
+def test_limit_on_a_page_boundary_resumes_with_the_service_token():
+    instances, token = _walk(PAGES[:1], max_results=5)
+    assert instances == ["i-1", "i-2", "i-3", "i-4", "i-5"]
+    instances, token = _walk(PAGES[1:], max_results=5, next_token=token)
+    assert instances == ["i-6", "i-7", "i-8"]
+    assert token is None
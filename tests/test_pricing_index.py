@@ -0,0 +1,87 @@
+import gzip
+import shutil
+from pathlib import Path
+
+import pytest
+
+from mcp_server.aws.pricing_index import PricingIndex, ingest
+
+OFFER = Path(__file__).parent / "fixtures" / "offer.csv"
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    db = tmp_path_factory.mktemp("pricing") / "pricing.sqlite3"
+    meta = ingest(str(OFFER), str(db))
+    return meta, PricingIndex(str(db))
+
+
+def test_ingest_records_offer_metadata_and_row_counts(index):
+    meta, _ = index
+    assert meta["offer_version"] == "20260901000000"
+    assert meta["publication_date"] == "2026-09-01T00:00:00Z"
+    assert meta["rows_scanned"] == "16"
+    # Pre-installed software and reserved rows are skipped; the duplicate is counted
+    assert meta["rows_ec2_ondemand"] == "4"
+    assert meta["duplicates_ec2_ondemand"] == "1"
+    assert meta["rows_ebs_iops"] == "3"
+
+
+def test_duplicate_key_keeps_the_first_price(index):
+    _, prices = index
+    assert prices.ondemand_price("ap-south-1", "m5.large") == pytest.approx(0.101)
+
+
+def test_ondemand_lookup(index):
+    _, prices = index
+    # Location is mapped to a region code when the column is empty
+    assert prices.ondemand_price("us-east-1", "t3.micro") == pytest.approx(0.0112)
+    # License Included is preferred over BYOL unless one is asked for
+    assert prices.ondemand_price("ap-south-1", "m5.large", "Windows") == pytest.approx(0.193)
+    assert prices.ondemand_price(
+        "ap-south-1", "m5.large", "Windows", license_model="Bring your own license"
+    ) == pytest.approx(0.101)
+    assert prices.ondemand_price("ap-south-1", "c5.large") is None
+
+
+def test_ebs_lookups(index):
+    _, prices = index
+    gp3 = prices.ebs_prices("ap-south-1", "gp3")
+    assert gp3["storage_per_gb_month"] == pytest.approx(0.0912)
+    assert gp3["iops_tiers"] == [(0.0, pytest.approx(0.0057))]
+    assert gp3["throughput_per_gibps_month"] == pytest.approx(46.7)
+
+    io2 = prices.ebs_prices("ap-south-1", "io2")
+    assert [start for start, _ in io2["iops_tiers"]] == [0.0, 32000.0]
+    assert io2["throughput_per_gibps_month"] is None
+
+    assert prices.ebs_prices("ap-south-1", "st1") is None
+    assert prices.snapshot_price("ap-south-1") == pytest.approx(0.055)
+    assert prices.snapshot_price("ap-south-1", "archive") == pytest.approx(0.01375)
+    assert prices.transfer_price("ap-south-1", "eu-west-1") == pytest.approx(0.086)
+
+
+def test_ingest_reads_gzipped_offers_and_replaces_the_index(tmp_path):
+    offer = tmp_path / "offer.csv.gz"
+    with open(OFFER, "rb") as src, gzip.open(offer, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    db = tmp_path / "pricing.sqlite3"
+    db.write_text("not a database")
+
+    ingest(str(offer), str(db))
+
+    assert PricingIndex(str(db)).version() == "20260901000000"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_missing_index_is_unavailable(tmp_path):
+    prices = PricingIndex(str(tmp_path / "absent.sqlite3"))
+    assert not prices.available()
+    assert prices.ondemand_price("ap-south-1", "m5.large") is None
+
+
+def test_rejects_files_without_a_header(tmp_path):
+    offer = tmp_path / "offer.csv"
+    offer.write_text('"Version","1"\n')
+    with pytest.raises(ValueError):
+        ingest(str(offer), str(tmp_path / "pricing.sqlite3"))
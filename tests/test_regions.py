@@ -0,0 +1,32 @@
+import threading
+
+from mcp_server.aws import regions
+from mcp_server.aws.regions import fan_out
+
+
+def test_tags_copies_of_shared_items():
+    shared = [{"id": "a"}]
+
+    result = fan_out(lambda region: {"items": shared}, ["r1", "r2"], "items")
+
+    assert shared == [{"id": "a"}]
+    assert sorted(item["region"] for item in result["items"]) == ["r1", "r2"]
+
+
+def test_timed_out_regions_are_reported_as_background_calls():
+    release = threading.Event()
+
+    def slow(region):
+        release.wait(5)
+        return {"items": []}
+
+    result = fan_out(slow, ["r1"], "items", timeout=0.05)
+    try:
+        assert result["partial"]
+        assert "still running" in result["errors"]["r1"]
+        assert result["background_calls"] == 1
+    finally:
+        release.set()
+    for future in list(regions._abandoned):
+        future.result(5)
+    assert regions.background_calls() == 0
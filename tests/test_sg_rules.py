@@ -0,0 +1,169 @@
+import ipaddress
+import random
+
+import pytest
+
+from mcp_server.aws.sg_rules import COVERS, INGRESS, OVERLAPS, PortTree, PrefixTrie, _RegionRules, public_rule
+from mcp_server.tools.ec2.security_groups import analyze_rules, find_exposure
+from tests.conftest import REGION
+
+
+def _net(cidr):
+    return ipaddress.ip_network(cidr)
+
+
+def _permission(protocol, from_port=None, to_port=None, cidr="10.0.0.0/8"):
+    permission = {"IpProtocol": protocol, "IpRanges": [{"CidrIp": cidr}]}
+    if from_port is not None:
+        permission["FromPort"], permission["ToPort"] = from_port, to_port
+    return permission
+
+
+def _rules(*groups):
+    rules = _RegionRules()
+    for group_id, permissions in groups:
+        rules.put_group({"GroupId": group_id, "IpPermissions": permissions})
+    return rules
+
+
+def test_prefix_trie_covering_and_overlapping():
+    trie = PrefixTrie(32)
+    cidrs = ["0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "10.2.0.0/16", "10.1.2.128/25", "192.168.0.0/16"]
+    for rule_id, cidr in enumerate(cidrs):
+        trie.add(_net(cidr), rule_id)
+
+    assert trie.covering(_net("10.1.2.0/24")) == {0, 1, 2}
+    # Overlapping adds the prefixes inside the query
+    assert trie.overlapping(_net("10.1.2.0/24")) == {0, 1, 2, 4}
+    assert trie.overlapping(_net("10.0.0.0/8")) == {0, 1, 2, 3, 4}
+
+    trie.remove(_net("10.1.0.0/16"), 2)
+    assert trie.covering(_net("10.1.2.0/24")) == {0, 1}
+
+    v6 = PrefixTrie(128)
+    v6.add(_net("2001:db8::/32"), 7)
+    assert v6.covering(_net("2001:db8:1::/48")) == {7}
+    assert v6.covering(_net("2001:db9::/48")) == set()
+
+
+def test_port_tree_matches_a_scan():
+    rng = random.Random(7)
+    tree = PortTree()
+    ranges = {}
+    for rule_id in range(500):
+        low = rng.randint(0, 65535)
+        high = min(65535, low + rng.choice([0, 0, 10, 1000, 65535]))
+        ranges[rule_id] = (low, high)
+        tree.add(low, high, rule_id)
+    for rule_id in range(0, 500, 3):
+        tree.remove(*ranges.pop(rule_id), rule_id)
+
+    for _ in range(200):
+        low = rng.randint(0, 65535)
+        high = min(65535, low + rng.choice([0, 5, 5000]))
+        expected = {i for i, (a, b) in ranges.items() if a <= high and b >= low}
+        assert tree.overlapping(low, high) == expected
+    assert tree.overlapping(0, 65535) == set(ranges)
+
+
+def test_icmp_keeps_type_and_code():
+    rules = _rules(("sg-a", [_permission("icmp", 8, -1), _permission("icmp", 3, 4)]))
+    records = [public_rule(rules.rules[i]) for i in rules.by_group["sg-a"]]
+    assert [(r["protocol"], r["from_port"], r["to_port"]) for r in records] == [("icmp", 8, -1), ("icmp", 3, 4)]
+    # Different types are neither duplicates nor shadowed
+    assert rules.analyze("sg-a") == ([], [])
+
+
+@pytest.mark.parametrize(
+    "outer, inner",
+    [
+        (_permission("icmp", -1, -1, "0.0.0.0/0"), _permission("icmp", 8, 0)),
+        (_permission("icmp", 8, -1), _permission("icmp", 8, 0, "10.1.0.0/16")),
+        (_permission("-1"), _permission("icmp", 8, 0, "10.1.0.0/16")),
+        (_permission("tcp", 0, 1024), _permission("tcp", 443, 443, "10.1.0.0/16")),
+        (_permission("-1"), _permission("udp", 53, 53)),
+    ],
+)
+def test_shadowed_rules(outer, inner):
+    rules = _rules(("sg-a", [outer, inner]))
+    duplicates, shadowed = rules.analyze("sg-a")
+    assert duplicates == []
+    assert [(s["rule"]["id"], s["shadowed_by"]["id"]) for s in shadowed] == [tuple(rules.by_group["sg-a"][::-1])]
+
+
+@pytest.mark.parametrize(
+    "one, other",
+    [
+        (_permission("icmp", 8, 0), _permission("icmp", 3, -1)),
+        (_permission("icmp", 8, 0), _permission("icmp", 8, 1)),
+        (_permission("icmp", -1, -1), _permission("icmpv6", 8, -1)),
+        # The ICMP type is not a port
+        (_permission("icmp", 22, -1), _permission("tcp", 22, 22)),
+        (_permission("tcp", 0, 1024), _permission("tcp", 443, 443, "192.168.0.0/16")),
+    ],
+)
+def test_rules_that_do_not_cover_each_other(one, other):
+    rules = _rules(("sg-a", [one, other]))
+    assert rules.analyze("sg-a") == ([], [])
+
+
+def test_duplicates_report_the_later_copy_once():
+    rules = _rules(("sg-a", [_permission("tcp", 22, 22), _permission("tcp", 22, 22), _permission("icmp", 8, -1), _permission("icmp", 8, -1)]))
+    first, second, third, fourth = rules.by_group["sg-a"]
+    duplicates, shadowed = rules.analyze("sg-a")
+    assert [(d["rule"]["id"], d["duplicate_of"]["id"]) for d in duplicates] == [(second, first), (fourth, third)]
+    assert shadowed == []
+
+
+def test_exposure_by_port_protocol_and_source():
+    rules = _rules(
+        ("sg-ssh", [_permission("tcp", 22, 22, "0.0.0.0/0")]),
+        ("sg-web", [_permission("tcp", 80, 443, "10.0.0.0/8")]),
+        ("sg-all", [_permission("-1", cidr="10.1.0.0/16")]),
+        ("sg-ping", [_permission("icmp", 8, -1, "0.0.0.0/0"), _permission("icmp", 3, 4, "0.0.0.0/0")]),
+        ("sg-icmp", [_permission("icmp", -1, -1, "10.0.0.0/8")]),
+    )
+
+    def groups(*args):
+        return {rules.rules[i]["group_id"] for i in rules.exposure(INGRESS, *args)}
+
+    assert groups("tcp", 22, 22, "0.0.0.0/0", None, COVERS) == {"sg-ssh"}
+    assert groups("tcp", 443, 443, "10.1.2.0/24", None, COVERS) == {"sg-web", "sg-all"}
+    assert groups("tcp", 443, 443, "10.0.0.0/8", None, OVERLAPS) == {"sg-web", "sg-all"}
+    # The port of an ICMP query is the type; -1 rules match every type
+    assert groups("icmp", 8, 8, None, None, COVERS) == {"sg-ping", "sg-icmp", "sg-all"}
+    assert {rules.rules[i]["from_port"] for i in rules.exposure(INGRESS, "icmp", 3, 3, "0.0.0.0/0", None, COVERS)} == {3}
+
+
+def test_find_exposure_matches_a_scan_of_the_account(fake_aws, account):
+    result = find_exposure(port=22, cidr="0.0.0.0/0", region=REGION, refresh=True, max_results=10000)
+    expected = sorted(
+        group["GroupId"]
+        for group in account.security_groups
+        if any(
+            p["IpProtocol"] == "tcp" and p["FromPort"] <= 22 <= p["ToPort"]
+            and any(r["CidrIp"] == "0.0.0.0/0" for r in p["IpRanges"])
+            for p in group["IpPermissions"]
+        )
+    )
+    assert [g["group_id"] for g in result["security_groups"]] == expected
+    assert result["refreshed"] == "full"
+
+
+@pytest.mark.parametrize(
+    "tool, arguments",
+    [
+        (find_exposure, {"port": 22, "max_results": 2}),
+        (analyze_rules, {"max_results": 1}),
+    ],
+)
+def test_multi_region_calls_keep_the_region_totals(fake_aws, tool, arguments):
+    single = tool(region=REGION, refresh=True, **arguments)
+    merged = tool(regions=[REGION], **arguments)
+
+    summary = merged["region_summary"][REGION]
+    assert single["truncated"] and summary["truncated"]
+    for key, value in single.items():
+        if key not in ("region", "security_groups", "refreshed"):
+            assert summary[key] == value
+    assert [g["group_id"] for g in merged["security_groups"]] == [g["group_id"] for g in single["security_groups"]]
@@ -0,0 +1,113 @@
+import pytest
+
+from mcp_server.aws.tag_index import TagIndex, parse_query
+from mcp_server.core.cache import inventory_cache
+from mcp_server.tools.inventory.tags import query_tags
+from tests.conftest import REGION
+
+
+def _tags(item):
+    return {tag["Key"]: tag.get("Value", "") for tag in item.get("Tags") or []}
+
+
+@pytest.mark.parametrize(
+    "query, tree",
+    [
+        ("team=payments", ("eq", "team", "payments")),
+        ("team!=payments", ("not", ("eq", "team", "payments"))),
+        ("team=pay*", ("prefix", "team", "pay")),
+        ("owner", ("has", "owner")),
+        ("cost*", ("has_prefix", "cost")),
+        ('name="web *"', ("eq", "name", "web *")),
+        ('"cost center"=a', ("eq", "cost center", "a")),
+        # Adjacent predicates are ANDed, AND binds tighter than OR
+        ("a b OR c", ("or", ("and", ("has", "a"), ("has", "b")), ("has", "c"))),
+        ("a AND (b OR c)", ("and", ("has", "a"), ("or", ("has", "b"), ("has", "c")))),
+        ("NOT a=1 b", ("and", ("not", ("eq", "a", "1")), ("has", "b"))),
+        ("not a", ("not", ("has", "a"))),
+    ],
+)
+def test_parse_query(query, tree):
+    assert parse_query(query) == tree
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ("", "Empty"),
+        ("(a", r"Missing \)"),
+        ("a)", r"Unexpected \)"),
+        ("a AND", "ends early"),
+        ("team*=x", "Key wildcards"),
+        ("OR a", "Unexpected OR"),
+    ],
+)
+def test_parse_errors(query, message):
+    with pytest.raises(ValueError, match=message):
+        parse_query(query)
+
+
+def test_query_matches_a_scan_of_the_account(fake_aws, account):
+    index = TagIndex()
+    query = "(team=payments OR team=data) AND env!=prod"
+    page, counts, info = index.query(REGION, query, ["instances", "volumes"], limit=1000)
+
+    expected = {
+        "instances": sorted(
+            i["InstanceId"] for i in account.instances
+            if _tags(i).get("team") in ("payments", "data") and _tags(i).get("env") != "prod"
+            and i["State"]["Name"] not in ("shutting-down", "terminated")
+        ),
+        "volumes": sorted(
+            v["VolumeId"] for v in account.volumes
+            if _tags(v).get("team") in ("payments", "data") and _tags(v).get("env") != "prod"
+        ),
+    }
+    assert counts == {t: len(ids) for t, ids in expected.items()}
+    assert [(t, i) for t, i, _ in page] == [(t, i) for t in sorted(expected) for i in expected[t]]
+    assert info["refreshed"] == {"instances": "full", "volumes": "full"}
+
+
+def test_pages_resume_after_the_last_pair(fake_aws):
+    index = TagIndex()
+    everything, _, _ = index.query(REGION, "team", ["instances", "volumes"], limit=10000)
+    first, _, _ = index.query(REGION, "team", ["instances", "volumes"], limit=7)
+    rest, _, _ = index.query(REGION, "team", ["instances", "volumes"], limit=10000, after=first[-1][:2])
+    assert first + rest == everything
+
+
+def test_named_invalidation_re_describes_only_those_ids(fake_aws, account):
+    index = TagIndex()
+    index.query(REGION, "team", ["instances"])
+    instance = next(i for i in account.instances if i["State"]["Name"] == "running")
+    original = instance["Tags"]
+    try:
+        instance["Tags"] = original + [{"Key": "audit", "Value": "2026"}]
+        inventory_cache.invalidate(REGION, "instances", [instance["InstanceId"]])
+        page, counts, info = index.query(REGION, "audit=2026", ["instances"])
+        assert info["refreshed"] == {"instances": "incremental"}
+        assert [i for _, i, _ in page] == [instance["InstanceId"]]
+
+        # A broader change reloads the type
+        inventory_cache.invalidate(REGION, "instances")
+        _, _, info = index.query(REGION, "audit", ["instances"])
+        assert info["refreshed"] == {"instances": "full"}
+    finally:
+        instance["Tags"] = original
+
+
+def test_multi_region_calls_keep_the_region_counts(fake_aws):
+    single = query_tags(query="team", resource_types=["instances", "volumes"], max_results=3, region=REGION)
+    merged = query_tags(query="team", resource_types=["instances", "volumes"], max_results=3, regions=[REGION])
+
+    summary = merged["region_summary"][REGION]
+    assert single["count"] > 3
+    assert summary["count"] == single["count"]
+    assert summary["by_type"] == single["by_type"]
+    assert summary["next_token"] == single["next_token"]
+    assert [r["id"] for r in merged["resources"]] == [r["id"] for r in single["resources"]]
+
+
+def test_unknown_resource_type(fake_aws):
+    with pytest.raises(ValueError, match="Unknown resource types: buckets"):
+        TagIndex().query(REGION, "team", ["buckets"])
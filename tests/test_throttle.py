@@ -0,0 +1,77 @@
+import copy
+import types
+
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_server.aws.throttle import (
+    EC2_MUTATING,
+    EC2_NON_MUTATING,
+    EC2_UNFILTERED_NON_MUTATING,
+    RateLimiter,
+    TokenBucket,
+    _CONTEXT_KEY,
+    ec2_bucket,
+)
+
+
+def test_reservations_queue_behind_each_other():
+    bucket = TokenBucket(capacity=2, rate=10.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_reservation_past_max_wait_takes_no_token():
+    bucket = TokenBucket(capacity=1, rate=1.0)
+    bucket.reserve()
+    assert bucket.reserve(max_wait=0.5) is None
+    # The refused call did not push later callers further back
+    assert bucket.reserve(max_wait=2.0) == pytest.approx(1.0, abs=0.01)
+
+
+def test_throttles_floor_the_rate():
+    bucket = TokenBucket(capacity=10, rate=20.0)
+    for _ in range(20):
+        bucket.throttled()
+    assert bucket.rate == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "action, params, bucket",
+    [
+        ("DescribeInstances", {}, EC2_UNFILTERED_NON_MUTATING),
+        ("DescribeVolumes", {"DryRun": False}, EC2_UNFILTERED_NON_MUTATING),
+        ("DescribeInstances", {"Filters": [{"Name": "instance-state-name", "Values": ["running"]}]}, EC2_NON_MUTATING),
+        ("DescribeSnapshots", {"OwnerIds": ["self"], "MaxResults": 1000}, EC2_NON_MUTATING),
+        # Calls scoped to IDs are not unfiltered
+        ("DescribeInstances", {"InstanceIds": ["i-0123"]}, EC2_NON_MUTATING),
+        ("DescribeSecurityGroups", {"GroupIds": ["sg-0123"]}, EC2_NON_MUTATING),
+        # Actions AWS does not meter in the unfiltered bucket
+        ("DescribeRegions", {}, EC2_NON_MUTATING),
+        ("DescribeImages", {"Owners": ["self"]}, EC2_NON_MUTATING),
+        ("DescribeLaunchTemplates", {}, EC2_NON_MUTATING),
+        ("RunInstances", {}, EC2_MUTATING),
+    ],
+)
+def test_ec2_buckets(action, params, bucket):
+    assert ec2_bucket(action, params) == bucket
+
+
+def test_limiter_fails_fast_instead_of_sleeping():
+    limiter = RateLimiter(enabled=True, overrides={"ec2:*": (1, 0.01)}, max_wait=1.0)
+    limit = limiter.limit_for("ec2", "creds", "us-east-1", "DescribeInstances", {})
+    request = types.SimpleNamespace(context={_CONTEXT_KEY: limit})
+
+    limiter._acquire(request, operation_name="DescribeInstances")
+    with pytest.raises(ClientError) as raised:
+        limiter._acquire(request, operation_name="DescribeInstances")
+
+    assert raised.value.response["Error"]["Code"] == "RequestLimitExceeded"
+    assert limit.stats()["rejected"] == 1
+
+
+def test_limit_survives_deepcopy():
+    limit = RateLimiter(enabled=True).limit_for("ec2", "creds", "us-east-1", "CopySnapshot", {})
+    assert copy.deepcopy({_CONTEXT_KEY: limit})[_CONTEXT_KEY] is limit
@@ -0,0 +1,20 @@
+import importlib
+import inspect
+
+import pytest
+
+from mcp_server.core.registry import SERVICE_MODULES
+
+
+def _tools():
+    for module_name in SERVICE_MODULES:
+        yield from getattr(importlib.import_module(module_name), "tools", None) or []
+
+
+@pytest.mark.parametrize("tool", list(_tools()), ids=lambda tool: tool.name)
+def test_advertised_parameters_are_accepted(tool):
+    # An argument the schema offers but the function lacks fails every MCP call using it
+    parameters = inspect.signature(tool.fn).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return
+    assert sorted(set(tool.parameters.get("properties", {})) - set(parameters)) == []
@@ -0,0 +1,133 @@
+import pytest
+
+from mcp_server.core.cache import inventory_cache
+from mcp_server.tools.vpc.graph import Topology, usable_ips
+from mcp_server.tools.vpc.topology import subnet_utilization, topology_members, topology_neighbors
+from tests.conftest import REGION
+
+FETCHED = {
+    "vpcs": [{"VpcId": "vpc-1", "CidrBlock": "10.0.0.0/16", "Tags": [{"Key": "Name", "Value": "main"}]}],
+    "subnets": [
+        {"SubnetId": "subnet-a", "VpcId": "vpc-1", "CidrBlock": "10.0.1.0/24", "AvailableIpAddressCount": 200},
+        {"SubnetId": "subnet-b", "VpcId": "vpc-1", "CidrBlock": "10.0.2.0/28", "AvailableIpAddressCount": 0},
+    ],
+    "route_tables": [
+        {"RouteTableId": "rtb-main", "VpcId": "vpc-1", "Associations": [{"Main": True}], "Routes": []},
+        {
+            "RouteTableId": "rtb-a",
+            "VpcId": "vpc-1",
+            "Associations": [{"SubnetId": "subnet-a", "Main": False}],
+            "Routes": [{"DestinationCidrBlock": "0.0.0.0/0", "GatewayId": "igw-1", "State": "active"}],
+        },
+    ],
+    "security_groups": [{"GroupId": "sg-1", "GroupName": "web", "VpcId": "vpc-1"}],
+    "instances": [
+        {
+            "InstanceId": "i-1",
+            "VpcId": "vpc-1",
+            "SubnetId": "subnet-a",
+            "State": {"Name": "running"},
+            "SecurityGroups": [{"GroupId": "sg-1"}],
+        }
+    ],
+    "network_interfaces": [
+        {
+            "NetworkInterfaceId": "eni-1",
+            "VpcId": "vpc-1",
+            "SubnetId": "subnet-a",
+            "Attachment": {"InstanceId": "i-1"},
+            "Groups": [{"GroupId": "sg-1"}],
+            "PrivateIpAddresses": [{"PrivateIpAddress": "10.0.1.10"}],
+        },
+        {
+            "NetworkInterfaceId": "eni-2",
+            "VpcId": "vpc-1",
+            "SubnetId": "subnet-b",
+            # A group outside the fetch is not linked
+            "Groups": [{"GroupId": "sg-1"}, {"GroupId": "sg-elsewhere"}],
+            "PrivateIpAddresses": [],
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return Topology.build(FETCHED)
+
+
+def test_usable_ips_exclude_the_reserved_five():
+    assert usable_ips("10.0.1.0/24") == 251
+    assert usable_ips("10.0.2.0/28") == 11
+    assert usable_ips("10.0.3.0/30") == 0
+
+
+def test_subnets_use_their_explicit_route_table_else_the_main_one(graph):
+    assert graph.nodes["subnet-a"]["route_table_id"] == "rtb-a"
+    assert graph.nodes["subnet-b"]["route_table_id"] == "rtb-main"
+    assert graph.nodes["rtb-a"]["routes"] == [{"destination": "0.0.0.0/0", "target": "igw-1", "state": "active"}]
+
+
+def test_neighbors_nearest_first(graph):
+    first = graph.neighbors("i-1", 1)
+    assert [(d, r["id"]) for d, r in first] == [(1, "eni-1"), (1, "sg-1"), (1, "subnet-a"), (1, "vpc-1")]
+
+    route_tables = graph.neighbors("i-1", 2, ["route_table"])
+    assert [(d, r["id"]) for d, r in route_tables] == [(2, "rtb-a"), (2, "rtb-main")]
+    assert "sg-elsewhere" not in graph.edges["eni-2"]
+
+
+def test_members_and_fronting_groups(graph):
+    assert [m["id"] for m in graph.members("subnet-a")] == ["eni-1", "i-1"]
+    assert [m["type"] for m in graph.members("vpc-1")] == [
+        "subnet", "subnet", "route_table", "route_table", "network_interface", "network_interface",
+        "instance", "security_group",
+    ]
+    assert graph.fronting_groups("subnet-b") == ["sg-1", "sg-elsewhere"]
+    assert graph.nodes["subnet-a"]["network_interfaces"] == 1
+
+
+def test_subnet_utilization_matches_the_account(fake_aws, account):
+    result = subnet_utilization(region=REGION, refresh=True)
+    expected_usable = sum(usable_ips(s["CidrBlock"]) for s in account.subnets)
+    expected_used = sum(
+        max(usable_ips(s["CidrBlock"]) - s["AvailableIpAddressCount"], 0) for s in account.subnets
+    )
+    assert result["usable_ips"] == expected_usable
+    assert result["used_ips"] == expected_used
+    percents = [s["utilization_percent"] for s in result["subnets"]]
+    assert percents == sorted(percents, reverse=True)
+
+    busy = subnet_utilization(region=REGION, min_utilization=50)
+    assert busy["rebuilt"] is False
+    assert all(s["utilization_percent"] >= 50 for s in busy["subnets"])
+
+
+def test_multi_region_utilization_keeps_the_region_totals(fake_aws):
+    single = subnet_utilization(region=REGION, refresh=True)
+    merged = subnet_utilization(regions=[REGION])
+
+    summary = merged["region_summary"][REGION]
+    assert (summary["usable_ips"], summary["used_ips"]) == (single["usable_ips"], single["used_ips"])
+    assert summary["rebuilt"] is False
+    assert [s["subnet_id"] for s in merged["subnets"]] == [s["subnet_id"] for s in single["subnets"]]
+
+
+def test_tools_use_the_cached_graph_until_invalidated(fake_aws, account):
+    instance = next(i for i in account.instances if i["State"]["Name"] == "running")
+    first = topology_neighbors(resource_id=instance["InstanceId"], region=REGION, refresh=True)
+    assert first["rebuilt"] is True
+    assert {n["id"] for n in first["neighbors"]} >= {instance["SubnetId"], instance["VpcId"]}
+
+    members = topology_members(container_id=instance["SubnetId"], resource_types=["instance"], region=REGION, max_results=1000)
+    assert members["rebuilt"] is False
+    assert instance["InstanceId"] in [m["id"] for m in members["members"]]
+
+    inventory_cache.invalidate(REGION, "subnets", [instance["SubnetId"]])
+    again = topology_neighbors(resource_id=instance["InstanceId"], region=REGION)
+    assert again["rebuilt"] is True
+
+
+def test_unknown_ids_and_types_are_errors(fake_aws):
+    assert "not in the topology" in topology_neighbors(resource_id="i-missing", region=REGION)["error"]
+    assert "Unknown resource types" in topology_members(container_id="vpc-1", resource_types=["bucket"], region=REGION)["error"]